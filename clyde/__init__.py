@@ -7,7 +7,7 @@ https://github.com/EthanC/Clyde
 from msgspec import UNSET, UnsetType
 
 from clyde.attachment import Attachment
-from clyde.component import Component
+from clyde.component import Component, ComponentTree
 from clyde.embed import (
     Embed,
     EmbedAuthor,
@@ -16,8 +16,21 @@ from clyde.embed import (
     EmbedImage,
     EmbedThumbnail,
 )
-from clyde.markdown import Markdown
+from clyde.fragment import Fragment, Measurement
+from clyde.gallery import Gallery
+from clyde.handler import WebhookHandler
+from clyde.hooks import HookEvent, Hooks
+from clyde.live import LiveMessage
+from clyde.log import Log
+from clyde.markdown import Markdown, MarkdownBuilder
+from clyde.metrics import Metrics
+from clyde.packer import Packer
 from clyde.poll import Poll, PollAnswer, PollMediaAnswer, PollMediaQuestion
+from clyde.preflight import Preflight, PreflightError
+from clyde.profiler import PayloadNode, PayloadProfile, Profiler
+from clyde.result import Result, Timing
+from clyde.suppression import Suppressor
+from clyde.table import Table
 from clyde.timestamp import Timestamp, TimestampStyles
 from clyde.webhook import (
     AllowedMentions,
@@ -31,21 +44,42 @@ __all__: list[str] = [
     "UnsetType",
     "Attachment",
     "Component",
+    "ComponentTree",
     "Embed",
     "EmbedAuthor",
     "EmbedField",
     "EmbedFooter",
     "EmbedImage",
     "EmbedThumbnail",
+    "Fragment",
+    "Gallery",
+    "HookEvent",
+    "Hooks",
+    "LiveMessage",
+    "Log",
     "Markdown",
+    "MarkdownBuilder",
+    "Measurement",
+    "Metrics",
+    "Packer",
+    "PayloadNode",
+    "PayloadProfile",
     "Poll",
     "PollAnswer",
     "PollMediaAnswer",
     "PollMediaQuestion",
+    "Preflight",
+    "PreflightError",
+    "Profiler",
+    "Result",
+    "Suppressor",
+    "Table",
     "Timestamp",
+    "Timing",
     "TimestampStyles",
     "TopLevelComponent",
     "AllowedMentions",
     "AllowedMentionTypes",
     "Webhook",
+    "WebhookHandler",
 ]
@@ -1,7 +1,7 @@
 """Define the Attachment class and its associates."""
 
 from pathlib import Path
-from typing import Final, Self
+from typing import Final, Iterator, Self
 
 import msgspec
 from msgspec import UNSET, Struct, UnsetType
@@ -21,6 +21,9 @@ class Attachment(Struct, kw_only=True):
         content (bytes): Binary content of the file attached.
 
         spoiler (bool | None): Whether the Container should be a spoiler (blurred).
+
+        _path (Path | None): Reference to the file attached, which is read in place of
+            the content as the request is sent.
     """
 
     filename: UnsetType | str = msgspec.field(default=UNSET)
@@ -32,6 +35,9 @@ class Attachment(Struct, kw_only=True):
     spoiler: UnsetType | bool = msgspec.field(default=UNSET)
     """Whether the file should be a spoiler (blurred)."""
 
+    _path: Path | None = msgspec.field(default=None)
+    """Reference to the file attached, which is read as the request is sent."""
+
     def set_filename(self: Self, filename: str) -> "Attachment":
         """
         Set the filename of the file Attachment.
@@ -52,19 +58,80 @@ class Attachment(Struct, kw_only=True):
 
         Arguments:
             content (bytes | Path): Binary content of the file. If a Path is passed,
-                the referenced file will be read.
+                the referenced file is not read until the request is sent.
 
         Returns:
             self (Attachment): The modified Attachment instance.
         """
         if isinstance(content, Path):
-            with open(content, "rb") as handle:
-                content = handle.read()
-
-        self.content = content
+            self.content = UNSET
+            self._path = content
+        else:
+            self.content = content
+            self._path = None
 
         return self
 
+    def iter_content(
+        self: Self, chunk_size: int, size: int | None = None
+    ) -> Iterator[bytes]:
+        """
+        Iterate over the binary content of the file Attachment in chunks.
+
+        A referenced file is read one chunk at a time, so that it is never held in
+        memory in full. A ValueError is raised if the content is shorter than the size.
+
+        Arguments:
+            chunk_size (int): Maximum number of bytes in each chunk.
+
+            size (int | None): Number of bytes to produce, such as the size of the file
+                when a request declaring its length was built. Content which has grown
+                since is cut at the size. Defaults to all of the content.
+
+        Yields:
+            chunk (bytes): The next chunk of the content.
+        """
+        expected: int = self.get_size() if size is None else size
+        remaining: int = expected
+
+        if self._path is not None:
+            with open(self._path, "rb") as handle:
+                while remaining > 0:
+                    chunk: bytes = handle.read(min(chunk_size, remaining))
+
+                    if not chunk:
+                        break
+
+                    remaining -= len(chunk)
+
+                    yield chunk
+        elif isinstance(self.content, bytes):
+            end: int = min(len(self.content), expected)
+
+            for start in range(0, end, chunk_size):
+                yield self.content[start : min(start + chunk_size, end)]
+
+            remaining -= end
+
+        if remaining > 0:
+            raise ValueError(
+                f"Attachment {self.filename} shrank to {expected - remaining:,} bytes after its size of {expected:,} bytes was read"
+            )
+
+    def get_size(self: Self) -> int:
+        """
+        Return the number of bytes in the file Attachment, without reading it.
+
+        Returns:
+            size (int): Size of the file, or 0 if the content is unset.
+        """
+        if self._path is not None:
+            return self._path.stat().st_size
+        elif isinstance(self.content, bytes):
+            return len(self.content)
+
+        return 0
+
     def set_spoiler(self: Self, spoiler: bool) -> "Attachment":
         """
         Toggle whether the file Attachment is a spoiler.
@@ -1,9 +1,15 @@
 """Define the Component class and its associates."""
 
 from enum import IntEnum
+from typing import Any, Final, Iterable, Iterator, Union
 
 import msgspec
-from msgspec import Struct
+from msgspec import Raw, Struct
+
+from clyde.fragment import Fragment, Measurement
+
+ATTACHMENT_SCHEME: Final[str] = "attachment://"
+"""Prefix of a URL which references a file Attachment by its filename."""
 
 
 class ComponentTypes(IntEnum):
@@ -75,3 +81,150 @@ class Component(Struct, kw_only=True, tag_field="_type"):
 
     type: ComponentTypes = msgspec.field()
     """The type of the Component."""
+
+    @staticmethod
+    def walk(
+        components: Iterable[Struct | Raw], thaw: bool = True
+    ) -> Iterator[Struct | Raw]:
+        """
+        Iterate over every Component in a tree of Components, depth-first and in order.
+
+        The tree is walked with an explicit stack rather than by recursion. Structs
+        nested within a Component, such as Media Gallery Items and Unfurled Media Items,
+        are also yielded, as are the Components that fragments were frozen from.
+
+        Arguments:
+            components (Iterable[Struct | Raw]): The top-level Components to walk.
+
+            thaw (bool): Whether to walk the Components that fragments were frozen
+                from. If False, each fragment is yielded as-is and not walked.
+
+        Yields:
+            node (Struct | Raw): Each Component or nested Struct, parents before
+                children, or a fragment if thaw is False.
+        """
+        pending: list[Struct | Raw] = Component._get_structs(components, thaw)
+
+        pending.reverse()
+
+        while pending:
+            node: Struct | Raw = pending.pop()
+            children: list[Struct | Raw] = []
+
+            yield node
+
+            if isinstance(node, Raw):
+                continue
+
+            for name in node.__struct_fields__:
+                value: Any = getattr(node, name)
+
+                if isinstance(value, Struct | Raw):
+                    children.extend(Component._get_structs([value], thaw))
+                elif isinstance(value, list):
+                    children.extend(Component._get_structs(value, thaw))
+
+            # Reversed so that children are visited in order
+            children.reverse()
+            pending.extend(children)
+
+    @staticmethod
+    def summarize(components: Iterable[Struct | Raw]) -> "ComponentTree":
+        """
+        Measure a tree of Components against the Discord limits in a single pass.
+
+        Fragments are counted from the Measurement taken when they were frozen, rather
+        than decoded.
+
+        Arguments:
+            components (Iterable[Struct | Raw]): The top-level Components to measure.
+
+        Returns:
+            tree (ComponentTree): The number of Components, combined Text Display
+                length, and referenced Attachment filenames.
+        """
+        tree: ComponentTree = ComponentTree()
+
+        for node in Component.walk(components, thaw=False):
+            if isinstance(node, Raw):
+                measurement: Measurement | ComponentTree | None = (
+                    Fragment.get_measurement(node, Component._get_union())
+                )
+
+                if measurement is None:
+                    measurement = Component.summarize(Component._get_structs([node]))
+
+                tree.count += measurement.count
+                tree.text_length += measurement.text_length
+                tree.attachments.extend(measurement.attachments)
+
+                continue
+            elif isinstance(node, Component):
+                tree.count += 1
+
+                if node.type == ComponentTypes.TEXT_DISPLAY:
+                    tree.text_length += len(getattr(node, "content"))
+
+                continue
+
+            url: Any = getattr(node, "url", None)
+
+            if isinstance(url, str) and url.startswith(ATTACHMENT_SCHEME):
+                tree.attachments.append(url[len(ATTACHMENT_SCHEME) :])
+
+        return tree
+
+    @staticmethod
+    def _get_union() -> Any:
+        """Return the union of every Component type, as which fragments are thawed."""
+        types: list[type[Component]] = []
+        pending: list[type[Component]] = [Component]
+
+        while pending:
+            subclasses: list[type[Component]] = pending.pop().__subclasses__()
+
+            types.extend(subclasses)
+            pending.extend(subclasses)
+
+        return Union[tuple(types)]
+
+    @staticmethod
+    def _get_structs(values: Iterable[Any], thaw: bool = True) -> list[Struct | Raw]:
+        """Return the Structs among the values, with fragments thawed unless not to."""
+        structs: list[Struct | Raw] = []
+
+        for value in values:
+            if isinstance(value, Raw):
+                if not thaw:
+                    structs.append(value)
+
+                    continue
+
+                value = Fragment.thaw(value, Component._get_union())
+
+            if isinstance(value, Struct):
+                structs.append(value)
+
+        return structs
+
+
+class ComponentTree(Struct, kw_only=True):
+    """
+    Represent the measurements of a tree of Components.
+
+    Attributes:
+        count (int): Number of Components, including nested Components.
+
+        text_length (int): Combined length of all Text Display content.
+
+        attachments (list[str]): Filenames referenced by attachment:// URLs, in order.
+    """
+
+    count: int = msgspec.field(default=0)
+    """Number of Components, including nested Components."""
+
+    text_length: int = msgspec.field(default=0)
+    """Combined length of all Text Display content."""
+
+    attachments: list[str] = msgspec.field(default_factory=list)
+    """Filenames referenced by attachment:// URLs, in order."""
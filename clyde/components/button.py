@@ -7,6 +7,7 @@ import msgspec
 from msgspec import Meta
 
 from clyde.component import Component, ComponentTypes
+from clyde.validation import Validation
 
 
 class ButtonStyles(IntEnum):
@@ -85,16 +86,22 @@ class LinkButton(Button, kw_only=True):
     url: str = msgspec.field()
     """URL for link-style Buttons."""
 
-    def set_label(self: Self, label: str) -> "LinkButton":
+    def set_label(self: Self, label: str, truncate: bool = False) -> "LinkButton":
         """
         Set the label of the Link Button.
 
         Arguments:
             label (str): Text that appears on the Button; max 80 characters.
 
+            truncate (bool): Truncate the label to the length limit without
+                breaking Markdown formatting.
+
         Returns:
             self (LinkButton): The modified Link Button instance.
         """
+        if truncate:
+            label = Validation.truncate(LinkButton, "label", label)
+
         self.label = label
 
         return self
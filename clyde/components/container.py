@@ -3,7 +3,7 @@
 from typing import Annotated, Self, TypeAlias
 
 import msgspec
-from msgspec import UNSET, Meta, UnsetType
+from msgspec import UNSET, Meta, Raw, UnsetType
 
 from clyde.component import Component, ComponentTypes
 from clyde.components.action_row import ActionRow
@@ -30,8 +30,9 @@ class Container(Component, kw_only=True, tag="Container"):
     Attributes:
         type (ComponentTypes): The value of ComponentTypes.CONTAINER.
 
-        components (list[ContainerComponent]): Components of the type Action Row,
-            Text Display, Section, Media Gallery, Separator, or File.
+        components (list[ContainerComponent | Raw]): Components of the type Action
+            Row, Text Display, Section, Media Gallery, Separator, or File, or
+            fragments of them.
 
         accent_color (str | int | None): Color for the accent on the Container.
 
@@ -41,7 +42,7 @@ class Container(Component, kw_only=True, tag="Container"):
     type: ComponentTypes = msgspec.field(default=ComponentTypes.CONTAINER)
     """The value of ComponentTypes.CONTAINER."""
 
-    components: Annotated[list[ContainerComponent], Meta(min_length=1)] = (
+    components: Annotated[list[ContainerComponent | Raw], Meta(min_length=1)] = (
         msgspec.field()
     )
     """Components of the type Action Row, Text Display, Section, Media Gallery, Separator, or File"""
@@ -53,20 +54,21 @@ class Container(Component, kw_only=True, tag="Container"):
     """Whether the Container should be a spoiler (blurred)."""
 
     def add_component(
-        self: Self, component: ContainerComponent | list[ContainerComponent]
+        self: Self, component: ContainerComponent | Raw | list[ContainerComponent | Raw]
     ) -> "Container":
         """
         Add one or more Components to the Container.
 
         Arguments:
-            component (ContainerComponent | list[ContainerComponent]): A Component or list
-                of Components to add to the Container. Components must be of the type
-                Action Row, Text Display, Section, Media Gallery, Separator, or File.
+            component (ContainerComponent | Raw | list[ContainerComponent | Raw]): A
+                Component or list of Components to add to the Container. Components
+                must be of the type Action Row, Text Display, Section, Media Gallery,
+                Separator, or File, or fragments of them.
 
         Returns:
             self (Container): The modified Container instance.
         """
-        if isinstance(component, ContainerComponent):
+        if isinstance(component, ContainerComponent | Raw):
             self.components.append(component)
         else:
             self.components.extend(component)
@@ -86,7 +88,7 @@ class Container(Component, kw_only=True, tag="Container"):
         Returns:
             self (Container): The modified Container instance.
         """
-        if isinstance(component, ContainerComponent):
+        if isinstance(component, ContainerComponent | Raw):
             self.components.remove(component)
         elif isinstance(component, int):
             self.components.pop(component)
@@ -2,10 +2,16 @@
 
 from datetime import UTC, datetime
 from enum import StrEnum
-from typing import Annotated, Final, Self
+from typing import Annotated, Any, Final, Iterable, Mapping, Self
 
 import msgspec
-from msgspec import UNSET, Meta, Struct, UnsetType
+from msgspec import UNSET, Meta, Raw, Struct, UnsetType
+
+from clyde.fragment import Fragment, Measurement
+from clyde.validation import Validation
+
+EMBED_TOTAL_LENGTH_MAX: Final[int] = 6000
+"""Maximum combined length of all Embed text on a single message."""
 
 
 class EmbedTypes(StrEnum):
@@ -40,16 +46,22 @@ class EmbedFooter(Struct, kw_only=True):
     icon_url: UnsetType | str = msgspec.field(default=UNSET)
     """URL of Footer icon (only supports HTTP(S) and Attachments)."""
 
-    def set_text(self: Self, text: str) -> "EmbedFooter":
+    def set_text(self: Self, text: str, truncate: bool = False) -> "EmbedFooter":
         """
         Set the text that will be displayed in the Embed Footer.
 
         Arguments:
             text (str): The text that will be displayed.
 
+            truncate (bool): Truncate the text to the length limit without
+                breaking Markdown formatting.
+
         Returns:
             self (EmbedFooter): The modified Embed Footer instance.
         """
+        if truncate:
+            text = Validation.truncate(EmbedFooter, "text", text)
+
         self.text = text
 
         return self
@@ -148,16 +160,22 @@ class EmbedAuthor(Struct, kw_only=True):
     icon_url: UnsetType | str = msgspec.field(default=UNSET)
     """URL of author icon (only supports HTTP(S) and Attachments)."""
 
-    def set_name(self: Self, name: str) -> "EmbedAuthor":
+    def set_name(self: Self, name: str, truncate: bool = False) -> "EmbedAuthor":
         """
         Set the name that will be displayed in the Embed Author.
 
         Arguments:
             name (str): The name that will be displayed.
 
+            truncate (bool): Truncate the name to the length limit without
+                breaking Markdown formatting.
+
         Returns:
             self (EmbedAuthor): The modified Embed Author instance.
         """
+        if truncate:
+            name = Validation.truncate(EmbedAuthor, "name", name)
+
         self.name = name
 
         return self
@@ -236,8 +254,48 @@ class EmbedField(Struct, kw_only=True):
     inline: UnsetType | bool = msgspec.field(default=UNSET)
     """Whether or not this field should display inline."""
 
+    def set_name(self: Self, name: str, truncate: bool = False) -> "EmbedField":
+        """
+        Set the name of the Embed Field.
+
+        Arguments:
+            name (str): The name of the field.
+
+            truncate (bool): Truncate the name to the length limit without
+                breaking Markdown formatting.
+
+        Returns:
+            self (EmbedField): The modified Embed Field instance.
+        """
+        if truncate:
+            name = Validation.truncate(EmbedField, "name", name)
+
+        self.name = name
+
+        return self
+
+    def set_value(self: Self, value: str, truncate: bool = False) -> "EmbedField":
+        """
+        Set the value of the Embed Field.
+
+        Arguments:
+            value (str): The value of the field.
 
-class Embed(Struct, kw_only=True):
+            truncate (bool): Truncate the value to the length limit without
+                breaking Markdown formatting.
+
+        Returns:
+            self (EmbedField): The modified Embed Field instance.
+        """
+        if truncate:
+            value = Validation.truncate(EmbedField, "value", value)
+
+        self.value = value
+
+        return self
+
+
+class Embed(Struct, kw_only=True, dict=True):
     """
     Represent a Discord Embed of the Rich type.
 
@@ -256,13 +314,13 @@ class Embed(Struct, kw_only=True):
 
         color (UnsetType | str | int): Color code of the Embed.
 
-        footer (UnsetType | EmbedFooter): Footer information.
+        footer (UnsetType | EmbedFooter | Raw): Footer information, or a fragment.
 
         image (UnsetType | EmbedImage): Image information.
 
         thumbnail (UnsetType | EmbedThumbnail): Thumbnail information.
 
-        author (UnsetType | EmbedAuthor): Author information.
+        author (UnsetType | EmbedAuthor | Raw): Author information, or a fragment.
 
         fields (UnsetType | list[EmbedField]): Fields information, max of 25.
     """
@@ -289,7 +347,7 @@ class Embed(Struct, kw_only=True):
     color: UnsetType | str | int = msgspec.field(default=UNSET)
     """Color code of the Embed."""
 
-    footer: UnsetType | EmbedFooter = msgspec.field(default=UNSET)
+    footer: UnsetType | EmbedFooter | Raw = msgspec.field(default=UNSET)
     """Footer information."""
 
     image: UnsetType | EmbedImage = msgspec.field(default=UNSET)
@@ -298,7 +356,7 @@ class Embed(Struct, kw_only=True):
     thumbnail: UnsetType | EmbedThumbnail = msgspec.field(default=UNSET)
     """Thumbnail information."""
 
-    author: UnsetType | EmbedAuthor = msgspec.field(default=UNSET)
+    author: UnsetType | EmbedAuthor | Raw = msgspec.field(default=UNSET)
     """Author information."""
 
     fields: (
@@ -306,16 +364,142 @@ class Embed(Struct, kw_only=True):
     ) = msgspec.field(default=UNSET)
     """Fields information, max of 25."""
 
-    def set_title(self: Self, title: str) -> "Embed":
+    def __post_init__(self: Self) -> None:
+        """Count the characters of the Embed towards the Embed length limit."""
+        self.refresh_length()
+
+    @staticmethod
+    def from_records(
+        records: Iterable[Any], spec: Mapping[str, str], inline: bool | None = None
+    ) -> list["Embed"]:
+        """
+        Create an Embed from each of the provided records.
+
+        The Embeds are created and validated together by a single msgspec conversion,
+        rather than by calling each setter per record.
+
+        Arguments:
+            records (Iterable[Any]): Mappings, dataclasses, or other objects with the
+                attributes referenced by the spec.
+
+            spec (Mapping[str, str]): Map of an Embed attribute to the record key or
+                attribute to read it from. Nested attributes use a dot, such as
+                footer.text or author.name. A key of fields.<name> adds an Embed Field
+                with that name. Empty (None) record values are skipped.
+
+            inline (bool | None): Whether or not the Embed Fields should display inline.
+
+        Returns:
+            embeds (list[Embed]): An Embed for each record, in order.
+        """
+        targets: list[tuple[str, str, str]] = []
+
+        for target, key in spec.items():
+            parent, _, child = target.partition(".")
+
+            targets.append((parent, child, key))
+
+        data: list[dict[str, Any]] = []
+        is_mapping: dict[type, bool] = {}
+
+        for record in records:
+            # Checking against the Mapping ABC is slow, so cache it per record type
+            mapping: bool | None = is_mapping.get(type(record))
+
+            if mapping is None:
+                mapping = is_mapping[type(record)] = isinstance(record, Mapping)
+
+            entry: dict[str, Any] = {}
+
+            for parent, child, key in targets:
+                value: Any = record.get(key) if mapping else getattr(record, key, None)
+
+                if value is None:
+                    continue
+                elif parent == "fields":
+                    field: dict[str, Any] = {"name": child, "value": str(value)}
+
+                    if inline is not None:
+                        field["inline"] = inline
+
+                    entry.setdefault(parent, []).append(field)
+                elif child:
+                    entry.setdefault(parent, {})[child] = value
+                elif parent == "timestamp":
+                    entry[parent] = Validation.convert_timestamp(value)
+                else:
+                    entry[parent] = value
+
+            data.append(entry)
+
+        return msgspec.convert(data, list[Embed], strict=False)
+
+    def get_length(self: Self) -> int:
+        """
+        Return the number of characters counted towards the Embed length limit.
+
+        The count is kept up to date by the Embed setters and add/remove methods. If
+        the Embed, or a Footer, Author, or Field it contains, is modified directly,
+        call refresh_length to recount it.
+
+        Returns:
+            length (int): Combined length of the title, description, Footer text,
+                Author name, and Field names and values.
+        """
+        if "_length" not in self.__dict__:
+            return self.refresh_length()
+
+        return self._length
+
+    def get_remaining_length(self: Self) -> int:
+        """
+        Return the number of characters that can be added before the Embed length limit.
+
+        Returns:
+            remaining (int): Characters remaining, negative if the limit is exceeded.
+        """
+        return EMBED_TOTAL_LENGTH_MAX - self.get_length()
+
+    def refresh_length(self: Self) -> int:
+        """
+        Recount the characters of the Embed towards the Embed length limit.
+
+        Returns:
+            length (int): Combined length of the title, description, Footer text,
+                Author name, and Field names and values.
+        """
+        length: int = (
+            Embed._count(self.title)
+            + Embed._count(self.description)
+            + Embed._count(self.footer, EmbedFooter)
+            + Embed._count(self.author, EmbedAuthor)
+        )
+
+        if isinstance(self.fields, list):
+            for field in self.fields:
+                length += Embed._count(field)
+
+        self._length: int = length
+
+        return length
+
+    def set_title(self: Self, title: str, truncate: bool = False) -> "Embed":
         """
         Set the title of the Embed.
 
         Arguments:
             title (str): Title of Embed.
 
+            truncate (bool): Truncate the title to the length limit without
+                breaking Markdown formatting.
+
         Returns:
             self (Embed): The modified Embed instance.
         """
+        if truncate:
+            title = Validation.truncate(Embed, "title", title)
+
+        self._adjust_length(self.title, title)
         self.title = title
 
         return self
@@ -327,20 +511,30 @@ class Embed(Struct, kw_only=True):
         Returns:
             self (Embed): The modified Embed instance.
         """
+        self._adjust_length(self.title, UNSET)
         self.title = UNSET
 
         return self
 
-    def set_description(self: Self, description: str) -> "Embed":
+    def set_description(
+        self: Self, description: str, truncate: bool = False
+    ) -> "Embed":
         """
         Set the description of the Embed.
 
         Arguments:
             description (str): Description of Embed.
 
+            truncate (bool): Truncate the description to the length limit without
+                breaking Markdown formatting.
+
         Returns:
             self (Embed): The modified Embed instance.
         """
+        if truncate:
+            description = Validation.truncate(Embed, "description", description)
+
+        self._adjust_length(self.description, description)
         self.description = description
 
         return self
@@ -352,6 +546,7 @@ class Embed(Struct, kw_only=True):
         Returns:
             self (Embed): The modified Embed instance.
         """
+        self._adjust_length(self.description, UNSET)
         self.description = UNSET
 
         return self
@@ -436,16 +631,17 @@ class Embed(Struct, kw_only=True):
 
         return self
 
-    def set_footer(self: Self, footer: EmbedFooter) -> "Embed":
+    def set_footer(self: Self, footer: EmbedFooter | Raw) -> "Embed":
         """
         Set the footer of the Embed.
 
         Arguments:
-            footer (EmbedFooter): An Embed Footer.
+            footer (EmbedFooter | Raw): An Embed Footer, or a fragment of one.
 
         Returns:
             self (Embed): The modified Embed instance.
         """
+        self._adjust_length(self.footer, footer, EmbedFooter)
         self.footer = footer
 
         return self
@@ -457,6 +653,7 @@ class Embed(Struct, kw_only=True):
         Returns:
             self (Embed): The modified Embed instance.
         """
+        self._adjust_length(self.footer, UNSET, EmbedFooter)
         self.footer = UNSET
 
         return self
@@ -511,16 +708,17 @@ class Embed(Struct, kw_only=True):
 
         return self
 
-    def set_author(self: Self, author: EmbedAuthor) -> "Embed":
+    def set_author(self: Self, author: EmbedAuthor | Raw) -> "Embed":
         """
         Set the author information of the Embed.
 
         Arguments:
-            author (EmbedAuthor): Author information.
+            author (EmbedAuthor | Raw): Author information, or a fragment of it.
 
         Returns:
             self (Embed): The modified Embed instance.
         """
+        self._adjust_length(self.author, author, EmbedAuthor)
         self.author = author
 
         return self
@@ -532,6 +730,7 @@ class Embed(Struct, kw_only=True):
         Returns:
             self (Embed): The modified Embed instance.
         """
+        self._adjust_length(self.author, UNSET, EmbedAuthor)
         self.author = UNSET
 
         return self
@@ -551,8 +750,12 @@ class Embed(Struct, kw_only=True):
             self.fields = []
 
         if isinstance(field, EmbedField):
+            self._adjust_length(UNSET, field)
             self.fields.append(field)
         else:
+            for entry in field:
+                self._adjust_length(UNSET, entry)
+
             self.fields.extend(field)
 
         return self
@@ -571,13 +774,62 @@ class Embed(Struct, kw_only=True):
         if isinstance(self.fields, list):
             if isinstance(field, EmbedField):
                 self.fields.remove(field)
+                self._adjust_length(field, UNSET)
             elif isinstance(field, int):
-                self.fields.pop(field)
+                self._adjust_length(self.fields.pop(field), UNSET)
             else:
-                self.fields = [entry for entry in self.fields if entry not in field]
+                retained: list[EmbedField] = []
+
+                for entry in self.fields:
+                    if entry in field:
+                        self._adjust_length(entry, UNSET)
+                    else:
+                        retained.append(entry)
+
+                self.fields = retained
 
             # Do not retain an empty list
             if len(self.fields) == 0:
                 self.fields = UNSET
 
         return self
+
+    def _adjust_length(
+        self: Self,
+        previous: UnsetType | str | EmbedFooter | EmbedAuthor | EmbedField | Raw,
+        value: UnsetType | str | EmbedFooter | EmbedAuthor | EmbedField | Raw,
+        kind: Any = None,
+    ) -> None:
+        """Update the Embed length count when a value is replaced."""
+        self._length = (
+            self.get_length() + Embed._count(value, kind) - Embed._count(previous, kind)
+        )
+
+    @staticmethod
+    def _count(
+        value: UnsetType | str | EmbedFooter | EmbedAuthor | EmbedField | Raw | None,
+        kind: Any = None,
+    ) -> int:
+        """Return the number of characters a value counts towards the Embed length limit."""
+        if isinstance(value, Raw):
+            if kind is None:
+                return 0
+
+            # A fragment was measured when it was frozen, so it is only decoded if not
+            measurement: Measurement | None = Fragment.get_measurement(value, kind)
+
+            if measurement is not None:
+                return measurement.length
+
+            value = Fragment.thaw(value, kind)
+
+        if isinstance(value, str):
+            return len(value)
+        elif isinstance(value, EmbedFooter):
+            return len(value.text)
+        elif isinstance(value, EmbedAuthor):
+            return len(value.name)
+        elif isinstance(value, EmbedField):
+            return len(value.name) + len(value.value)
+
+        return 0
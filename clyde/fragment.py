@@ -0,0 +1,199 @@
+"""Define the Fragment class and its associates."""
+
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Final, get_args
+
+import msgspec
+from msgspec import UNSET, Raw, Struct
+
+from clyde.validation import Validation
+
+COLOR_FIELDS: Final[tuple[str, ...]] = ("color", "accent_color")
+"""Names of the Struct Fields which hold a color to convert before encoding."""
+
+MEASUREMENTS_MAX: Final[int] = 1024
+"""Number of fragments whose measurements are retained, oldest first out."""
+
+
+class Measurement(Struct, kw_only=True):
+    """
+    Represent the measurements of a fragment, taken once rather than on every send.
+
+    Attributes:
+        kind (type): The Struct type the fragment was frozen from.
+
+        length (int): Number of characters counted towards the Embed length limit.
+
+        count (int): Number of Components, including nested Components.
+
+        text_length (int): Combined length of all Text Display content.
+
+        attachments (list[str]): Filenames referenced by attachment:// URLs, in order.
+
+        violations (list[str]): Every Discord limit violated within the fragment, each
+            relative to the Field which holds it.
+    """
+
+    kind: type = msgspec.field()
+    """The Struct type the fragment was frozen from."""
+
+    length: int = msgspec.field(default=0)
+    """Number of characters counted towards the Embed length limit."""
+
+    count: int = msgspec.field(default=0)
+    """Number of Components, including nested Components."""
+
+    text_length: int = msgspec.field(default=0)
+    """Combined length of all Text Display content."""
+
+    attachments: list[str] = msgspec.field(default_factory=list)
+    """Filenames referenced by attachment:// URLs, in order."""
+
+    violations: list[str] = msgspec.field(default_factory=list)
+    """Every Discord limit violated within the fragment, relative to its Field."""
+
+
+_MEASUREMENTS: dict[bytes, Measurement] = {}
+"""Measurements of the most recently measured fragments, keyed by their encoded bytes."""
+
+_LOCK: Lock = Lock()
+"""Lock which guards the eviction of retained measurements."""
+
+
+class Fragment:
+    """
+    Define static methods for freezing Structs into pre-encoded, immutable fragments.
+
+    A fragment is a msgspec Raw value which is encoded once and spliced into every
+    payload as-is. Fragments may be used in place of an Embed Footer or Embed Author on
+    an Embed, an Embed on a Webhook, or a Component on a Webhook or Container.
+
+    A fragment does not record the type it was frozen from. Instead, it is thawed as the
+    type of the Field which holds it. A fragment is measured against the Discord limits
+    once, when it is frozen, and the Measurement is retained by its encoded bytes for a
+    bounded number of fragments, so that it is not decoded again on every send.
+    """
+
+    @staticmethod
+    def freeze(value: Struct) -> Raw:
+        """
+        Encode the provided Struct into a pre-encoded fragment.
+
+        Colors and timestamps are converted before encoding, and the Struct is measured
+        against the Discord limits. Later changes to the Struct are not reflected in the
+        fragment.
+
+        Arguments:
+            value (Struct): A msgspec Struct, such as an Embed Footer, Embed Author, or
+                Component.
+
+        Returns:
+            fragment (Raw): The encoded Struct.
+        """
+        changes: dict[str, Any] = {}
+
+        for name in COLOR_FIELDS:
+            color: Any = getattr(value, name, UNSET)
+
+            if color is not UNSET:
+                changes[name] = Validation.convert_color(color)
+
+        timestamp: Any = getattr(value, "timestamp", UNSET)
+
+        if timestamp is not UNSET:
+            changes["timestamp"] = Validation.convert_timestamp(timestamp)
+
+        if changes:
+            value = msgspec.structs.replace(value, **changes)
+
+        # Imported here, as Preflight measures the Structs that fragments are frozen from
+        from clyde.preflight import Preflight
+
+        fragment: Raw = Raw(msgspec.json.encode(value))
+
+        Fragment.set_measurement(fragment, Preflight.measure(value))
+
+        return fragment
+
+    @staticmethod
+    def thaw(fragment: Raw, kind: Any) -> Struct | None:
+        """
+        Return a copy of the Struct a fragment was frozen from.
+
+        The fragment is decoded anew on every call, so the copy may be modified without
+        affecting the fragment or other copies. It is used to measure fragments which
+        were not measured when frozen, such as those which have since been evicted.
+
+        Arguments:
+            fragment (Raw): A fragment returned by freeze.
+
+            kind (Any): The Struct type to decode the fragment as, or a union of tagged
+                Struct types, such as the type of the Field which holds it.
+
+        Returns:
+            value (Struct | None): The decoded Struct, or None if the fragment does not
+                decode as the type.
+        """
+        try:
+            return Fragment._get_decoder(kind).decode(fragment)
+        except msgspec.DecodeError:
+            return
+
+    @staticmethod
+    def get_measurement(fragment: Raw, kind: Any) -> Measurement | None:
+        """
+        Return the retained Measurement of a fragment, if it was frozen as the type.
+
+        Arguments:
+            fragment (Raw): A fragment returned by freeze.
+
+            kind (Any): The Struct type the fragment is expected to be, or a union of
+                Struct types, such as the type of the Field which holds it.
+
+        Returns:
+            measurement (Measurement | None): The Measurement of the fragment, or None
+                if it was not retained or was frozen from another type.
+        """
+        measurement: Measurement | None = _MEASUREMENTS.get(bytes(fragment))
+
+        if measurement is None:
+            return
+        elif (measurement.kind is not kind) and (
+            measurement.kind not in Fragment._get_kinds(kind)
+        ):
+            return
+
+        return measurement
+
+    @staticmethod
+    def set_measurement(fragment: Raw, measurement: Measurement) -> None:
+        """
+        Retain the Measurement of a fragment, evicting the oldest.
+
+        Arguments:
+            fragment (Raw): A fragment returned by freeze.
+
+            measurement (Measurement): The Measurement of the fragment.
+        """
+        key: bytes = bytes(fragment)
+
+        with _LOCK:
+            # Reinserted so that the most recently measured fragments are evicted last
+            _MEASUREMENTS.pop(key, None)
+            _MEASUREMENTS[key] = measurement
+
+            while len(_MEASUREMENTS) > MEASUREMENTS_MAX:
+                del _MEASUREMENTS[next(iter(_MEASUREMENTS))]
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_kinds(kind: Any) -> frozenset[Any]:
+        """Return the Struct types of a type, or of each member of a union."""
+        return frozenset(get_args(kind) or (kind,))
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_decoder(kind: Any) -> msgspec.json.Decoder[Any]:
+        """Return a JSON decoder for a type, which is costly to create for a union."""
+        return msgspec.json.Decoder(kind)
@@ -0,0 +1,154 @@
+"""Define the Gallery class and its associates."""
+
+import heapq
+from typing import Final, Iterable
+
+import msgspec
+from msgspec import UNSET
+
+from clyde.attachment import Attachment
+from clyde.component import ATTACHMENT_SCHEME, Component
+from clyde.components.container import Container
+from clyde.components.media_gallery import MediaGallery, MediaGalleryItem
+from clyde.components.unfurled_media_item import UnfurledMediaItem
+from clyde.preflight import ATTACHMENTS_MAX, COMPONENTS_TOTAL_MAX
+from clyde.webhook import Webhook
+
+MEDIA_GALLERY_ITEMS_MAX: Final[int] = 10
+"""Maximum number of Media Gallery Items on a single Media Gallery."""
+
+
+class Gallery:
+    """
+    Define static methods for laying out large sets of media across Webhook messages.
+
+    Media is chunked into Media Galleries of up to 10 items, each wrapped in its own
+    Container, and split across as few messages as the Component and Attachment limits
+    allow.
+    """
+
+    @staticmethod
+    def layout(
+        webhook: Webhook,
+        media: Iterable[str | Attachment | MediaGalleryItem],
+        container: Container | None = None,
+    ) -> list[Webhook]:
+        """
+        Lay out the provided media as Media Galleries across one or more Webhook messages.
+
+        The Components and Attachments already on the Webhook are kept on the first
+        message. File Attachments are scheduled largest first onto the message with the
+        fewest bytes to upload, so that the largest files are spread across requests.
+        Media keeps its relative order within each message.
+
+        Arguments:
+            webhook (Webhook): The Webhook each message is copied from.
+
+            media (Iterable[str | Attachment | MediaGalleryItem]): URLs, file
+                Attachments, or Media Gallery Items to display, in order.
+
+            container (Container | None): The Container each Media Gallery is wrapped
+                in, such as to set an accent color. Its Components are replaced.
+
+        Returns:
+            webhooks (list[Webhook]): A Webhook for each message, in order.
+        """
+        items: list[MediaGalleryItem] = []
+        attachments: dict[int, Attachment] = {}
+
+        for entry in media:
+            if isinstance(entry, Attachment):
+                attachments[len(items)] = entry
+                entry = f"{ATTACHMENT_SCHEME}{entry.filename}"
+
+            if isinstance(entry, str):
+                entry = MediaGalleryItem(media=UnfurledMediaItem(url=entry))
+
+            items.append(entry)
+
+        existing: int = (
+            Component.summarize(webhook.components).count
+            if isinstance(webhook.components, list)
+            else 0
+        )
+        # Each Media Gallery and the Container wrapping it count as two Components
+        capacity: list[int] = [
+            max(COMPONENTS_TOTAL_MAX - existing, 0) // 2 * MEDIA_GALLERY_ITEMS_MAX
+        ]
+        slots: list[int] = [ATTACHMENTS_MAX - len(webhook._attachments)]
+
+        # A file Attachment requires both an Attachment slot and room for an item
+        while (sum(capacity) < len(items)) or (
+            sum(max(min(slot, room), 0) for slot, room in zip(slots, capacity))
+            < len(attachments)
+        ):
+            capacity.append(COMPONENTS_TOTAL_MAX // 2 * MEDIA_GALLERY_ITEMS_MAX)
+            slots.append(ATTACHMENTS_MAX)
+
+        pages: list[list[int]] = [[] for _ in capacity]
+        loads: list[tuple[int, int]] = [
+            (0, idx)
+            for idx in range(len(pages))
+            if (slots[idx] > 0) and (capacity[idx] > 0)
+        ]
+
+        # Schedule the largest file Attachments first, each to the lightest message
+        for idx in sorted(
+            attachments, key=lambda idx: attachments[idx].get_size(), reverse=True
+        ):
+            load, target = heapq.heappop(loads)
+
+            # A message without room is not pushed back onto the heap
+            while (slots[target] <= 0) or (capacity[target] <= 0):
+                load, target = heapq.heappop(loads)
+
+            pages[target].append(idx)
+            slots[target] -= 1
+            capacity[target] -= 1
+
+            heapq.heappush(loads, (load + attachments[idx].get_size(), target))
+
+        page_idx: int = 0
+
+        for idx in range(len(items)):
+            if idx in attachments:
+                continue
+
+            while capacity[page_idx] <= 0:
+                page_idx += 1
+
+            pages[page_idx].append(idx)
+            capacity[page_idx] -= 1
+
+        webhooks: list[Webhook] = []
+
+        for page_idx, page in enumerate(pages):
+            page.sort()
+
+            message: Webhook = msgspec.structs.replace(
+                webhook,
+                components=list(webhook.components)
+                if (page_idx == 0) and isinstance(webhook.components, list)
+                else UNSET,
+                _attachments=list(webhook._attachments) if page_idx == 0 else [],
+                _query_params=dict(webhook._query_params),
+            )
+
+            for start in range(0, len(page), MEDIA_GALLERY_ITEMS_MAX):
+                chunk: list[int] = page[start : start + MEDIA_GALLERY_ITEMS_MAX]
+                gallery: MediaGallery = MediaGallery(
+                    items=[items[idx] for idx in chunk]
+                )
+
+                message.add_component(
+                    msgspec.structs.replace(container, components=[gallery])
+                    if container is not None
+                    else Container(components=[gallery])
+                )
+                message._attachments.extend(
+                    attachments[idx] for idx in chunk if idx in attachments
+                )
+
+            webhooks.append(message)
+
+        return webhooks
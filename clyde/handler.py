@@ -0,0 +1,343 @@
+"""Define the WebhookHandler class and its associates."""
+
+import copy
+import logging
+from datetime import UTC, datetime
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Thread, current_thread
+from time import monotonic, time
+from typing import Any, Final, Self
+
+import msgspec
+
+from clyde.embed import EMBED_TOTAL_LENGTH_MAX, Embed, EmbedFooter
+from clyde.hooks import Hooks
+from clyde.log import LOGGER
+from clyde.markdown import Markdown
+from clyde.packer import WEBHOOK_EMBEDS_MAX, Packer
+from clyde.pagination import CODE_FENCE, Pagination
+from clyde.suppression import Suppressor
+from clyde.validation import Validation
+from clyde.webhook import Webhook
+
+LEVEL_COLORS: Final[dict[int, int]] = {
+    logging.DEBUG: 0x95A5A6,
+    logging.INFO: 0x3498DB,
+    logging.WARNING: 0xF1C40F,
+    logging.ERROR: 0xE74C3C,
+    logging.CRITICAL: 0x992D22,
+}
+"""Embed color of each logging level."""
+
+_STOP: Final[object] = object()
+"""Sentinel which stops the background thread of a Webhook Handler."""
+
+
+class WebhookHandler(logging.Handler):
+    """
+    Represent a logging Handler which sends log records to a Discord Webhook.
+
+    Records are formatted and enqueued without blocking the logging thread, so that
+    their arguments are rendered as they were when logged. A background thread
+    batches them into as few messages as the Discord limits allow, either as a code
+    block in the message content or as Embeds colored by level. A batch is sent once it
+    is full, or once its oldest record has waited for the interval. If the queue is
+    full, records are dropped and the number dropped is reported in the next message.
+    When suppression is enabled, repeats of a record within the window are counted
+    rather than sent, and summarized once the window ends.
+
+    Attributes:
+        webhook (Webhook): The Webhook each message is copied from.
+
+        embeds (bool): Send each record as an Embed rather than as a line of content.
+
+        interval (float): Maximum number of seconds a record waits to be sent.
+
+        highlight (str | None): The language for syntax highlighting of content.
+
+        suppressor (Suppressor | None): The stage which suppresses repeated records.
+    """
+
+    def __init__(
+        self: Self,
+        webhook: Webhook,
+        level: int | str = logging.NOTSET,
+        embeds: bool = False,
+        interval: float = 5.0,
+        capacity: int = 10_000,
+        highlight: str | None = None,
+        suppress: float | None = None,
+    ) -> None:
+        """
+        Initialize a Webhook Handler and start its background thread.
+
+        Arguments:
+            webhook (Webhook): The Webhook each message is copied from, such as to set
+                a username or avatar.
+
+            level (int | str): The minimum level of records to handle.
+
+            embeds (bool): Send each record as an Embed rather than as a line of
+                content.
+
+            interval (float): Maximum number of seconds a record waits to be sent.
+
+            capacity (int): Maximum number of records waiting to be sent.
+
+            highlight (str | None): The language for syntax highlighting of content.
+
+            suppress (float | None): Number of seconds repeats of a record are counted
+                for rather than sent. If None, repeats are not suppressed.
+        """
+        super().__init__(level)
+
+        self.webhook: Webhook = webhook
+        self.embeds: bool = embeds
+        self.interval: float = interval
+        self.highlight: str | None = highlight
+        self.suppressor: Suppressor | None = (
+            Suppressor(suppress) if suppress is not None else None
+        )
+
+        self._queue: Queue[Any] = Queue(maxsize=capacity)
+        self._dropped: int = 0
+        self._lock: Lock = Lock()
+        self._batch: list[Any] = []
+        self._length: int = 0
+        self._limit: int = Validation.get_max_length(Webhook, "content") or 2000
+        self._thread: Thread = Thread(
+            target=self._run, name="clyde-handler", daemon=True
+        )
+
+        self._thread.start()
+
+    def emit(self: Self, record: logging.LogRecord) -> None:
+        """
+        Enqueue a log record to be sent, without blocking.
+
+        Arguments:
+            record (LogRecord): The log record to send.
+        """
+        # Records logged while sending would otherwise be sent in turn
+        if current_thread() is self._thread:
+            return
+
+        try:
+            fingerprint: tuple[str, int, str] | None = (
+                Suppressor.get_fingerprint(record)
+                if self.suppressor is not None
+                else None
+            )
+
+            record = self.prepare(record)
+        except Exception:
+            self.handleError(record)
+
+            return
+
+        try:
+            self._queue.put_nowait((record, fingerprint))
+        except Full:
+            with self._lock:
+                self._dropped += 1
+
+    def prepare(self: Self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Return a copy of a log record with its message formatted, ready to be enqueued.
+
+        The arguments and exception information are discarded once formatted, so that
+        they are neither rendered later nor kept alive while the record waits.
+
+        Arguments:
+            record (LogRecord): The log record to prepare.
+
+        Returns:
+            record (LogRecord): The prepared copy of the log record.
+        """
+        text: str = self.format(record)
+
+        record = copy.copy(record)
+        record.message = text
+        record.msg = text
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        record.stack_info = None
+
+        return record
+
+    def flush(self: Self) -> None:
+        """Block until every record enqueued so far has been sent."""
+        if not self._thread.is_alive():
+            return
+
+        done: Event = Event()
+
+        self._queue.put(done)
+        done.wait()
+
+    def close(self: Self) -> None:
+        """Send any remaining records, then stop the background thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+        super().close()
+
+    def _run(self: Self) -> None:
+        """Batch enqueued records and send each batch when it is full or due."""
+        deadline: float | None = None
+
+        while True:
+            # Wake up at each interval while repeats wait to be summarized
+            if (
+                (deadline is None)
+                and (self.suppressor is not None)
+                and self.suppressor.is_pending()
+            ):
+                deadline = monotonic() + self.interval
+
+            try:
+                item: Any = self._queue.get(
+                    timeout=None if deadline is None else max(deadline - monotonic(), 0)
+                )
+            except Empty:
+                if self.suppressor is not None:
+                    for record in self.suppressor.expire():
+                        self._add(record)
+
+                self._send()
+
+                deadline = None
+
+                continue
+
+            if isinstance(item, tuple):
+                record, fingerprint = item
+
+                if Hooks.is_registered("on_queue"):
+                    Hooks.emit(
+                        "on_queue",
+                        method="POST",
+                        url=self.webhook.url,
+                        timestamp=monotonic(),
+                        elapsed=max(time() - record.created, 0.0),
+                        depth=self._queue.qsize(),
+                    )
+
+                if deadline is None:
+                    deadline = monotonic() + self.interval
+
+                if self.suppressor is None:
+                    self._add(record)
+
+                    continue
+
+                for record in self.suppressor.add(record, fingerprint):
+                    self._add(record)
+
+                continue
+
+            if self.suppressor is not None:
+                for record in self.suppressor.expire(force=item is _STOP):
+                    self._add(record)
+
+            self._send()
+
+            deadline = None
+
+            if isinstance(item, Event):
+                item.set()
+            elif item is _STOP:
+                return
+
+    def _add(self: Self, record: logging.LogRecord) -> None:
+        """Add a prepared log record to the batch, sending the batch first if full."""
+        # A code fence within a record would otherwise close the code block
+        text: str = record.getMessage().replace(CODE_FENCE, "`\u200b``")
+
+        if self.embeds:
+            embed: Embed = self._get_embed(record, text)
+
+            if (len(self._batch) == WEBHOOK_EMBEDS_MAX) or (
+                self._length + embed.get_length() > EMBED_TOTAL_LENGTH_MAX
+            ):
+                self._send()
+
+            self._batch.append(embed)
+            self._length += embed.get_length()
+
+            return
+
+        budget: int = self._limit - len(Markdown.code_block("\n", self.highlight))
+
+        if len(text) > budget:
+            text = text[: budget - 1] + "…"
+
+        if self._batch and (self._length + len(text) + 1 > budget):
+            self._send()
+
+        self._batch.append(text)
+        self._length += len(text) + 1
+
+    def _send(self: Self) -> None:
+        """Send the batch of log records, then start a new batch."""
+        with self._lock:
+            count: int = self._dropped
+            self._dropped = 0
+
+        if count:
+            dropped: str = f"{count:,} log record(s) dropped, queue was full"
+
+            if self.embeds:
+                self._batch.append(Embed(description=dropped))
+            else:
+                self._batch.append(dropped)
+
+        if not self._batch:
+            return
+
+        batch: list[Any] = self._batch
+        self._batch = []
+        self._length = 0
+
+        try:
+            if self.embeds:
+                pages: list[Webhook] = Packer.pack_embeds(self.webhook, batch)
+            else:
+                # The note of dropped records may push a full batch over the limit
+                pages = [
+                    msgspec.structs.replace(
+                        self.webhook,
+                        content=content,
+                        _query_params=dict(self.webhook._query_params),
+                    )
+                    for content in Pagination.split_content(
+                        Markdown.code_block("\n".join(batch), self.highlight),
+                        self._limit,
+                    )
+                ]
+
+            for page in pages:
+                page.execute()
+        except Exception as e:
+            LOGGER.error("Failed to send %s log record(s): %s", f"{len(batch):,}", e)
+
+    def _get_embed(self: Self, record: logging.LogRecord, text: str) -> Embed:
+        """Return a log record as an Embed colored by its level."""
+        max_len: int = Validation.get_max_length(Embed, "description") or 4096
+        color: int = LEVEL_COLORS[logging.DEBUG]
+
+        for level, level_color in LEVEL_COLORS.items():
+            if record.levelno >= level:
+                color = level_color
+
+        return Embed(
+            title=record.levelname,
+            description=Markdown.truncate(
+                Markdown.code_block(text, self.highlight), max_len
+            ),
+            color=color,
+            timestamp=datetime.fromtimestamp(record.created, UTC).isoformat(),
+            footer=EmbedFooter(text=record.name),
+        )
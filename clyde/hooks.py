@@ -0,0 +1,180 @@
+"""Define the Hooks class and its associates."""
+
+from typing import Any, Callable, Final, TypeAlias
+
+import msgspec
+from msgspec import Struct
+
+from clyde.log import LOGGER
+
+HOOK_EVENTS: Final[frozenset[str]] = frozenset(
+    {
+        "on_build",
+        "on_encode",
+        "on_send",
+        "on_response",
+        "on_ratelimit",
+        "on_retry",
+        "on_queue",
+    }
+)
+"""Names of the events a Hook may be registered for."""
+
+
+class HookEvent(Struct, kw_only=True):
+    """
+    Represent a stage in the lifecycle of a request sent by a Webhook.
+
+    Attributes:
+        name (str): Name of the event, such as on_send.
+
+        method (str): HTTP method of the request.
+
+        url (str): URL of the request.
+
+        timestamp (float): Monotonic time the event occurred, in seconds.
+
+        elapsed (float | None): Number of seconds the stage took, such as building the
+            payload, awaiting the Response, or waiting in a queue.
+
+        size (int | None): Number of bytes in the payload, including Attachments.
+
+        status (int | None): HTTP status code of the Response.
+
+        bucket (str | None): Rate limit bucket of the Response.
+
+        delay (float | None): Number of seconds slept due to a rate limit.
+
+        attempt (int): Number of times the request has been retried.
+
+        depth (int | None): Number of items waiting in the queue of a Webhook Handler.
+    """
+
+    name: str = msgspec.field()
+    """Name of the event, such as on_send."""
+
+    method: str = msgspec.field()
+    """HTTP method of the request."""
+
+    url: str = msgspec.field()
+    """URL of the request."""
+
+    timestamp: float = msgspec.field()
+    """Monotonic time the event occurred, in seconds."""
+
+    elapsed: float | None = msgspec.field(default=None)
+    """Number of seconds the stage took."""
+
+    size: int | None = msgspec.field(default=None)
+    """Number of bytes in the payload, including Attachments."""
+
+    status: int | None = msgspec.field(default=None)
+    """HTTP status code of the Response."""
+
+    bucket: str | None = msgspec.field(default=None)
+    """Rate limit bucket of the Response."""
+
+    delay: float | None = msgspec.field(default=None)
+    """Number of seconds slept due to a rate limit."""
+
+    attempt: int = msgspec.field(default=0)
+    """Number of times the request has been retried."""
+
+    depth: int | None = msgspec.field(default=None)
+    """Number of items waiting in the queue of a Webhook Handler."""
+
+
+Hook: TypeAlias = Callable[[HookEvent], Any]
+"""A callable which receives a Hook Event."""
+
+_HOOKS: dict[str, list[Hook]] = {}
+"""Hooks registered for each event, only containing events with Hooks."""
+
+
+class Hooks:
+    """
+    Define static methods for observing the lifecycle of requests sent by Webhooks.
+
+    Hooks are called synchronously, in the order they were registered, on both the
+    synchronous and asynchronous paths, so they should return quickly. An exception
+    raised by a Hook is logged rather than interrupting the request. When no Hooks are
+    registered, no events are created.
+    """
+
+    @staticmethod
+    def register(name: str, hook: Hook) -> None:
+        """
+        Register a Hook to be called for every occurrence of an event.
+
+        Arguments:
+            name (str): Name of the event, one of on_build, on_encode, on_send,
+                on_response, on_ratelimit, on_retry, or on_queue.
+
+            hook (Hook): A callable which receives a Hook Event.
+        """
+        if name not in HOOK_EVENTS:
+            raise ValueError(f"Unknown hook event {name}")
+
+        # Replaced rather than appended so that emitting threads see a stable list
+        _HOOKS[name] = [*_HOOKS.get(name, []), hook]
+
+    @staticmethod
+    def unregister(name: str, hook: Hook) -> None:
+        """
+        Unregister a Hook previously registered for an event.
+
+        Arguments:
+            name (str): Name of the event.
+
+            hook (Hook): The callable to unregister.
+        """
+        hooks: list[Hook] = [entry for entry in _HOOKS.get(name, []) if entry != hook]
+
+        if hooks:
+            _HOOKS[name] = hooks
+        else:
+            _HOOKS.pop(name, None)
+
+    @staticmethod
+    def clear() -> None:
+        """Unregister every Hook for every event."""
+        _HOOKS.clear()
+
+    @staticmethod
+    def is_registered(name: str | None = None) -> bool:
+        """
+        Return whether any Hooks are registered.
+
+        Arguments:
+            name (str | None): Name of the event to check. If None, any event.
+
+        Returns:
+            registered (bool): True if a Hook is registered.
+        """
+        if name is None:
+            return bool(_HOOKS)
+
+        return name in _HOOKS
+
+    @staticmethod
+    def emit(name: str, **fields: Any) -> None:
+        """
+        Call every Hook registered for an event with a new Hook Event.
+
+        Arguments:
+            name (str): Name of the event.
+
+            **fields (Any): The remaining fields of the Hook Event.
+        """
+        hooks: list[Hook] | None = _HOOKS.get(name)
+
+        if not hooks:
+            return
+
+        event: HookEvent = HookEvent(name=name, **fields)
+
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                LOGGER.error("Hook %s failed: %s", name, e)
@@ -0,0 +1,188 @@
+"""Define the LiveMessage class and its associates."""
+
+import copy
+from threading import Condition, Thread
+from time import monotonic
+from types import TracebackType
+from typing import Final, Self
+
+from niquests import Response
+
+from clyde.log import LOGGER
+from clyde.webhook import Webhook
+
+RETRIES_MAX: Final[int] = 3
+"""Number of times a failed edit is retried before the update is dropped."""
+
+
+class LiveMessage:
+    """
+    Represent a message sent by a Webhook which is kept up to date by editing it.
+
+    Updates are accepted at any rate without blocking. A snapshot of the Webhook is
+    taken with each update, so that it may be modified while an edit is in flight. A
+    background thread edits the message at most once per interval, always with the
+    latest snapshot, so intermediate states are dropped. Only the fields which changed
+    are sent. When the rate limit headers report an exhausted bucket, the next edit
+    waits for it to reset. A failed edit is retried, unless a newer update supersedes
+    it. Closing the Live Message sends any pending update before returning, and raises
+    the error of the final edit if it could not be sent.
+
+    Attributes:
+        webhook (Webhook): The latest state of the message.
+
+        message_id (str): ID of the message to edit.
+
+        interval (float): Minimum number of seconds between edits.
+    """
+
+    def __init__(
+        self: Self, webhook: Webhook, message_id: str, interval: float = 1.0
+    ) -> None:
+        """
+        Initialize a Live Message and start its background thread.
+
+        Arguments:
+            webhook (Webhook): The initial state of the message.
+
+            message_id (str): ID of the message to edit.
+
+            interval (float): Minimum number of seconds between edits.
+        """
+        self.webhook: Webhook = webhook
+        self.message_id: str = message_id
+        self.interval: float = interval
+
+        self._condition: Condition = Condition()
+        self._snapshot: Webhook = webhook
+        self._attempts: int = 0
+        self._error: Exception | None = None
+        self._pending: bool = False
+        self._sending: bool = False
+        self._closed: bool = False
+        self._next: float = 0.0
+        self._thread: Thread = Thread(
+            target=self._run, name=f"clyde-live-{message_id}", daemon=True
+        )
+
+        self._thread.start()
+
+    def __enter__(self: Self) -> "LiveMessage":
+        """Return the Live Message for use as a context manager."""
+        return self
+
+    def __exit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the Live Message, sending any pending update."""
+        self.close()
+
+    def update(self: Self, webhook: Webhook | None = None) -> "LiveMessage":
+        """
+        Schedule an edit of the message to its latest state without blocking.
+
+        Arguments:
+            webhook (Webhook | None): The new state of the message. If None, the
+                current Webhook is edited as it has been modified in place.
+
+        Returns:
+            self (LiveMessage): The modified Live Message instance.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot update a closed Live Message")
+
+            if (webhook is not None) and (webhook is not self.webhook):
+                # Carry over what was last sent so that edits remain deltas
+                webhook._sent = self.webhook._sent
+                self.webhook = webhook
+
+            # What was last sent is shared rather than copied, so that it is updated
+            self._snapshot = copy.deepcopy(
+                self.webhook, {id(self.webhook._sent): self.webhook._sent}
+            )
+            self._attempts = 0
+            self._pending = True
+
+            self._condition.notify_all()
+
+        return self
+
+    def flush(self: Self) -> None:
+        """Block until any pending update has been sent."""
+        with self._condition:
+            while self._pending or self._sending:
+                self._condition.wait()
+
+    def close(self: Self) -> None:
+        """
+        Send any pending update, then stop the background thread.
+
+        The error of the final edit is raised if it could not be sent after retrying.
+        """
+        with self._condition:
+            self._closed = True
+
+            self._condition.notify_all()
+
+        self._thread.join()
+
+        if self._error is not None:
+            raise self._error
+
+    def _run(self: Self) -> None:
+        """Edit the message whenever an update is pending and an edit is allowed."""
+        while True:
+            with self._condition:
+                while (not self._pending) and (not self._closed):
+                    self._condition.wait()
+
+                if not self._pending:
+                    return
+
+                # Wait out the interval, even when closing, to respect the rate limit
+                delay: float = self._next - monotonic()
+
+                if delay > 0:
+                    self._condition.wait(delay)
+
+                    continue
+
+                webhook: Webhook = self._snapshot
+                self._pending = False
+                self._sending = True
+
+            res: Response | None = None
+            error: Exception | None = None
+
+            try:
+                res = webhook.edit(self.message_id, delta=True)
+            except Exception as e:
+                error = e
+
+                LOGGER.error("Failed to edit message %s: %s", self.message_id, e)
+
+            with self._condition:
+                self._next = monotonic() + max(self.interval, self._get_reset(res))
+                self._sending = False
+                self._error = error
+
+                if error is None:
+                    self._attempts = 0
+                elif (not self._pending) and (self._attempts < RETRIES_MAX):
+                    # Retried only if a newer update has not superseded it
+                    self._attempts += 1
+                    self._pending = True
+
+                self._condition.notify_all()
+
+    @staticmethod
+    def _get_reset(res: Response | None) -> float:
+        """Return the seconds until the rate limit resets, if the bucket is exhausted."""
+        if (res is None) or (res.headers.get("X-RateLimit-Remaining") != "0"):
+            return 0.0
+
+        return float(res.headers.get("X-RateLimit-Reset-After") or 0.0)
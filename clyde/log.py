@@ -0,0 +1,94 @@
+"""Define the Log class and its associates."""
+
+import logging
+import re
+from random import random
+from re import Pattern
+from typing import Any, Final
+
+from niquests import Response
+
+LOGGER: Final[logging.Logger] = logging.getLogger("clyde")
+"""Logger which every message of the library is logged to."""
+
+TOKEN_PATTERN: Final[Pattern[str]] = re.compile(r"(/webhooks/\d+/)[^/?]+")
+"""Match the token of a Webhook URL, which is redacted before logging."""
+
+
+class Log:
+    """
+    Define static methods for logging the requests sent by Webhooks.
+
+    Every Response is logged to the clyde logger at the DEBUG level, including its
+    body. When DEBUG is disabled, the Response is not inspected at all, unless a sample
+    rate is set, in which case a sample of Responses are summarized at the INFO level
+    without their body. The method, redacted URL, status, and elapsed time of each
+    Response are attached to the log record as extra fields.
+
+    Attributes:
+        sample_rate (float): Fraction of Responses summarized when DEBUG is disabled.
+    """
+
+    sample_rate: float = 0.0
+    """Fraction of Responses summarized when DEBUG is disabled."""
+
+    @staticmethod
+    def set_sample_rate(sample_rate: float) -> None:
+        """
+        Set the fraction of Responses summarized when DEBUG is disabled.
+
+        Arguments:
+            sample_rate (float): A fraction between 0.0 (never) and 1.0 (always).
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"Sample rate {sample_rate} is not between 0.0 and 1.0")
+
+        Log.sample_rate = sample_rate
+
+    @staticmethod
+    def response(res: Response) -> None:
+        """
+        Log a Response received for a request sent by a Webhook.
+
+        Arguments:
+            res (Response): The Response to log.
+        """
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            fields: dict[str, Any] = Log._get_fields(res)
+
+            LOGGER.debug(
+                "%s %s %s %s",
+                fields["method"],
+                fields["url"],
+                fields["status"],
+                res.text,
+                extra=fields,
+            )
+
+            return
+
+        if (not Log.sample_rate) or (random() >= Log.sample_rate):
+            return
+        elif not LOGGER.isEnabledFor(logging.INFO):
+            return
+
+        fields = Log._get_fields(res)
+
+        LOGGER.info(
+            "%s %s %s in %.3fs",
+            fields["method"],
+            fields["url"],
+            fields["status"],
+            fields["elapsed"],
+            extra=fields,
+        )
+
+    @staticmethod
+    def _get_fields(res: Response) -> dict[str, Any]:
+        """Return the structured fields which describe a Response."""
+        return {
+            "method": res.request.method if res.request else None,
+            "url": TOKEN_PATTERN.sub(r"\1[redacted]", str(res.url)),
+            "status": res.status_code,
+            "elapsed": res.elapsed.total_seconds() if res.elapsed else None,
+        }
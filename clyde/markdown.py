@@ -1,5 +1,18 @@
 """Define the Markdown class and its associates."""
 
+import re
+from re import Pattern
+from typing import Final, Iterable, Self
+
+ESCAPE_CHARACTERS: Final[tuple[str, ...]] = ("\\", "*", "_", "`", "|", "~", ">")
+"""Characters which are escaped to prevent Markdown formatting, backslash first."""
+
+UNESCAPE_PATTERN: Final[Pattern[str]] = re.compile(r"\\([\\*_`|~>])")
+"""Match an escaped Markdown character."""
+
+SPAN_PATTERN: Final[Pattern[str]] = re.compile(r"\\.|```|`|\*\*|__|~~|\|\||\*|_")
+"""Match an escaped character or a Markdown span delimiter."""
+
 
 class Markdown:
     """
@@ -175,19 +188,19 @@ class Markdown:
         Returns:
             content (str): Content formatted as subtext.
         """
-        result: str = ""
+        lines: list[str] = []
 
         for line in content.splitlines():
             line = line.strip()
 
             if line == "":
-                result += "\n"
+                lines.append("")
 
                 continue
 
-            result += f"-# {line}\n"
+            lines.append(f"-# {line}")
 
-        return result.strip()
+        return "\n".join(lines).strip()
 
     @staticmethod
     def masked_link(content: str, url: str) -> str:
@@ -215,12 +228,7 @@ class Markdown:
         Returns:
             content (str): Items formatted as a bulleted list.
         """
-        result: str = ""
-
-        for entry in items:
-            result += f"- {entry}\n"
-
-        return result.strip()
+        return "\n".join([f"- {entry}" for entry in items]).strip()
 
     @staticmethod
     def numbered_list(items: list[str]) -> str:
@@ -233,12 +241,469 @@ class Markdown:
         Returns:
             content (str): Items formatted as a numbered list.
         """
-        result: str = ""
-        number: int = 1
+        return "\n".join(
+            [f"{number}. {entry}" for number, entry in enumerate(items, start=1)]
+        ).strip()
+
+    @staticmethod
+    def truncate(content: str, limit: int, ellipsis: str = "…") -> str:
+        """
+        Truncate the provided content to the length limit without breaking Markdown.
+
+        The content is cut outside of any span delimiter, the ellipsis is appended, and
+        every span left open at the cut (including code blocks) is closed. If the limit
+        leaves no room for content, the ellipsis is cut to the limit instead.
+
+        Arguments:
+            content (str): The content to truncate.
+
+            limit (int): Maximum length of the truncated content.
+
+            ellipsis (str): String appended to truncated content. Default is "…".
+
+        Returns:
+            content (str): Content no longer than the length limit.
+        """
+        if len(content) <= limit:
+            return content
+        elif limit <= len(ellipsis):
+            return ellipsis[: max(limit, 0)]
+
+        budget: int = limit - len(ellipsis)
+        spans: list[str] = []
+        closing: int = 0
+        position: int = 0
+        cut: int = 0
+        cut_spans: tuple[str, ...] = ()
+
+        for match in SPAN_PATTERN.finditer(content):
+            # Open spans are unchanged between the previous delimiter and this one
+            end: int = min(match.start(), budget - closing)
+
+            if end >= position:
+                cut, cut_spans = end, tuple(spans)
+
+            if match.start() >= budget:
+                break
+
+            token: str = match.group()
+            position = match.end()
+
+            if token.startswith("\\"):
+                continue
+            elif spans and (spans[-1] in ("```", "`")):
+                # Only the closing delimiter is significant within code
+                if token == spans[-1]:
+                    closing -= len(Markdown._get_closer(spans.pop()))
+            elif token in spans:
+                while spans[-1] != token:
+                    closing -= len(Markdown._get_closer(spans.pop()))
+
+                closing -= len(Markdown._get_closer(spans.pop()))
+            elif (token not in ("*", "_")) or Markdown._is_opener(content, match):
+                spans.append(token)
+                closing += len(Markdown._get_closer(token))
+        else:
+            end = min(len(content), budget - closing)
+
+            if end >= position:
+                cut, cut_spans = end, tuple(spans)
+
+        return (
+            content[:cut]
+            + ellipsis
+            + "".join([Markdown._get_closer(span) for span in reversed(cut_spans)])
+        )
+
+    @staticmethod
+    def escape(content: str) -> str:
+        """
+        Escape the provided content so that it is displayed without Markdown formatting.
+
+        Intended for untrusted text, such as usernames or log lines, which may contain
+        characters that would otherwise be interpreted as formatting.
+
+        Arguments:
+            content (str): The content to escape.
+
+        Returns:
+            content (str): Content with each Markdown character escaped.
+        """
+        # Each replacement is a single C-level pass, which outperforms both
+        # str.translate and re.sub on text dense with Markdown characters
+        for char in ESCAPE_CHARACTERS:
+            if char in content:
+                content = content.replace(char, "\\" + char)
+
+        return content
+
+    @staticmethod
+    def escape_all(items: Iterable[str]) -> list[str]:
+        """
+        Escape each of the provided items to display without Markdown formatting.
+
+        Arguments:
+            items (Iterable[str]): The items to escape.
+
+        Returns:
+            items (list[str]): Items with each Markdown character escaped.
+        """
+        return [Markdown.escape(entry) for entry in items]
+
+    @staticmethod
+    def unescape(content: str) -> str:
+        """
+        Reverse the escaping applied by Markdown.escape.
+
+        Arguments:
+            content (str): The content to unescape.
+
+        Returns:
+            content (str): Content with each escaped Markdown character restored.
+        """
+        if "\\" not in content:
+            return content
+
+        return UNESCAPE_PATTERN.sub(r"\1", content)
+
+    @staticmethod
+    def _get_closer(span: str) -> str:
+        """Return the string which closes a Markdown span."""
+        if span == "```":
+            return "\n```"
+
+        return span
+
+    @staticmethod
+    def _is_opener(content: str, match: re.Match[str]) -> bool:
+        """Return whether a single * or _ delimiter opens a Markdown span."""
+        following: str = content[match.end() : match.end() + 1]
+
+        if (not following) or following.isspace():
+            return False
+        elif match.group() == "_" and (match.start() > 0):
+            # Underscores within a word, such as snake_case, are not formatting
+            return not content[match.start() - 1].isalnum()
+
+        return True
+
+
+class MarkdownBuilder:
+    """
+    Build Discord-flavored Markdown content from many pieces.
+
+    Pieces are collected and joined once when the content is built, rather than
+    concatenated one at a time. If a character limit is configured, the first piece
+    that would exceed it, and every piece after it, is discarded.
+
+    Attributes:
+        limit (int | None): Maximum length of the built content.
+
+        separator (str): String placed between each piece.
+    """
+
+    def __init__(self: Self, limit: int | None = None, separator: str = "\n") -> None:
+        """
+        Initialize an empty Markdown Builder.
+
+        Arguments:
+            limit (int | None): Maximum length of the built content. If set to None,
+                the length is unlimited.
+
+            separator (str): String placed between each piece. Default is a newline.
+        """
+        self.limit: int | None = limit
+        self.separator: str = separator
+        self._pieces: list[str] = []
+        self._length: int = 0
+        self._truncated: bool = False
+
+    def add(self: Self, content: str) -> "MarkdownBuilder":
+        """
+        Add the provided content as-is.
+
+        Arguments:
+            content (str): The content to add.
+
+        Returns:
+            self (MarkdownBuilder): The modified Markdown Builder instance.
+        """
+        return self._add(content, self.separator)
+
+    def build(self: Self) -> str:
+        """
+        Join the collected pieces into the built content.
+
+        Returns:
+            content (str): The built content.
+        """
+        return "".join(self._pieces)
+
+    def get_length(self: Self) -> int:
+        """
+        Return the length of the built content.
+
+        Returns:
+            length (int): Length of the built content.
+        """
+        return self._length
+
+    def get_remaining_length(self: Self) -> int | None:
+        """
+        Return the number of characters that can be added before the limit.
+
+        Returns:
+            remaining (int | None): Characters remaining, or None if the length is
+                unlimited.
+        """
+        if self.limit is None:
+            return
+
+        return self.limit - self._length
+
+    def is_truncated(self: Self) -> bool:
+        """
+        Return whether any content was discarded due to the limit.
+
+        Returns:
+            truncated (bool): True if content was discarded.
+        """
+        return self._truncated
+
+    def bold(self: Self, content: str) -> "MarkdownBuilder":
+        """
+        Add the provided content formatted as bold.
+
+        Arguments:
+            content (str): The content to format.
+
+        Returns:
+            self (MarkdownBuilder): The modified Markdown Builder instance.
+        """
+        return self.add(Markdown.bold(content))
+
+    def italics(self: Self, content: str) -> "MarkdownBuilder":
+        """
+        Add the provided content formatted as italics.
+
+        Arguments:
+            content (str): The content to format.
+
+        Returns:
+            self (MarkdownBuilder): The modified Markdown Builder instance.
+        """
+        return self.add(Markdown.italics(content))
+
+    def strikethrough(self: Self, content: str) -> "MarkdownBuilder":
+        """
+        Add the provided content formatted as strikethrough.
+
+        Arguments:
+            content (str): The content to format.
+
+        Returns:
+            self (MarkdownBuilder): The modified Markdown Builder instance.
+        """
+        return self.add(Markdown.strikethrough(content))
+
+    def block_quote(
+        self: Self, content: str, multi_line: bool = True
+    ) -> "MarkdownBuilder":
+        """
+        Add the provided content formatted as a block quote.
+
+        Arguments:
+            content (str): The content to format.
+
+            multi_line (bool): Whether to use a multi-line block quote. Default is True.
+
+        Returns:
+            self (MarkdownBuilder): The modified Markdown Builder instance.
+        """
+        return self.add(Markdown.block_quote(content, multi_line))
+
+    def inline_code(self: Self, content: str) -> "MarkdownBuilder":
+        """
+        Add the provided content formatted as inline code.
+
+        Arguments:
+            content (str): The content to format.
+
+        Returns:
+            self (MarkdownBuilder): The modified Markdown Builder instance.
+        """
+        return self.add(Markdown.inline_code(content))
+
+    def code_block(
+        self: Self, content: str, highlight: str | None = None
+    ) -> "MarkdownBuilder":
+        """
+        Add the provided content formatted as a code block.
+
+        Arguments:
+            content (str): The content to format.
+            highlight (str | None): The language for syntax highlighting.
+
+        Returns:
+            self (MarkdownBuilder): The modified Markdown Builder instance.
+        """
+        return self.add(Markdown.code_block(content, highlight))
+
+    def spoiler(self: Self, content: str) -> "MarkdownBuilder":
+        """
+        Add the provided content formatted as a spoiler.
+
+        Arguments:
+            content (str): The content to format.
+
+        Returns:
+            self (MarkdownBuilder): The modified Markdown Builder instance.
+        """
+        return self.add(Markdown.spoiler(content))
+
+    def underline(self: Self, content: str) -> "MarkdownBuilder":
+        """
+        Add the provided content formatted as underline.
+
+        Arguments:
+            content (str): The content to format.
+
+        Returns:
+            self (MarkdownBuilder): The modified Markdown Builder instance.
+        """
+        return self.add(Markdown.underline(content))
+
+    def header_1(self: Self, content: str) -> "MarkdownBuilder":
+        """
+        Add the provided content formatted as header 1.
+
+        Arguments:
+            content (str): The content to format.
+
+        Returns:
+            self (MarkdownBuilder): The modified Markdown Builder instance.
+        """
+        return self.add(Markdown.header_1(content))
+
+    def header_2(self: Self, content: str) -> "MarkdownBuilder":
+        """
+        Add the provided content formatted as header 2.
+
+        Arguments:
+            content (str): The content to format.
+
+        Returns:
+            self (MarkdownBuilder): The modified Markdown Builder instance.
+        """
+        return self.add(Markdown.header_2(content))
+
+    def header_3(self: Self, content: str) -> "MarkdownBuilder":
+        """
+        Add the provided content formatted as header 3.
+
+        Arguments:
+            content (str): The content to format.
+
+        Returns:
+            self (MarkdownBuilder): The modified Markdown Builder instance.
+        """
+        return self.add(Markdown.header_3(content))
+
+    def subtext(self: Self, content: str) -> "MarkdownBuilder":
+        """
+        Add the provided content formatted as subtext.
+
+        Arguments:
+            content (str): The content to format.
+
+        Returns:
+            self (MarkdownBuilder): The modified Markdown Builder instance.
+        """
+        return self.add(Markdown.subtext(content))
+
+    def masked_link(self: Self, content: str, url: str) -> "MarkdownBuilder":
+        """
+        Add the provided content formatted as a masked link.
+
+        Arguments:
+            content (str): The content to format.
+
+            url (str): The URL to link to.
+
+        Returns:
+            self (MarkdownBuilder): The modified Markdown Builder instance.
+        """
+        return self.add(Markdown.masked_link(content, url))
+
+    def bulleted_list(self: Self, items: Iterable[str]) -> "MarkdownBuilder":
+        """
+        Add the provided items formatted as a bulleted list.
+
+        Items are added one at a time, so a list which exceeds the limit is cut off
+        after the last item that fits.
+
+        Arguments:
+            items (Iterable[str]): The items to format.
+
+        Returns:
+            self (MarkdownBuilder): The modified Markdown Builder instance.
+        """
+        separator: str = self.separator
 
         for entry in items:
-            result += f"{number}. {entry}\n"
+            if self._truncated:
+                break
+
+            self._add(f"- {entry}", separator)
+
+            separator = "\n"
+
+        return self
+
+    def numbered_list(self: Self, items: Iterable[str]) -> "MarkdownBuilder":
+        """
+        Add the provided items formatted as a numbered list.
+
+        Items are added one at a time, so a list which exceeds the limit is cut off
+        after the last item that fits.
+
+        Arguments:
+            items (Iterable[str]): The items to format.
+
+        Returns:
+            self (MarkdownBuilder): The modified Markdown Builder instance.
+        """
+        separator: str = self.separator
+
+        for number, entry in enumerate(items, start=1):
+            if self._truncated:
+                break
+
+            self._add(f"{number}. {entry}", separator)
+
+            separator = "\n"
+
+        return self
+
+    def _add(self: Self, content: str, separator: str) -> "MarkdownBuilder":
+        """Add a piece of content, preceded by a separator if it is not the first."""
+        if self._truncated:
+            return self
+
+        if not self._pieces:
+            separator = ""
+
+        length: int = len(separator) + len(content)
+
+        if (self.limit is not None) and (self._length + length > self.limit):
+            self._truncated = True
+
+            return self
+
+        if separator:
+            self._pieces.append(separator)
 
-            number += 1
+        self._pieces.append(content)
+        self._length += length
 
-        return result.strip()
+        return self
@@ -0,0 +1,318 @@
+"""Define the Metrics class and its associates."""
+
+from bisect import bisect_left
+from functools import lru_cache
+from hashlib import blake2b
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread, current_thread, local
+from typing import Any, Final, Self
+
+from clyde.hooks import HookEvent, Hooks
+
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+"""Upper bounds, in seconds, of the buckets of each latency histogram."""
+
+METRICS: Final[dict[str, tuple[str, str]]] = {
+    "clyde_requests_total": ("counter", "Responses received, by HTTP status code."),
+    "clyde_ratelimits_total": ("counter", "Responses which were rate-limited."),
+    "clyde_ratelimit_delay_seconds_total": (
+        "counter",
+        "Seconds slept due to rate limits.",
+    ),
+    "clyde_retries_total": ("counter", "Requests retried after a rate limit."),
+    "clyde_sent_bytes_total": ("counter", "Payload bytes sent, including Attachments."),
+    "clyde_request_duration_seconds": (
+        "histogram",
+        "Seconds from sending a request to receiving its Response.",
+    ),
+    "clyde_queue_depth": ("gauge", "Records waiting in a Webhook Handler queue."),
+    "clyde_queue_wait_seconds": (
+        "histogram",
+        "Seconds a record waited in a Webhook Handler queue.",
+    ),
+}
+"""Type and description of every metric, in the order they are rendered."""
+
+CONTENT_TYPE: Final[str] = "text/plain; version=0.0.4; charset=utf-8"
+"""Content type of the Prometheus text exposition format."""
+
+
+class Metrics:
+    """
+    Represent a registry of metrics about the requests sent by Webhooks.
+
+    Metrics are collected from Hook Events once installed, and labeled by a short hash
+    of the Webhook URL so that its token is not exposed. Each thread updates its own
+    shard of counters without locking, and the shards are summed when rendered. The
+    shards of threads which have exited are folded into a shared total, whenever the
+    metrics are rendered or a thread creates its shard, so that short-lived threads do
+    not each leave a shard behind.
+
+    Attributes:
+        buckets (tuple[float, ...]): Upper bounds, in seconds, of the buckets of each
+            latency histogram.
+    """
+
+    def __init__(self: Self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """
+        Initialize an empty Metrics registry.
+
+        Arguments:
+            buckets (tuple[float, ...]): Upper bounds, in seconds, of the buckets of
+                each latency histogram, in ascending order.
+        """
+        self.buckets: tuple[float, ...] = buckets
+
+        self._local: local = local()
+        self._lock: Lock = Lock()
+        self._shards: list[tuple[Thread, dict[tuple[str, tuple[str, ...]], float]]] = []
+        self._retired: dict[tuple[str, tuple[str, ...]], float] = {}
+        self._gauges: dict[tuple[str, tuple[str, ...]], float] = {}
+
+    def install(self: Self) -> "Metrics":
+        """
+        Begin collecting metrics by registering Hooks for the relevant events.
+
+        Returns:
+            self (Metrics): The modified Metrics instance.
+        """
+        Hooks.register("on_send", self._on_send)
+        Hooks.register("on_response", self._on_response)
+        Hooks.register("on_ratelimit", self._on_ratelimit)
+        Hooks.register("on_retry", self._on_retry)
+        Hooks.register("on_queue", self._on_queue)
+
+        return self
+
+    def uninstall(self: Self) -> "Metrics":
+        """
+        Stop collecting metrics by unregistering the Hooks of the Metrics instance.
+
+        Returns:
+            self (Metrics): The modified Metrics instance.
+        """
+        Hooks.unregister("on_send", self._on_send)
+        Hooks.unregister("on_response", self._on_response)
+        Hooks.unregister("on_ratelimit", self._on_ratelimit)
+        Hooks.unregister("on_retry", self._on_retry)
+        Hooks.unregister("on_queue", self._on_queue)
+
+        return self
+
+    def render(self: Self) -> str:
+        """
+        Render the collected metrics in the Prometheus text exposition format.
+
+        Returns:
+            text (str): The metrics, ready to be scraped.
+        """
+        with self._lock:
+            self._retire()
+
+            shards: list[dict[tuple[str, tuple[str, ...]], float]] = [
+                shard for _, shard in self._shards
+            ]
+            totals: dict[tuple[str, tuple[str, ...]], float] = dict(self._retired)
+
+        for key, value in self._gauges.copy().items():
+            totals[key] = value
+
+        for shard in shards:
+            # A copy is taken atomically, as the owning thread may be updating it
+            for key, value in shard.copy().items():
+                totals[key] = totals.get(key, 0) + value
+
+        lines: list[str] = []
+
+        for name, (kind, description) in METRICS.items():
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+
+            if kind == "histogram":
+                lines.extend(self._render_histogram(name, totals))
+
+                continue
+
+            for (key, labels), value in sorted(totals.items()):
+                if key == name:
+                    lines.append(f"{name}{Metrics._get_labels(labels)} {value:g}")
+
+        return "\n".join(lines) + "\n"
+
+    def serve(
+        self: Self, host: str = "127.0.0.1", port: int = 9464
+    ) -> ThreadingHTTPServer:
+        """
+        Serve the rendered metrics over HTTP from a background thread.
+
+        Arguments:
+            host (str): The address to listen on.
+
+            port (int): The port to listen on. If 0, a free port is chosen.
+
+        Returns:
+            server (ThreadingHTTPServer): The running server, which may be stopped
+                using its shutdown method.
+        """
+        metrics: Metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            """Respond to every GET request with the rendered metrics."""
+
+            def do_GET(self) -> None:
+                body: bytes = metrics.render().encode()
+
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return
+
+        server: ThreadingHTTPServer = ThreadingHTTPServer((host, port), MetricsHandler)
+
+        Thread(target=server.serve_forever, name="clyde-metrics", daemon=True).start()
+
+        return server
+
+    def _on_send(self: Self, event: HookEvent) -> None:
+        """Count the bytes of a request as it is sent."""
+        self._add(
+            "clyde_sent_bytes_total", Metrics._get_url_hash(event.url), event.size
+        )
+
+    def _on_response(self: Self, event: HookEvent) -> None:
+        """Count a received Response and observe its latency."""
+        url: str = Metrics._get_url_hash(event.url)
+
+        self._add("clyde_requests_total", url, 1, str(event.status))
+        self._observe("clyde_request_duration_seconds", url, event.elapsed)
+
+    def _on_ratelimit(self: Self, event: HookEvent) -> None:
+        """Count a rate-limited Response and the delay it adds."""
+        url: str = Metrics._get_url_hash(event.url)
+
+        self._add("clyde_ratelimits_total", url, 1)
+        self._add("clyde_ratelimit_delay_seconds_total", url, event.delay)
+
+    def _on_retry(self: Self, event: HookEvent) -> None:
+        """Count a request retried after a rate limit."""
+        self._add("clyde_retries_total", Metrics._get_url_hash(event.url), 1)
+
+    def _on_queue(self: Self, event: HookEvent) -> None:
+        """Record the depth of a queue and observe the wait of a dequeued record."""
+        url: str = Metrics._get_url_hash(event.url)
+
+        self._gauges[("clyde_queue_depth", (url,))] = event.depth or 0
+        self._observe("clyde_queue_wait_seconds", url, event.elapsed)
+
+    def _add(
+        self: Self, name: str, url: str, value: float | None, *labels: str
+    ) -> None:
+        """Add a value to a counter in the shard of the current thread."""
+        if value is None:
+            return
+
+        shard: dict[tuple[str, tuple[str, ...]], float] = self._get_shard()
+        key: tuple[str, tuple[str, ...]] = (name, (url, *labels))
+
+        shard[key] = shard.get(key, 0) + value
+
+    def _observe(self: Self, name: str, url: str, value: float | None) -> None:
+        """Observe a value in a histogram in the shard of the current thread."""
+        if value is None:
+            return
+
+        bucket: int = bisect_left(self.buckets, value)
+
+        self._add(f"{name}_bucket", url, 1, str(bucket))
+        self._add(f"{name}_sum", url, value)
+        self._add(f"{name}_count", url, 1)
+
+    def _get_shard(self: Self) -> dict[tuple[str, tuple[str, ...]], float]:
+        """Return the counters owned by the current thread."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard: dict[tuple[str, tuple[str, ...]], float] = {}
+
+            self._local.shard = shard
+
+            with self._lock:
+                self._retire()
+                self._shards.append((current_thread(), shard))
+
+            return shard
+
+    def _retire(self: Self) -> None:
+        """Fold the shards of threads which have exited into the retired totals."""
+        shards: list[tuple[Thread, dict[tuple[str, tuple[str, ...]], float]]] = []
+
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                shards.append((thread, shard))
+
+                continue
+
+            # The thread has exited, so its shard is no longer updated
+            for key, value in shard.items():
+                self._retired[key] = self._retired.get(key, 0) + value
+
+        self._shards = shards
+
+    def _render_histogram(
+        self: Self, name: str, totals: dict[tuple[str, tuple[str, ...]], float]
+    ) -> list[str]:
+        """Return the lines of a histogram, with cumulative buckets."""
+        lines: list[str] = []
+        urls: list[str] = sorted(
+            {labels[0] for key, labels in totals if key == f"{name}_count"}
+        )
+        bounds: list[str] = [f"{bound:g}" for bound in self.buckets] + ["+Inf"]
+
+        for url in urls:
+            count: float = 0
+
+            for idx, bound in enumerate(bounds):
+                count += totals.get((f"{name}_bucket", (url, str(idx))), 0)
+
+                lines.append(f'{name}_bucket{{url="{url}",le="{bound}"}} {count:g}')
+
+            lines.append(
+                f'{name}_sum{{url="{url}"}} {totals[(f"{name}_sum", (url,))]:g}'
+            )
+            lines.append(
+                f'{name}_count{{url="{url}"}} {totals[(f"{name}_count", (url,))]:g}'
+            )
+
+        return lines
+
+    @staticmethod
+    def _get_labels(labels: tuple[str, ...]) -> str:
+        """Return the label set of a sample, where a second label is the status."""
+        if len(labels) > 1:
+            return f'{{url="{labels[0]}",status="{labels[1]}"}}'
+
+        return f'{{url="{labels[0]}"}}'
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _get_url_hash(url: str) -> str:
+        """Return a short hash of a Webhook URL, ignoring the message being edited."""
+        return blake2b(url.split("/messages/")[0].encode(), digest_size=4).hexdigest()
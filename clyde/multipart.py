@@ -0,0 +1,149 @@
+"""Define the MultipartBody class and its associates."""
+
+import asyncio
+from secrets import token_hex
+from typing import AsyncIterator, Final, Iterator, Self
+
+from clyde.attachment import Attachment
+
+CHUNK_SIZE: Final[int] = 65_536
+"""Number of bytes read from the source of a file Attachment at a time."""
+
+CRLF: Final[bytes] = b"\r\n"
+"""Line break which separates the headers and parts of a multipart body."""
+
+
+class MultipartBody:
+    """
+    Represent a multipart/form-data request body which is produced in chunks.
+
+    The payload is written first, followed by each file Attachment read in chunks from
+    its source, so that peak memory is constant regardless of the size of the files.
+    Each file is named files[n] by its index, which an attachments array in the payload
+    may refer to by ID.
+    The length of the body is known before it is produced, so that it is sent with a
+    Content-Length rather than chunked. The size of each file is recorded when the body
+    is initialized, and no more than that is read, so that a file which grows before or
+    while the body is sent does not exceed the Content-Length. Each iteration produces the body anew, such as
+    when a rate-limited request is retried.
+    """
+
+    def __init__(self: Self, payload: bytes, attachments: list[Attachment]) -> None:
+        """
+        Initialize a Multipart Body.
+
+        Arguments:
+            payload (bytes): The encoded JSON payload.
+
+            attachments (list[Attachment]): The file Attachments to upload, each with
+                a filename.
+        """
+        self.boundary: str = token_hex(16)
+
+        self._payload: bytes = payload
+        self._attachments: list[Attachment] = attachments
+        self._sizes: list[int] = [attachment.get_size() for attachment in attachments]
+        self._headers: list[bytes] = [
+            self._get_header(f"files[{idx}]", str(attachment.filename))
+            for idx, attachment in enumerate(attachments)
+        ]
+        self._length: int = (
+            len(self._get_header("payload_json"))
+            + len(payload)
+            + len(CRLF)
+            + sum(
+                len(header) + size + len(CRLF)
+                for header, size in zip(self._headers, self._sizes)
+            )
+            + len(self._get_footer())
+        )
+
+    def __len__(self: Self) -> int:
+        """Return the number of bytes in the Multipart Body."""
+        return self._length
+
+    def __iter__(self: Self) -> Iterator[bytes]:
+        """Produce the Multipart Body in chunks."""
+        yield self._get_header("payload_json")
+        yield self._payload
+        yield CRLF
+
+        for header, attachment, size in zip(
+            self._headers, self._attachments, self._sizes
+        ):
+            yield header
+            yield from attachment.iter_content(CHUNK_SIZE, size)
+            yield CRLF
+
+        yield self._get_footer()
+
+    def get_content_type(self: Self) -> str:
+        """
+        Return the Content-Type header of the Multipart Body.
+
+        Returns:
+            content_type (str): The media type, including the boundary.
+        """
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def to_async(self: Self) -> "AsyncMultipartBody":
+        """
+        Return the Multipart Body for use on the asynchronous path.
+
+        Returns:
+            body (AsyncMultipartBody): The Multipart Body as an asynchronous iterable.
+        """
+        return AsyncMultipartBody(self)
+
+    def _get_header(self: Self, name: str, filename: str | None = None) -> bytes:
+        """Return the boundary and headers which precede a part."""
+        disposition: str = f'form-data; name="{MultipartBody._quote(name)}"'
+        content_type: str = "application/json"
+
+        if filename is not None:
+            disposition += f'; filename="{MultipartBody._quote(filename)}"'
+            content_type = "application/octet-stream"
+
+        return (
+            f"--{self.boundary}\r\n"
+            f"Content-Disposition: {disposition}\r\n"
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+
+    def _get_footer(self: Self) -> bytes:
+        """Return the closing boundary of the Multipart Body."""
+        return f"--{self.boundary}--\r\n".encode()
+
+    @staticmethod
+    def _quote(value: str) -> str:
+        """Return a header parameter with line breaks and quotes percent-encoded."""
+        return value.translate({10: "%0A", 13: "%0D", 34: "%22"})
+
+
+class AsyncMultipartBody:
+    """
+    Represent a Multipart Body which is produced in chunks without blocking.
+
+    Each chunk is read in a worker thread, so that reading a file Attachment does not
+    block the event loop.
+    """
+
+    def __init__(self: Self, body: MultipartBody) -> None:
+        """
+        Initialize an Async Multipart Body.
+
+        Arguments:
+            body (MultipartBody): The Multipart Body to produce.
+        """
+        self.body: MultipartBody = body
+
+    def __len__(self: Self) -> int:
+        """Return the number of bytes in the Multipart Body."""
+        return len(self.body)
+
+    async def __aiter__(self: Self) -> AsyncIterator[bytes]:
+        """Produce the Multipart Body in chunks."""
+        chunks: Iterator[bytes] = iter(self.body)
+
+        while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+            yield chunk
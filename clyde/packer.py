@@ -0,0 +1,198 @@
+"""Define the Packer class and its associates."""
+
+from typing import Any, Final, Iterable
+
+import msgspec
+from msgspec import UNSET
+
+from clyde.embed import EMBED_TOTAL_LENGTH_MAX, Embed, EmbedField
+from clyde.webhook import Webhook
+
+EMBED_FIELDS_MAX: Final[int] = 25
+"""Maximum number of Fields on a single Embed."""
+
+WEBHOOK_EMBEDS_MAX: Final[int] = 10
+"""Maximum number of Embeds on a single message."""
+
+EMBED_HEADER_FIELDS: Final[tuple[str, ...]] = (
+    "title",
+    "description",
+    "url",
+    "author",
+    "thumbnail",
+)
+"""Embed attributes shown above the Fields, which form the header of a page."""
+
+EMBED_FOOTER_FIELDS: Final[tuple[str, ...]] = ("footer", "timestamp", "image")
+"""Embed attributes shown below the Fields, which form the footer of a page."""
+
+
+class Packer:
+    """
+    Define static methods for packing Embed Fields and Embeds into Webhook messages.
+
+    Items are packed greedily, in order, into the fewest messages which respect the
+    limits of 25 Fields per Embed, 10 Embeds per message, and 6,000 combined Embed
+    characters per message. Each item is visited once.
+    """
+
+    @staticmethod
+    def pack_fields(
+        webhook: Webhook,
+        fields: Iterable[EmbedField],
+        template: Embed | None = None,
+        repeat: bool = True,
+    ) -> list[Webhook]:
+        """
+        Pack the provided Embed Fields into the fewest Webhook messages.
+
+        Arguments:
+            webhook (Webhook): The Webhook each message is copied from. Its Embeds are
+                replaced by the packed Embeds.
+
+            fields (Iterable[EmbedField]): The Embed Fields to pack, in order.
+
+            template (Embed | None): The Embed each packed Embed is copied from. Its
+                title, description, URL, Author, and Thumbnail form the header, and its
+                Footer, timestamp, and image form the footer.
+
+            repeat (bool): Repeat the header, footer, and content on every message.
+                Otherwise, they are included on the first and last message only.
+
+        Returns:
+            webhooks (list[Webhook]): A Webhook for each message, in order.
+        """
+        if template is None:
+            template = Embed()
+
+        header_length: int = msgspec.structs.replace(
+            template, **{name: UNSET for name in EMBED_FOOTER_FIELDS}, fields=UNSET
+        ).get_length()
+        footer_length: int = template.get_length() - header_length
+
+        if isinstance(template.fields, list):
+            footer_length -= sum(
+                len(field.name) + len(field.value) for field in template.fields
+            )
+
+        # Each page is a list of Embeds, each Embed a list of Fields
+        pages: list[list[list[EmbedField]]] = [[[]]]
+        length: int = header_length + (footer_length if repeat else 0)
+
+        for field in fields:
+            size: int = len(field.name) + len(field.value)
+            embeds: list[list[EmbedField]] = pages[-1]
+            full: bool = (len(embeds[-1]) == EMBED_FIELDS_MAX) and (
+                len(embeds) == WEBHOOK_EMBEDS_MAX
+            )
+
+            if embeds[-1] and (full or (length + size > EMBED_TOTAL_LENGTH_MAX)):
+                pages.append([[]])
+
+                embeds = pages[-1]
+                length = (header_length + footer_length) if repeat else 0
+            elif len(embeds[-1]) == EMBED_FIELDS_MAX:
+                embeds.append([])
+
+            embeds[-1].append(field)
+            length += size
+
+        if (
+            (not repeat)
+            and (length + footer_length > EMBED_TOTAL_LENGTH_MAX)
+            and (sum(map(len, pages[-1])) > 1)
+        ):
+            # The footer only fits if the last Field is moved to a message of its own
+            last: list[list[EmbedField]] = pages[-1]
+
+            pages.append([[last[-1].pop()]])
+
+            if not last[-1]:
+                last.pop()
+
+        webhooks: list[Webhook] = []
+
+        for idx, page in enumerate(pages):
+            has_header: bool = repeat or (idx == 0)
+            has_footer: bool = repeat or (idx == len(pages) - 1)
+            packed: list[Embed] = []
+
+            for embed_idx, chunk in enumerate(page):
+                removed: dict[str, Any] = {}
+
+                if not (has_header and (embed_idx == 0)):
+                    removed.update({name: UNSET for name in EMBED_HEADER_FIELDS})
+
+                if not (has_footer and (embed_idx == len(page) - 1)):
+                    removed.update({name: UNSET for name in EMBED_FOOTER_FIELDS})
+
+                packed.append(
+                    msgspec.structs.replace(
+                        template, **removed, fields=list(chunk) or UNSET
+                    )
+                )
+
+            webhooks.append(Packer._get_page(webhook, packed, idx, len(pages), repeat))
+
+        return webhooks
+
+    @staticmethod
+    def pack_embeds(
+        webhook: Webhook, embeds: Iterable[Embed], repeat: bool = True
+    ) -> list[Webhook]:
+        """
+        Pack the provided Embeds into the fewest Webhook messages.
+
+        Arguments:
+            webhook (Webhook): The Webhook each message is copied from. Its Embeds are
+                replaced by the packed Embeds.
+
+            embeds (Iterable[Embed]): The Embeds to pack, in order.
+
+            repeat (bool): Repeat the content on every message. Otherwise, it is
+                included on the first message only.
+
+        Returns:
+            webhooks (list[Webhook]): A Webhook for each message, in order.
+        """
+        pages: list[list[Embed]] = [[]]
+        length: int = 0
+
+        for embed in embeds:
+            size: int = embed.get_length()
+            page: list[Embed] = pages[-1]
+
+            if page and (
+                (len(page) == WEBHOOK_EMBEDS_MAX)
+                or (length + size > EMBED_TOTAL_LENGTH_MAX)
+            ):
+                pages.append([])
+
+                length = 0
+
+            pages[-1].append(embed)
+            length += size
+
+        return [
+            Packer._get_page(webhook, page, idx, len(pages), repeat)
+            for idx, page in enumerate(pages)
+        ]
+
+    @staticmethod
+    def _get_page(
+        webhook: Webhook, embeds: list[Embed], idx: int, count: int, repeat: bool
+    ) -> Webhook:
+        """Return a copy of the Webhook as the given page of packed Embeds."""
+        changes: dict[str, Any] = {
+            "embeds": embeds or UNSET,
+            "_query_params": dict(webhook._query_params),
+        }
+
+        if (not repeat) and (idx > 0):
+            changes["content"] = UNSET
+
+        if idx < count - 1:
+            # Only the final page carries the rest of the message
+            changes.update(components=UNSET, poll=UNSET, _attachments=[])
+
+        return msgspec.structs.replace(webhook, **changes)
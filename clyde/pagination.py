@@ -0,0 +1,171 @@
+"""Define the Pagination class and its associates."""
+
+import re
+from re import Pattern
+from typing import Final
+
+CODE_FENCE: Final[str] = "```"
+"""Delimiter of a Markdown code block."""
+
+BLOCK_QUOTE: Final[str] = ">>> "
+"""Prefix of a multi-line Markdown block quote."""
+
+SPAN_DELIMITERS: Final[frozenset[str]] = frozenset({"**", "__", "~~", "||"})
+"""Two-character delimiters of Markdown spans which may not be split."""
+
+SPLIT_TOKENS: Final[Pattern[str]] = re.compile(r"`|\*\*|__|~~|\|\||\s")
+"""Match the tokens considered when splitting a line."""
+
+FENCE_OPENER: Final[Pattern[str]] = re.compile(r"^\s*```[\w+#.-]*\s*$")
+"""Match a line which only opens a code block, optionally with a language."""
+
+
+class Pagination:
+    """Define static methods for splitting content across multiple Discord messages."""
+
+    @staticmethod
+    def split_content(content: str, limit: int) -> list[str]:
+        """
+        Split the provided content into pages which do not exceed the length limit.
+
+        Content is split at line boundaries. A code block which spans pages is closed at
+        the end of a page and reopened, with its language, at the start of the next. A
+        multi-line block quote is likewise continued on the next page, unless the limit
+        leaves no room to do so. Lines which do not fit on a page by themselves are split
+        at whitespace outside of Markdown spans where possible.
+
+        Arguments:
+            content (str): The content to split.
+
+            limit (int): Maximum length of each page.
+
+        Returns:
+            pages (list[str]): The content split into pages, in order.
+        """
+        if len(content) <= limit:
+            return [content]
+
+        pages: list[str] = []
+        page: list[str] = []
+        length: int = 0
+        fence: str | None = None
+        quote: bool = False
+
+        for line in content.split("\n"):
+            # A code block or quote is only continued when its prefix fits on a page
+            prefix: str = BLOCK_QUOTE if quote and (len(BLOCK_QUOTE) < limit) else ""
+            reopen: str | None = (
+                fence if fence and (len(prefix + fence) + 5 < limit) else None
+            )
+            toggle: bool = line.count(CODE_FENCE) % 2 == 1
+            closing: int = len(CODE_FENCE) + 1 if (reopen or toggle) else 0
+
+            # Reserve room to close and reopen a code block, and to continue a quote
+            overhead: int = len(prefix) + (len(reopen) + 1 if reopen else 0) + closing
+
+            for piece, joiner in Pagination._split_line(line, max(limit - overhead, 1)):
+                added: int = len(piece) + (len(joiner) if page else 0)
+
+                if page and (length + added + closing > limit):
+                    if reopen:
+                        page.append("\n" + CODE_FENCE)
+
+                    pages.append("".join(page))
+
+                    page = []
+                    length = 0
+
+                    if reopen:
+                        # The reopened code block must be followed by a line break
+                        page.append(prefix + reopen)
+                        length = len(prefix + reopen)
+                        joiner = "\n"
+                    else:
+                        piece = prefix + piece
+
+                    added = len(piece) + (len(joiner) if page else 0)
+
+                if page:
+                    page.append(joiner)
+
+                page.append(piece)
+                length += added
+
+            if toggle:
+                if fence:
+                    fence = None
+                elif FENCE_OPENER.match(line):
+                    fence = line.strip()
+                else:
+                    fence = CODE_FENCE
+            elif (not fence) and line.startswith(BLOCK_QUOTE):
+                quote = True
+
+        if page:
+            pages.append("".join(page))
+
+        return pages
+
+    @staticmethod
+    def _split_line(line: str, width: int) -> list[tuple[str, str]]:
+        """Return a line split into pieces of the given width, with their joiners."""
+        if len(line) <= width:
+            return [(line, "\n")]
+
+        # Find whitespace to split at, preferring that outside of Markdown spans
+        safe: list[int] = []
+        spaces: list[int] = []
+        spans: set[str] = set()
+        code: bool = False
+
+        for match in SPLIT_TOKENS.finditer(line):
+            token: str = match.group()
+
+            if token == "`":
+                code = not code
+            elif token in SPAN_DELIMITERS:
+                if not code:
+                    spans ^= {token}
+            else:
+                spaces.append(match.start())
+
+                if (not code) and (not spans):
+                    safe.append(match.start())
+
+        pieces: list[tuple[str, str]] = []
+        joiner: str = "\n"
+        start: int = 0
+        safe_idx: int = 0
+        space_idx: int = 0
+
+        while len(line) - start > width:
+            end: int = start + width
+            split: int | None = None
+
+            while (safe_idx < len(safe)) and (safe[safe_idx] <= end):
+                if safe[safe_idx] > start:
+                    split = safe[safe_idx]
+
+                safe_idx += 1
+
+            if split is None:
+                while (space_idx < len(spaces)) and (spaces[space_idx] <= end):
+                    if spaces[space_idx] > start:
+                        split = spaces[space_idx]
+
+                    space_idx += 1
+
+            if split is None:
+                pieces.append((line[start:end], joiner))
+
+                joiner = ""
+                start = end
+            else:
+                pieces.append((line[start:split], joiner))
+
+                joiner = line[split]
+                start = split + 1
+
+        pieces.append((line[start:], joiner))
+
+        return pieces
@@ -6,6 +6,8 @@ from typing import Annotated, Iterable, Self
 import msgspec
 from msgspec import UNSET, Meta, Struct, UnsetType
 
+from clyde.validation import Validation
+
 
 class PollMediaQuestion(Struct, kw_only=True):
     """
@@ -22,16 +24,22 @@ class PollMediaQuestion(Struct, kw_only=True):
     )
     """The text of the field."""
 
-    def set_text(self: Self, text: str) -> "PollMediaQuestion":
+    def set_text(self: Self, text: str, truncate: bool = False) -> "PollMediaQuestion":
         """
         Set the text of the Poll Media.
 
         Arguments:
             text (str): The text of the field.
 
+            truncate (bool): Truncate the text to the length limit without
+                breaking Markdown formatting.
+
         Returns:
             self (PollMediaQuestion): The modified Poll Media instance.
         """
+        if truncate:
+            text = Validation.truncate(PollMediaQuestion, "text", text)
+
         self.text = text
 
         return self
@@ -68,16 +76,22 @@ class PollMediaAnswer(Struct, kw_only=True):
     emoji: UnsetType | str = msgspec.field(default=UNSET)
     """The emoji of the field."""
 
-    def set_text(self: Self, text: str) -> "PollMediaAnswer":
+    def set_text(self: Self, text: str, truncate: bool = False) -> "PollMediaAnswer":
         """
         Set the text of the Poll Media.
 
         Arguments:
             text (str): The text of the field.
 
+            truncate (bool): Truncate the text to the length limit without
+                breaking Markdown formatting.
+
         Returns:
             self (PollMediaAnswer): The modified Poll Media instance.
         """
+        if truncate:
+            text = Validation.truncate(PollMediaAnswer, "text", text)
+
         self.text = text
 
         return self
@@ -189,7 +203,9 @@ class Poll(Struct, kw_only=True):
     )
     """Each of the answers available in the poll."""
 
-    duration: UnsetType | int = msgspec.field(default=UNSET)
+    duration: UnsetType | Annotated[int, Meta(ge=1, le=768)] = msgspec.field(
+        default=UNSET
+    )
     """Number of hours the poll should be open for, up to 32 days. Defaults to 24."""
 
     allow_multiselect: UnsetType | bool = msgspec.field(default=UNSET)
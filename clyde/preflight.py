@@ -0,0 +1,436 @@
+"""Define the Preflight class and its associates."""
+
+from typing import Any, Final, Union
+
+import msgspec
+from msgspec import UNSET, Raw, Struct
+from msgspec.inspect import (
+    DictType,
+    FloatType,
+    IntType,
+    ListType,
+    RawType,
+    StrType,
+    StructType,
+    Type,
+    UnionType,
+    multi_type_info,
+)
+
+from clyde.attachment import Attachment
+from clyde.component import ATTACHMENT_SCHEME, Component, ComponentTree
+from clyde.components.action_row import ActionRow
+from clyde.components.button import LinkButton
+from clyde.components.container import Container
+from clyde.components.file import File
+from clyde.components.media_gallery import MediaGallery, MediaGalleryItem
+from clyde.components.section import Section
+from clyde.components.seperator import Seperator
+from clyde.components.text_display import TextDisplay
+from clyde.components.thumbnail import Thumbnail
+from clyde.embed import EMBED_TOTAL_LENGTH_MAX, Embed
+from clyde.fragment import Fragment, Measurement
+from clyde.poll import Poll
+
+COMPONENTS_TOTAL_MAX: Final[int] = 40
+"""Maximum number of Components, including nested Components, on a single message."""
+
+TEXT_DISPLAY_TOTAL_LENGTH_MAX: Final[int] = 4000
+"""Maximum combined length of all Text Display content on a single message."""
+
+ATTACHMENTS_MAX: Final[int] = 10
+"""Maximum number of file Attachments on a single message."""
+
+
+class PreflightError(ValueError):
+    """
+    Raised when a Struct violates one or more Discord limits.
+
+    Attributes:
+        violations (list[str]): A description of every violation found.
+    """
+
+    def __init__(self, violations: list[str]) -> None:
+        """
+        Initialize a Preflight Error from a list of violations.
+
+        Arguments:
+            violations (list[str]): A description of every violation found.
+        """
+        self.violations: list[str] = violations
+
+        super().__init__(
+            f"{len(violations):,} Discord limit violation(s): " + "; ".join(violations)
+        )
+
+
+class Constraint(Struct, kw_only=True, frozen=True):
+    """
+    Represent the limits declared on a single Struct Field.
+
+    Attributes:
+        name (str): Name of the Field.
+
+        min_length (int | None): Minimum length of a string or list value.
+
+        max_length (int | None): Maximum length of a string or list value.
+
+        ge (int | float | None): Minimum numeric value.
+
+        le (int | float | None): Maximum numeric value.
+
+        nested (bool): True if the Field may contain other Structs.
+
+        fragment (Any): The type fragments within the Field are thawed as, or None if
+            the Field may not contain fragments.
+    """
+
+    name: str = msgspec.field()
+    """Name of the Field."""
+
+    min_length: int | None = msgspec.field(default=None)
+    """Minimum length of a string or list value."""
+
+    max_length: int | None = msgspec.field(default=None)
+    """Maximum length of a string or list value."""
+
+    ge: int | float | None = msgspec.field(default=None)
+    """Minimum numeric value."""
+
+    le: int | float | None = msgspec.field(default=None)
+    """Maximum numeric value."""
+
+    nested: bool = msgspec.field(default=False)
+    """True if the Field may contain other Structs."""
+
+    fragment: Any = msgspec.field(default=None)
+    """The type fragments within the Field are thawed as."""
+
+
+_INDEX: dict[type, tuple[Constraint, ...]] = {}
+"""Constraints of every indexed Struct type, keyed by type."""
+
+
+class Preflight:
+    """
+    Define static methods for validating Structs against Discord limits before sending.
+
+    msgspec does not enforce Meta constraints when encoding, so an oversized message is
+    otherwise only rejected by Discord after a full round trip. The constraints declared
+    on each Struct are indexed once, then every violation is collected in a single pass.
+    """
+
+    @staticmethod
+    def index(*structs: type[Struct]) -> None:
+        """
+        Index the constraints of the provided Struct types and any Structs they contain.
+
+        Arguments:
+            structs (type[Struct]): One or more msgspec Struct types.
+        """
+        pending: list[Type] = list(multi_type_info(structs))
+
+        while pending:
+            info: Type = pending.pop()
+
+            if isinstance(info, UnionType):
+                pending.extend(info.types)
+
+                continue
+            elif isinstance(info, (ListType, DictType)):
+                pending.append(
+                    info.item_type if isinstance(info, ListType) else info.value_type
+                )
+
+                continue
+            elif not isinstance(info, StructType) or info.cls in _INDEX:
+                continue
+
+            constraints: list[Constraint] = []
+
+            for field in info.fields:
+                constraint: Constraint | None = Preflight._get_constraint(
+                    field.name, field.type
+                )
+
+                if constraint:
+                    constraints.append(constraint)
+
+                pending.append(field.type)
+
+            _INDEX[info.cls] = tuple(constraints)
+
+    @staticmethod
+    def get_violations(value: Struct) -> list[str]:
+        """
+        Return every Discord limit violated by the provided Struct.
+
+        Arguments:
+            value (Struct): A msgspec Struct, such as a Webhook, Embed, Poll,
+                or Component.
+
+        Returns:
+            violations (list[str]): A description of every violation found.
+        """
+        violations, embed_length = Preflight._get_field_violations(
+            type(value).__name__, value
+        )
+
+        if embed_length > EMBED_TOTAL_LENGTH_MAX:
+            violations.append(
+                f"Embeds have a combined length of {embed_length:,} (maximum {EMBED_TOTAL_LENGTH_MAX:,})"
+            )
+
+        # Measured as the Component tree is measured elsewhere, so that they agree
+        components: Any = (
+            [value]
+            if isinstance(value, Component)
+            else getattr(value, "components", None)
+        )
+        tree: ComponentTree = Component.summarize(
+            components if isinstance(components, list) else []
+        )
+
+        if tree.count > COMPONENTS_TOTAL_MAX:
+            violations.append(
+                f"Message has {tree.count:,} Components (maximum {COMPONENTS_TOTAL_MAX:,})"
+            )
+
+        if tree.text_length > TEXT_DISPLAY_TOTAL_LENGTH_MAX:
+            violations.append(
+                f"Text Displays have a combined length of {tree.text_length:,} (maximum {TEXT_DISPLAY_TOTAL_LENGTH_MAX:,})"
+            )
+
+        attachments: Any = getattr(value, "_attachments", None)
+
+        if isinstance(attachments, list) and (len(attachments) > ATTACHMENTS_MAX):
+            violations.append(
+                f"Message has {len(attachments):,} Attachments (maximum {ATTACHMENTS_MAX:,})"
+            )
+
+        if isinstance(attachments, list) and tree.attachments:
+            filenames: set[Any] = {attachment.filename for attachment in attachments}
+
+            for reference in tree.attachments:
+                if reference not in filenames:
+                    violations.append(
+                        f"{ATTACHMENT_SCHEME}{reference} does not reference an Attachment"
+                    )
+
+        return violations
+
+    @staticmethod
+    def measure(value: Struct) -> Measurement:
+        """
+        Measure the provided Struct against the Discord limits, as a fragment of it.
+
+        Arguments:
+            value (Struct): A msgspec Struct, such as an Embed Footer, Embed Author,
+                Embed, or Component.
+
+        Returns:
+            measurement (Measurement): The length, Components, and violations of the
+                Struct, with each violation relative to the Field which holds it.
+        """
+        violations, _ = Preflight._get_field_violations("", value)
+        tree: ComponentTree = (
+            Component.summarize([value])
+            if isinstance(value, Component)
+            else ComponentTree()
+        )
+
+        return Measurement(
+            kind=type(value),
+            length=(
+                value.refresh_length()
+                if isinstance(value, Embed)
+                else Embed._count(value)
+            ),
+            count=tree.count,
+            text_length=tree.text_length,
+            attachments=tree.attachments,
+            violations=violations,
+        )
+
+    @staticmethod
+    def validate(value: Struct) -> None:
+        """
+        Raise a Preflight Error if the provided Struct violates any Discord limits.
+
+        Arguments:
+            value (Struct): A msgspec Struct, such as a Webhook, Embed, Poll,
+                or Component.
+        """
+        violations: list[str] = Preflight.get_violations(value)
+
+        if violations:
+            raise PreflightError(violations)
+
+    @staticmethod
+    def _get_field_violations(path: str, value: Struct) -> tuple[list[str], int]:
+        """Return the Field limits violated by a Struct, and the length of its Embeds."""
+        violations: list[str] = []
+        pending: list[tuple[str, Any]] = [(path, value)]
+        embed_length: int = 0
+
+        while pending:
+            path, entry = pending.pop()
+
+            if isinstance(entry, Measurement):
+                violations.extend(
+                    [f"{path}{violation}" for violation in entry.violations]
+                )
+
+                if issubclass(entry.kind, Embed):
+                    embed_length += entry.length
+
+                continue
+            elif isinstance(entry, Embed):
+                embed_length += entry.refresh_length()
+
+            constraints: tuple[Constraint, ...] | None = _INDEX.get(type(entry))
+
+            if constraints is None:
+                Preflight.index(type(entry))
+
+                constraints = _INDEX[type(entry)]
+
+            children: list[tuple[str, Any]] = []
+
+            for constraint in constraints:
+                attr: Any = getattr(entry, constraint.name, UNSET)
+
+                if attr is UNSET:
+                    continue
+
+                location: str = f"{path}.{constraint.name}"
+
+                if isinstance(attr, (str, list)):
+                    if (constraint.min_length is not None) and (
+                        len(attr) < constraint.min_length
+                    ):
+                        violations.append(
+                            f"{location} has length {len(attr):,} (minimum {constraint.min_length:,})"
+                        )
+                    elif (constraint.max_length is not None) and (
+                        len(attr) > constraint.max_length
+                    ):
+                        violations.append(
+                            f"{location} has length {len(attr):,} (maximum {constraint.max_length:,})"
+                        )
+                elif isinstance(attr, (int, float)):
+                    if (constraint.ge is not None) and (attr < constraint.ge):
+                        violations.append(
+                            f"{location} is {attr:,} (minimum {constraint.ge:,})"
+                        )
+                    elif (constraint.le is not None) and (attr > constraint.le):
+                        violations.append(
+                            f"{location} is {attr:,} (maximum {constraint.le:,})"
+                        )
+
+                if not constraint.nested:
+                    continue
+
+                # Fragments were measured as the Struct they were frozen from
+                if isinstance(attr, Raw):
+                    attr = Preflight._get_measurement(attr, constraint.fragment)
+
+                if isinstance(attr, Struct):
+                    children.append((location, attr))
+                elif isinstance(attr, list):
+                    for idx, item in enumerate(attr):
+                        if isinstance(item, Raw):
+                            item = Preflight._get_measurement(item, constraint.fragment)
+
+                        if isinstance(item, Struct):
+                            children.append((f"{location}[{idx}]", item))
+
+            # Reversed so that violations are reported in order
+            pending.extend(reversed(children))
+
+        return violations, embed_length
+
+    @staticmethod
+    def _get_measurement(fragment: Raw, kind: Any) -> Measurement | None:
+        """Return the Measurement of a fragment, measuring it if it was not retained."""
+        measurement: Measurement | None = Fragment.get_measurement(fragment, kind)
+
+        if measurement is None:
+            # Not frozen by freeze, or since evicted, so it is decoded and measured once
+            value: Struct | None = Fragment.thaw(fragment, kind)
+
+            if value is None:
+                return
+
+            measurement = Preflight.measure(value)
+
+            Fragment.set_measurement(fragment, measurement)
+
+        return measurement
+
+    @staticmethod
+    def _get_constraint(name: str, info: Type) -> Constraint | None:
+        """Return the Constraint declared by a Field type, if any."""
+        options: tuple[Type, ...] = (
+            info.types if isinstance(info, UnionType) else (info,)
+        )
+        limits: dict[str, int | float] = {}
+        nested: bool = False
+        structs: list[type] = []
+        raw: bool = False
+
+        for option in options:
+            if isinstance(option, (StrType, ListType)):
+                if option.min_length is not None:
+                    limits["min_length"] = option.min_length
+
+                if option.max_length is not None:
+                    limits["max_length"] = option.max_length
+            elif isinstance(option, (IntType, FloatType)):
+                if option.ge is not None:
+                    limits["ge"] = option.ge
+
+                if option.le is not None:
+                    limits["le"] = option.le
+
+            if isinstance(option, StructType) or (
+                isinstance(option, ListType)
+                and isinstance(option.item_type, (StructType, UnionType))
+            ):
+                nested = True
+
+            # A fragment is thawed as the Structs it is declared alongside
+            items: Type = option.item_type if isinstance(option, ListType) else option
+
+            for item in items.types if isinstance(items, UnionType) else (items,):
+                if isinstance(item, StructType):
+                    structs.append(item.cls)
+                elif isinstance(item, RawType):
+                    raw = True
+
+        if not limits and not nested:
+            return
+
+        return Constraint(
+            name=name,
+            nested=nested,
+            fragment=Union[tuple(structs)] if raw and structs else None,
+            **limits,
+        )
+
+
+Preflight.index(
+    Attachment,
+    Embed,
+    Poll,
+    ActionRow,
+    Container,
+    File,
+    LinkButton,
+    MediaGallery,
+    MediaGalleryItem,
+    Section,
+    Seperator,
+    TextDisplay,
+    Thumbnail,
+)
@@ -0,0 +1,178 @@
+"""Define the Profiler class and its associates."""
+
+from typing import Any, Self
+
+import msgspec
+from msgspec import UNSET, Raw, Struct
+
+
+class PayloadNode(Struct, kw_only=True):
+    """
+    Represent the encoded size of a part of a Webhook payload.
+
+    Attributes:
+        path (str): Location of the part within the payload, such as
+            embeds[0].fields[1].
+
+        size (int): Number of bytes the part encodes to.
+
+        children (list[PayloadNode]): The nested parts, such as the Fields of an Embed
+            or the Components of a Container.
+    """
+
+    path: str = msgspec.field()
+    """Location of the part within the payload."""
+
+    size: int = msgspec.field()
+    """Number of bytes the part encodes to."""
+
+    children: list["PayloadNode"] = msgspec.field(default_factory=list)
+    """The nested parts, such as the Fields of an Embed or the Components of a Container."""
+
+
+class PayloadProfile(Struct, kw_only=True):
+    """
+    Represent the encoded size of a Webhook payload, broken down by part.
+
+    Attributes:
+        size (int): Number of bytes in the encoded JSON payload.
+
+        fields (list[PayloadNode]): The size of each top-level field of the payload.
+
+        attachments (dict[str, int]): Number of bytes of each file Attachment, keyed by
+            filename.
+    """
+
+    size: int = msgspec.field(default=0)
+    """Number of bytes in the encoded JSON payload."""
+
+    fields: list[PayloadNode] = msgspec.field(default_factory=list)
+    """The size of each top-level field of the payload."""
+
+    attachments: dict[str, int] = msgspec.field(default_factory=dict)
+    """Number of bytes of each file Attachment, keyed by filename."""
+
+    def get_total(self: Self) -> int:
+        """
+        Return the number of bytes in the payload, including file Attachments.
+
+        Returns:
+            total (int): The combined size of the payload and file Attachments.
+        """
+        return self.size + sum(self.attachments.values())
+
+    def get_largest(self: Self, count: int = 10) -> list[PayloadNode]:
+        """
+        Return the largest parts of the payload, at any depth.
+
+        Arguments:
+            count (int): Maximum number of parts to return.
+
+        Returns:
+            nodes (list[PayloadNode]): The largest parts, in descending order of size.
+        """
+        nodes: list[PayloadNode] = []
+        pending: list[PayloadNode] = list(self.fields)
+
+        while pending:
+            node: PayloadNode = pending.pop()
+
+            nodes.append(node)
+            pending.extend(node.children)
+
+        return sorted(nodes, key=lambda node: node.size, reverse=True)[:count]
+
+
+class Profiler:
+    """
+    Define static methods for measuring the encoded size of Webhook payloads.
+
+    A payload is encoded bottom-up, with each nested Struct encoded once and spliced
+    into its parent as-is, so that the size of every part is measured in the same pass
+    which produces the request body.
+    """
+
+    @staticmethod
+    def encode(payload: dict[str, Any], profile: PayloadProfile) -> bytes:
+        """
+        Encode the provided payload, recording the size of each part.
+
+        Arguments:
+            payload (dict[str, Any]): The fields of a Webhook to encode.
+
+            profile (PayloadProfile): The Payload Profile to record sizes to.
+
+        Returns:
+            data (bytes): The encoded payload, identical to encoding it directly.
+        """
+        spliced: dict[str, Raw] = {}
+
+        for name, value in payload.items():
+            children: list[PayloadNode] = []
+            raw: Raw = Profiler._splice(value, name, children)
+
+            spliced[name] = raw
+
+            profile.fields.append(
+                PayloadNode(path=name, size=len(raw), children=children)
+            )
+
+        data: bytes = msgspec.json.encode(spliced)
+
+        profile.size = len(data)
+
+        return data
+
+    @staticmethod
+    def _splice(value: Any, path: str, nodes: list[PayloadNode]) -> Raw:
+        """Encode a value, splicing in each nested Struct as it is measured."""
+        if isinstance(value, Raw):
+            return value
+        elif isinstance(value, Struct):
+            data: dict[str, Any] = {}
+            tag_field: str | None = value.__struct_config__.tag_field
+
+            # The tag precedes the fields, as when msgspec encodes a Struct
+            if tag_field is not None:
+                data[tag_field] = value.__struct_config__.tag
+
+            for name, key in zip(
+                value.__struct_fields__, value.__struct_encode_fields__
+            ):
+                field: Any = getattr(value, name)
+
+                if field is not UNSET:
+                    data[key] = Profiler._get_child(field, f"{path}.{name}", nodes)
+
+            return Raw(msgspec.json.encode(data))
+        elif isinstance(value, list):
+            return Raw(
+                msgspec.json.encode(
+                    [
+                        Profiler._get_child(item, f"{path}[{idx}]", nodes)
+                        for idx, item in enumerate(value)
+                    ]
+                )
+            )
+
+        return Raw(msgspec.json.encode(value))
+
+    @staticmethod
+    def _get_child(value: Any, path: str, nodes: list[PayloadNode]) -> Any:
+        """Return a nested value, measuring it first if it is a Struct or fragment."""
+        if isinstance(value, Struct | Raw):
+            children: list[PayloadNode] = []
+            raw: Raw = Profiler._splice(value, path, children)
+
+            nodes.append(PayloadNode(path=path, size=len(raw), children=children))
+
+            return raw
+        elif isinstance(value, list) and any(
+            isinstance(item, Struct | Raw) for item in value
+        ):
+            return [
+                Profiler._get_child(item, f"{path}[{idx}]", nodes)
+                for idx, item in enumerate(value)
+            ]
+
+        return value
@@ -0,0 +1,135 @@
+"""Define the Result class and its associates."""
+
+from datetime import timedelta
+from time import monotonic
+from typing import Any
+
+import msgspec
+from msgspec import Struct
+from niquests import Response
+
+
+class Timing(Struct, kw_only=True):
+    """
+    Represent a breakdown of where the time of a request sent by a Webhook was spent.
+
+    The connection stages are reported by niquests for the final attempt, and are None
+    when unavailable, such as the TLS handshake of an unencrypted connection.
+
+    Attributes:
+        build (float): Seconds spent collecting the payload of the request.
+
+        encode (float): Seconds spent encoding the payload and Attachments.
+
+        dns (float | None): Seconds spent resolving the hostname.
+
+        connect (float | None): Seconds spent establishing the connection.
+
+        tls (float | None): Seconds spent on the TLS handshake.
+
+        upload (float | None): Seconds spent sending the request.
+
+        ttfb (float | None): Seconds spent waiting for the first byte of the Response
+            once the request was sent.
+
+        sleep (float): Seconds slept due to rate limits.
+
+        total (float): Seconds from building the request to receiving the Response.
+
+        attempts (int): Number of times the request was sent.
+    """
+
+    build: float = msgspec.field(default=0.0)
+    """Seconds spent collecting the payload of the request."""
+
+    encode: float = msgspec.field(default=0.0)
+    """Seconds spent encoding the payload and Attachments."""
+
+    dns: float | None = msgspec.field(default=None)
+    """Seconds spent resolving the hostname."""
+
+    connect: float | None = msgspec.field(default=None)
+    """Seconds spent establishing the connection."""
+
+    tls: float | None = msgspec.field(default=None)
+    """Seconds spent on the TLS handshake."""
+
+    upload: float | None = msgspec.field(default=None)
+    """Seconds spent sending the request."""
+
+    ttfb: float | None = msgspec.field(default=None)
+    """Seconds spent waiting for the first byte of the Response."""
+
+    sleep: float = msgspec.field(default=0.0)
+    """Seconds slept due to rate limits."""
+
+    total: float = msgspec.field(default=0.0)
+    """Seconds from building the request to receiving the Response."""
+
+    attempts: int = msgspec.field(default=0)
+    """Number of times the request was sent."""
+
+    _start: float = msgspec.field(default_factory=monotonic)
+    """Monotonic time the request began to be built."""
+
+
+class Result(Response):
+    """
+    Represent the Response to a request sent by a Webhook, with a Timing breakdown.
+
+    A Result is a Response, so it may be used wherever a Response is expected.
+
+    Attributes:
+        timing (Timing): Breakdown of where the time of the request was spent.
+    """
+
+    timing: Timing
+    """Breakdown of where the time of the request was spent."""
+
+    @staticmethod
+    def wrap(res: Response, timing: Timing) -> "Result":
+        """
+        Return a Result for the provided Response, completing its Timing breakdown.
+
+        Arguments:
+            res (Response): The Response to the final attempt of the request.
+
+            timing (Timing): The breakdown recorded while building and sending.
+
+        Returns:
+            result (Result): The Response as a Result.
+        """
+        timing.total = monotonic() - timing._start
+
+        conn_info: Any = res.conn_info
+
+        if conn_info is not None:
+            timing.dns = Result._get_seconds(conn_info.resolution_latency)
+            timing.connect = Result._get_seconds(conn_info.established_latency)
+            timing.tls = Result._get_seconds(conn_info.tls_handshake_latency)
+            timing.upload = Result._get_seconds(conn_info.request_sent_latency)
+
+        if res.elapsed is not None:
+            # The elapsed time of a Response includes every stage before it
+            timing.ttfb = max(
+                res.elapsed.total_seconds()
+                - sum(
+                    stage or 0.0
+                    for stage in (timing.dns, timing.connect, timing.tls, timing.upload)
+                ),
+                0.0,
+            )
+
+        result: Result = Result.__new__(Result)
+        result.__dict__.update(res.__dict__)
+        result.timing = timing
+
+        return result
+
+    @staticmethod
+    def _get_seconds(latency: timedelta | None) -> float | None:
+        """Return a latency reported by niquests in seconds."""
+        if latency is None:
+            return None
+
+        return latency.total_seconds()
@@ -0,0 +1,196 @@
+"""Define the Suppressor class and its associates."""
+
+import logging
+import re
+from collections import OrderedDict
+from re import Pattern
+from time import time
+from typing import Any, Final, Self
+
+import msgspec
+from msgspec import Struct
+
+VARIABLE_PATTERN: Final[Pattern[str]] = re.compile(
+    r"0x[0-9a-fA-F]+|\b[0-9a-fA-F]{8,}\b|\d+(?:\.\d+)?"
+)
+"""Match the variable parts of a log message, such as numbers, hex values, and IDs."""
+
+
+class Repeat(Struct, kw_only=True):
+    """
+    Represent a log record which is being repeated within a window.
+
+    Attributes:
+        start (float): Time the window started, in seconds since the epoch.
+
+        count (int): Number of repeats suppressed within the window.
+
+        record (logging.LogRecord): The first log record of the window.
+    """
+
+    start: float = msgspec.field()
+    """Time the window started, in seconds since the epoch."""
+
+    count: int = msgspec.field(default=0)
+    """Number of repeats suppressed within the window."""
+
+    record: Any = msgspec.field()
+    """The first log record of the window."""
+
+
+class Suppressor:
+    """
+    Represent a stage which suppresses repeated log records and summarizes them.
+
+    Log records are fingerprinted by their logger, level, and message template, or
+    their message with numbers and IDs normalized when no template is available. The
+    first record of each fingerprint within a window passes through, and any repeats are
+    counted. Once the window ends, a single summary record reports the number of
+    repeats. The least recently seen fingerprints are evicted, and summarized, once the
+    capacity is reached.
+
+    Attributes:
+        window (float): Number of seconds repeats of a record are counted for.
+
+        capacity (int): Maximum number of fingerprints to retain.
+    """
+
+    def __init__(self: Self, window: float = 60.0, capacity: int = 1024) -> None:
+        """
+        Initialize a Suppressor.
+
+        Arguments:
+            window (float): Number of seconds repeats of a record are counted for.
+
+            capacity (int): Maximum number of fingerprints to retain.
+        """
+        self.window: float = window
+        self.capacity: int = capacity
+
+        self._repeats: OrderedDict[tuple[str, int, str], Repeat] = OrderedDict()
+        self._suppressed: int = 0
+
+    def add(
+        self: Self,
+        record: logging.LogRecord,
+        fingerprint: tuple[str, int, str] | None = None,
+    ) -> list[logging.LogRecord]:
+        """
+        Pass a log record through the Suppressor.
+
+        Arguments:
+            record (LogRecord): The log record to pass through.
+
+            fingerprint (tuple[str, int, str] | None): The fingerprint of the record,
+                if taken before its message was formatted. Defaults to that of the
+                record.
+
+        Returns:
+            records (list[LogRecord]): The records to send, which may include a summary
+                of an earlier window. Empty if the record was suppressed.
+        """
+        key: tuple[str, int, str] = fingerprint or Suppressor.get_fingerprint(record)
+        repeat: Repeat | None = self._repeats.get(key)
+
+        if (repeat is not None) and (record.created - repeat.start < self.window):
+            repeat.count += 1
+            self._suppressed += 1
+
+            self._repeats.move_to_end(key)
+
+            return []
+
+        records: list[logging.LogRecord] = []
+
+        if repeat is not None:
+            records.extend(self._summarize(repeat))
+
+        self._repeats[key] = Repeat(start=record.created, record=record)
+
+        self._repeats.move_to_end(key)
+        records.append(record)
+
+        while len(self._repeats) > self.capacity:
+            records.extend(self._summarize(self._repeats.popitem(last=False)[1]))
+
+        return records
+
+    def expire(
+        self: Self, now: float | None = None, force: bool = False
+    ) -> list[logging.LogRecord]:
+        """
+        Summarize the repeats of every window which has ended.
+
+        Arguments:
+            now (float | None): The current time, in seconds since the epoch. Defaults
+                to the current system time.
+
+            force (bool): Summarize the repeats of every window, even if it has not
+                ended, such as before shutting down.
+
+        Returns:
+            records (list[LogRecord]): A summary record for each window with repeats.
+        """
+        if not self._suppressed:
+            return []
+
+        if now is None:
+            now = time()
+
+        records: list[logging.LogRecord] = []
+
+        for key, repeat in list(self._repeats.items()):
+            if repeat.count and (force or (now - repeat.start >= self.window)):
+                records.extend(self._summarize(repeat))
+
+                del self._repeats[key]
+
+        return records
+
+    def is_pending(self: Self) -> bool:
+        """
+        Return whether any repeats are waiting to be summarized.
+
+        Returns:
+            pending (bool): True if any repeats have been suppressed.
+        """
+        return self._suppressed > 0
+
+    @staticmethod
+    def get_fingerprint(record: logging.LogRecord) -> tuple[str, int, str]:
+        """
+        Return the fingerprint used to identify repeats of a log record.
+
+        Arguments:
+            record (LogRecord): The log record to fingerprint.
+
+        Returns:
+            fingerprint (tuple[str, int, str]): The logger name, level, and normalized
+                message template.
+        """
+        template: str = (
+            record.msg
+            if isinstance(record.msg, str) and record.args
+            else record.getMessage()
+        )
+
+        return (record.name, record.levelno, VARIABLE_PATTERN.sub("#", template))
+
+    def _summarize(self: Self, repeat: Repeat) -> list[logging.LogRecord]:
+        """Return a summary record of the repeats within a window, if any."""
+        if not repeat.count:
+            return []
+
+        self._suppressed -= repeat.count
+
+        summary: logging.LogRecord = logging.makeLogRecord(repeat.record.__dict__)
+        summary.msg = (
+            f"{repeat.record.getMessage()} ×{repeat.count:,} in the last "
+            f"{self.window:g}s"
+        )
+        summary.args = None
+        summary.exc_info = None
+        summary.exc_text = None
+        summary.created = time()
+
+        return [summary]
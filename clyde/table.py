@@ -0,0 +1,238 @@
+"""Define the Table class and its associates."""
+
+from itertools import chain
+from typing import Any, Iterable, Iterator, Mapping, Sequence, TypeAlias
+
+from clyde.embed import EmbedField
+from clyde.markdown import Markdown
+from clyde.pagination import CODE_FENCE
+from clyde.validation import Validation
+from clyde.webhook import Webhook
+
+TableRows: TypeAlias = (
+    Iterable[Mapping[str, Any] | Sequence[Any]] | Mapping[str, Sequence[Any]]
+)
+"""Rows of mappings or sequences, or a mapping of column names to columns."""
+
+
+class Table:
+    """
+    Define static methods for rendering tabular data as aligned monospace tables.
+
+    Tables are rendered within Markdown code blocks and split into pages which fit the
+    length limit of the message content or an Embed Field value. The header is repeated
+    at the top of every page. Rows are consumed in a single pass as each page is built,
+    so each page is aligned to the widest cells among its own rows.
+    """
+
+    @staticmethod
+    def render(
+        rows: TableRows,
+        columns: Sequence[str] | None = None,
+        limit: int | None = None,
+        highlight: str | None = None,
+    ) -> list[str]:
+        """
+        Render the provided rows as pages of an aligned table.
+
+        A ValueError is raised if a row does not fit on a page by itself, rather than
+        cutting its cells, if a row of values differs in length from the columns, or if
+        the columns of columnar input differ in length.
+
+        Arguments:
+            rows (TableRows): An iterable of rows, each a mapping of column names to
+                values or a sequence of values. Alternatively, a mapping of column names
+                to sequences of values (columnar input), which avoids building a
+                mapping per row.
+
+            columns (Sequence[str] | None): Names of the columns, in order. Defaults to
+                the keys of the first row, or of a columnar mapping. Required for rows
+                which are sequences.
+
+            limit (int | None): Maximum length of each page, including the code block.
+                Defaults to the message content length limit.
+
+            highlight (str | None): The language for syntax highlighting.
+
+        Returns:
+            pages (list[str]): The table, split into code blocks within the limit.
+        """
+        if limit is None:
+            limit = Validation.get_max_length(Webhook, "content") or 2000
+
+        names, cells = Table._get_rows(rows, columns)
+
+        if not names:
+            return []
+
+        # Reserve room for the code block around each page
+        budget: int = limit - len(Markdown.code_block("", highlight))
+        widths: list[int] = [len(name) for name in names]
+        pages: list[str] = []
+        page: list[list[str]] = []
+
+        if Table._get_length(widths, 0) > budget:
+            raise ValueError(f"Table header does not fit within the limit of {limit:,}")
+
+        for number, row in enumerate(cells, start=1):
+            grown: list[int] = [
+                max(width, len(cell)) for width, cell in zip(widths, row)
+            ]
+
+            if page and (Table._get_length(grown, len(page) + 1) > budget):
+                pages.append(Table._get_page(names, page, widths, highlight))
+
+                page = []
+                grown = [max(len(name), len(cell)) for name, cell in zip(names, row)]
+
+            if Table._get_length(grown, len(page) + 1) > budget:
+                raise ValueError(
+                    f"Row {number:,} does not fit within the limit of {limit:,}"
+                )
+
+            page.append(row)
+            widths = grown
+
+        if page or (not pages):
+            pages.append(Table._get_page(names, page, widths, highlight))
+
+        return pages
+
+    @staticmethod
+    def render_fields(
+        name: str,
+        rows: TableRows,
+        columns: Sequence[str] | None = None,
+        inline: bool | None = None,
+        highlight: str | None = None,
+    ) -> list[EmbedField]:
+        """
+        Render the provided rows as an aligned table split across Embed Fields.
+
+        Arguments:
+            name (str): Name of each Embed Field.
+
+            rows (TableRows): An iterable of rows, each a mapping of column names to
+                values or a sequence of values. Alternatively, a mapping of column names
+                to sequences of values (columnar input).
+
+            columns (Sequence[str] | None): Names of the columns, in order.
+
+            inline (bool | None): Whether or not the Embed Fields should display inline.
+
+            highlight (str | None): The language for syntax highlighting.
+
+        Returns:
+            fields (list[EmbedField]): The table, one page per Embed Field.
+        """
+        pages: list[str] = Table.render(
+            rows, columns, Validation.get_max_length(EmbedField, "value"), highlight
+        )
+        fields: list[EmbedField] = []
+
+        for page in pages:
+            field: EmbedField = EmbedField(name=name, value=page)
+
+            if inline is not None:
+                field.inline = inline
+
+            fields.append(field)
+
+        return fields
+
+    @staticmethod
+    def _get_rows(
+        rows: TableRows, columns: Sequence[str] | None
+    ) -> tuple[list[str], Iterator[list[str]]]:
+        """Return the column names and an iterator of the cells of each row as strings."""
+        if isinstance(rows, Mapping):
+            names: list[str] = list(columns if columns is not None else rows.keys())
+
+            if len({len(rows[name]) for name in names}) > 1:
+                raise ValueError("Columns of columnar input differ in length")
+
+            return names, (
+                [Table._get_cell(value) for value in row]
+                for row in zip(*[rows[name] for name in names])
+            )
+
+        remaining: Iterator[Any] = iter(rows)
+        first: Any = next(remaining, None)
+
+        if columns is None:
+            if first is None:
+                return [], iter(())
+            elif not isinstance(first, Mapping):
+                raise ValueError("Column names are required for rows of sequences")
+
+            columns = list(first.keys())
+
+        names = list(columns)
+
+        if first is None:
+            return names, iter(())
+
+        entries: Iterator[Any] = chain([first], remaining)
+
+        if isinstance(first, Mapping):
+            return names, (
+                [Table._get_cell(row.get(name, "")) for name in names]
+                for row in entries
+            )
+
+        return names, (Table._get_sequence(row, len(names)) for row in entries)
+
+    @staticmethod
+    def _get_sequence(row: Sequence[Any], count: int) -> list[str]:
+        """Return the cells of a row which is a sequence, one per column, as strings."""
+        if len(row) != count:
+            raise ValueError(f"Row has {len(row):,} values for {count:,} columns")
+
+        return [Table._get_cell(value) for value in row]
+
+    @staticmethod
+    def _get_length(widths: list[int], count: int) -> int:
+        """Return the greatest length of a page of rows, with its header and divider."""
+        return (count + 2) * (sum(widths) + 3 * (len(widths) - 1) + 1) - 1
+
+    @staticmethod
+    def _get_page(
+        names: list[str],
+        page: list[list[str]],
+        widths: list[int],
+        highlight: str | None,
+    ) -> str:
+        """Return a page of rows, aligned to the widths, as a code block."""
+        lines: list[str] = [
+            " | ".join(
+                [name.ljust(width) for name, width in zip(names, widths)]
+            ).rstrip(),
+            "-+-".join(["-" * width for width in widths]),
+        ]
+
+        for row in page:
+            lines.append(
+                " | ".join(
+                    [cell.ljust(width) for cell, width in zip(row, widths)]
+                ).rstrip()
+            )
+
+        return Markdown.code_block("\n".join(lines), highlight)
+
+    @staticmethod
+    def _get_cell(value: Any) -> str:
+        """Return a value as a single-line table cell."""
+        if value is None:
+            return ""
+
+        cell: str = value if isinstance(value, str) else str(value)
+
+        if "\n" in cell:
+            cell = cell.replace("\n", " ")
+
+        # A code fence within a cell would otherwise close the code block, so its
+        # backticks are replaced with a lookalike of the same width
+        if CODE_FENCE in cell:
+            cell = cell.replace("`", "\u02cb")
+
+        return cell
@@ -2,6 +2,11 @@
 
 from datetime import datetime
 from enum import StrEnum
+from functools import lru_cache
+from typing import Any, Final, Iterable
+
+ISO_CACHE_SIZE: Final[int] = 4096
+"""Maximum number of parsed ISO 8601 strings to retain."""
 
 
 class TimestampStyles(StrEnum):
@@ -56,15 +61,63 @@ class Timestamp:
         Returns:
             timestamp (str): The formatted timestamp.
         """
-        if isinstance(value, float):
+        if isinstance(value, bool):
+            raise TypeError(f"Timestamp {value} is a bool, not a number of seconds")
+        elif isinstance(value, float):
             value = int(value)
         elif isinstance(value, str):
-            value = int(datetime.fromisoformat(value).timestamp())
+            value = Timestamp._parse(value)
         elif isinstance(value, datetime):
             value = int(value.timestamp())
 
         return f"<t:{value}:{style}>"
 
+    @staticmethod
+    def timestamps(
+        values: Iterable[int | float | str | datetime] | Any, style: TimestampStyles
+    ) -> list[str]:
+        """
+        Format each of the provided timestamps to display in the user's timezone.
+
+        An array-like of epoch seconds, such as a NumPy array or pandas Series, is
+        converted to integers in a single vectorized operation. Repeated ISO 8601
+        strings are only parsed once.
+
+        Arguments:
+            values (Iterable[int | float | str | datetime] | Any): The timestamps
+                expressed in seconds, or an array-like of epoch seconds.
+
+            style (TimestampStyles): A Timestamp Style.
+
+        Returns:
+            timestamps (list[str]): The formatted timestamps, in order.
+        """
+        suffix: str = f":{style}>"
+
+        if hasattr(values, "astype") and hasattr(values, "tolist"):
+            return [
+                "<t:" + str(value) + suffix for value in values.astype("int64").tolist()
+            ]
+
+        tokens: list[str] = []
+
+        for value in values:
+            if type(value) is not int:
+                if isinstance(value, bool):
+                    raise TypeError(
+                        f"Timestamp {value} is a bool, not a number of seconds"
+                    )
+                elif isinstance(value, float):
+                    value = int(value)
+                elif isinstance(value, str):
+                    value = Timestamp._parse(value)
+                elif isinstance(value, datetime):
+                    value = int(value.timestamp())
+
+            tokens.append("<t:" + str(value) + suffix)
+
+        return tokens
+
     @staticmethod
     def short_time(value: int | float | str | datetime) -> str:
         """
@@ -169,3 +222,9 @@ class Timestamp:
             timestamp (str): The formatted timestamp.
         """
         return Timestamp.timestamp(value, TimestampStyles.RELATIVE_TIME)
+
+    @staticmethod
+    @lru_cache(maxsize=ISO_CACHE_SIZE)
+    def _parse(value: str) -> int:
+        """Return the epoch seconds of an ISO 8601 string."""
+        return int(datetime.fromisoformat(value).timestamp())
@@ -1,10 +1,13 @@
 """Define the Validation class and its associates."""
 
 from datetime import datetime
+from functools import cache
 
 from msgspec import Meta, Struct, inspect
 from msgspec.inspect import Field, StrType, StructType, Type, type_info
 
+from clyde.markdown import Markdown
+
 
 class Validation:
     """Define static methods for reusable data validation and conversion."""
@@ -70,6 +73,7 @@ class Validation:
         return value
 
     @staticmethod
+    @cache
     def get_max_length(struct: object, field_name: str) -> int | None:
         """
         Return the maximum string length of a Struct Field.
@@ -97,3 +101,30 @@ class Validation:
                 continue
 
             return getattr(field_info, "max_length")
+
+    @staticmethod
+    def truncate(
+        struct: object, field_name: str, value: str, ellipsis: str = "…"
+    ) -> str:
+        """
+        Truncate a string to the maximum length of a Struct Field without breaking Markdown.
+
+        Arguments:
+            struct (Struct): A msgspec Struct.
+
+            field_name (str): Name of the Field the value is intended for.
+
+            value (str): The string to truncate.
+
+            ellipsis (str): String appended to a truncated value. Default is "…".
+
+        Returns:
+            value (str): The string, truncated to the maximum length of the Field
+                if available.
+        """
+        max_len: int | None = Validation.get_max_length(struct, field_name)
+
+        if max_len is None:
+            return value
+
+        return Markdown.truncate(value, max_len, ellipsis)
@@ -1,18 +1,19 @@
 """Define the Webhook class and its associates."""
 
-import logging
 from asyncio import sleep as async_sleep
 from enum import IntEnum, StrEnum
+from hashlib import blake2b
 from pathlib import Path
-from time import sleep
-from typing import Annotated, Any, Iterable, Literal, Self, Tuple, TypeAlias
+from time import monotonic, sleep
+from typing import Annotated, Any, Final, Iterable, Literal, Self, TypeAlias
 
 import msgspec
 import niquests
-from msgspec import UNSET, Meta, Struct, UnsetType
+from msgspec import UNSET, Meta, Raw, Struct, UnsetType
 from niquests import AsyncSession, Response, Session
 
 from clyde.attachment import Attachment
+from clyde.component import Component
 from clyde.components.action_row import ActionRow
 from clyde.components.container import Container
 from clyde.components.file import File
@@ -20,8 +21,16 @@ from clyde.components.media_gallery import MediaGallery
 from clyde.components.section import Section
 from clyde.components.seperator import Seperator
 from clyde.components.text_display import TextDisplay
-from clyde.embed import Embed
+from clyde.embed import EMBED_TOTAL_LENGTH_MAX, Embed
+from clyde.fragment import Fragment, Measurement
+from clyde.hooks import Hooks
+from clyde.log import LOGGER, Log
+from clyde.multipart import MultipartBody
+from clyde.pagination import Pagination
 from clyde.poll import Poll
+from clyde.preflight import Preflight
+from clyde.profiler import PayloadProfile, Profiler
+from clyde.result import Result, Timing
 from clyde.validation import Validation
 
 TopLevelComponent: TypeAlias = (
@@ -29,6 +38,17 @@ TopLevelComponent: TypeAlias = (
 )
 TopLevelComponents: TypeAlias = list[TopLevelComponent]
 
+ATTACHMENTS_DIGEST: Final[str] = "_attachments"
+"""Key of the digest of all Attachments among the encoded fields of a message."""
+
+EDIT_FIELDS: Final[frozenset[str]] = frozenset(
+    {"content", "embeds", "allowed_mentions", "components", "flags"}
+)
+"""Fields of a Webhook which may be changed when editing a message."""
+
+SENT_MAX: Final[int] = 1024
+"""Maximum number of messages whose encoded fields are retained for delta edits."""
+
 
 class AllowedMentionTypes(StrEnum):
     """
@@ -281,7 +301,7 @@ class MessageFlags(IntEnum):
     """Allows you to create fully Component-driven messages."""
 
 
-class Webhook(Struct, kw_only=True):
+class Webhook(Struct, kw_only=True, dict=True):
     """
     Represent a Discord Webhook object.
 
@@ -301,12 +321,12 @@ class Webhook(Struct, kw_only=True):
 
         tts (bool): True if this is a TTS message.
 
-        embeds (list[Embed]): Embedded rich content.
+        embeds (list[Embed | Raw]): Embedded rich content, or fragments of it.
 
         allowed_mentions (AllowedMentions): Allowed mentions for the message.
 
-        components (list[TopLevelComponent]): The Components to include with the
-            message.
+        components (list[TopLevelComponent | Raw]): The Components to include with
+            the message, or fragments of them.
 
         flags (int): Message Flags combined as a bitfield.
 
@@ -323,6 +343,12 @@ class Webhook(Struct, kw_only=True):
 
         _query_params (dict[str, str]): Additional query parameters to append to
             the URL.
+
+        _paginate (bool): Whether to split the content across multiple messages.
+
+        _sent (dict[str, dict[str, bytes]]): The encoded fields last sent to each
+            message ID, used by delta edits. Only the most recently edited messages
+            are retained.
     """
 
     url: str = msgspec.field()
@@ -342,15 +368,15 @@ class Webhook(Struct, kw_only=True):
     tts: UnsetType | bool = msgspec.field(default=UNSET)
     """True if this is a TTS message."""
 
-    embeds: UnsetType | Annotated[list[Embed], Meta(min_length=1, max_length=10)] = (
-        msgspec.field(default=UNSET)
-    )
+    embeds: (
+        UnsetType | Annotated[list[Embed | Raw], Meta(min_length=1, max_length=10)]
+    ) = msgspec.field(default=UNSET)
     """Embedded rich content."""
 
     allowed_mentions: UnsetType | AllowedMentions = msgspec.field(default=UNSET)
     """Allowed mentions for the message."""
 
-    components: UnsetType | list[TopLevelComponent] = msgspec.field(default=UNSET)
+    components: UnsetType | list[TopLevelComponent | Raw] = msgspec.field(default=UNSET)
     """The Components to include with the message."""
 
     flags: UnsetType | int = msgspec.field(default=UNSET)
@@ -371,60 +397,261 @@ class Webhook(Struct, kw_only=True):
     _query_params: dict[str, str] = {}
     """Additional query parameters to append to the URL."""
 
-    def execute(self: Self) -> Response:
+    _paginate: bool = False
+    """Whether to split the content across multiple messages."""
+
+    _sent: dict[str, dict[str, bytes]] = {}
+    """The encoded fields last sent to each message ID, used by delta edits."""
+
+    def execute(self: Self) -> Result:
         """
         Execute the current Webhook instance.
 
+        If the content is paginated, each page is executed in order as its own message.
+
         https://discord.com/developers/docs/resources/webhook#execute-webhook
 
         Returns:
-            res (Response): Response object for the execution request.
+            res (Result): Response object for the execution request, with a Timing
+                breakdown. If the content is paginated, the Result for the final page.
         """
         self._validate()
 
-        with Session() as ses:
-            req: dict[str, Any] = self._build_request()
-            res: Response = ses.post(self.url, **req)
-
-            logging.debug(f"{res.request=}")
-            logging.debug(f"{res.status_code=} {res.text=}")
+        pages: list[Webhook] = self._get_pages()
 
-            # HTTP 429 Too Many Requests
-            while res.status_code == 429:
-                sleep(self._ratelimit_retry(res))
+        with Session() as ses:
+            for idx, page in enumerate(pages):
+                timing: Timing = Timing()
+                res: Result = page._send(
+                    ses, "POST", self.url, page._build_request(timing=timing), timing
+                )
 
-                res = ses.post(self.url, **req)
+                page._continue_thread(res, pages[idx + 1 :])
 
-            return res.raise_for_status()
+            return res
 
-    async def execute_async(self: Self) -> Response:
+    async def execute_async(self: Self) -> Result:
         """
         Asynchronously execute the current Webhook instance.
 
+        If the content is paginated, each page is executed in order as its own message.
+
         https://discord.com/developers/docs/resources/webhook#execute-webhook
 
         Returns:
-            res (Response): Response object for the execution request.
+            res (Result): Response object for the execution request, with a Timing
+                breakdown. If the content is paginated, the Result for the final page.
+        """
+        self._validate()
+
+        pages: list[Webhook] = self._get_pages()
+
+        async with AsyncSession() as ses:
+            for idx, page in enumerate(pages):
+                timing: Timing = Timing()
+                res: Result = await page._send_async(
+                    ses, "POST", self.url, page._build_request(timing=timing), timing
+                )
+
+                page._continue_thread(res, pages[idx + 1 :])
+
+            return res
+
+    def edit(self: Self, message_id: str, delta: bool = False) -> Result | None:
+        """
+        Edit a message previously sent by the Webhook to match the current instance.
+
+        Only the content, Embeds, Allowed Mentions, Components, Flags, and Attachments
+        are edited. A thread ID set with set_thread_id is respected.
+
+        https://discord.com/developers/docs/resources/webhook#edit-webhook-message
+
+        Arguments:
+            message_id (str): ID of the message to edit.
+
+            delta (bool): Only send the fields which changed since the message was last
+                edited by this instance, and skip uploading unchanged Attachments.
+
+        Returns:
+            res (Result | None): Response object for the edit request, with a Timing
+                breakdown, or None if delta is set and nothing changed.
         """
         self._validate()
 
+        Preflight.validate(self)
+
+        timing: Timing = Timing()
+        req, sent = self._build_edit_request(message_id, delta, timing)
+
+        if req is None:
+            return
+
+        with Session() as ses:
+            res: Result = self._send(
+                ses, "PATCH", self._get_message_url(message_id), req, timing
+            )
+
+        self._set_sent(message_id, sent)
+
+        return res
+
+    async def edit_async(
+        self: Self, message_id: str, delta: bool = False
+    ) -> Result | None:
+        """
+        Asynchronously edit a message previously sent by the Webhook.
+
+        Only the content, Embeds, Allowed Mentions, Components, Flags, and Attachments
+        are edited. A thread ID set with set_thread_id is respected.
+
+        https://discord.com/developers/docs/resources/webhook#edit-webhook-message
+
+        Arguments:
+            message_id (str): ID of the message to edit.
+
+            delta (bool): Only send the fields which changed since the message was last
+                edited by this instance, and skip uploading unchanged Attachments.
+
+        Returns:
+            res (Result | None): Response object for the edit request, with a Timing
+                breakdown, or None if delta is set and nothing changed.
+        """
+        self._validate()
+
+        Preflight.validate(self)
+
+        timing: Timing = Timing()
+        req, sent = self._build_edit_request(message_id, delta, timing)
+
+        if req is None:
+            return
+
         async with AsyncSession() as ses:
-            req: dict[str, Any] = self._build_request()
-            res: Response = await ses.post(self.url, **req)
+            res: Result = await self._send_async(
+                ses, "PATCH", self._get_message_url(message_id), req, timing
+            )
+
+        self._set_sent(message_id, sent)
 
-            logging.debug(f"{res.request=}")
-            logging.debug(f"{res.status_code=} {res.text=}")
+        return res
 
-            # HTTP 429 Too Many Requests
-            while res.status_code == 429:
-                await async_sleep(self._ratelimit_retry(res))
+    def get_message(self: Self, message_id: str) -> Result:
+        """
+        Get a message previously sent by the Webhook.
 
-                res = await ses.post(self.url, **req)
+        A thread ID set with set_thread_id is respected.
 
-            return res.raise_for_status()
+        https://discord.com/developers/docs/resources/webhook#get-webhook-message
+
+        Arguments:
+            message_id (str): ID of the message to get.
+
+        Returns:
+            res (Result): Response object containing the message.
+        """
+        with Session() as ses:
+            return self._send(
+                ses,
+                "GET",
+                self._get_message_url(message_id),
+                {"params": self._get_thread_params()},
+            )
+
+    async def get_message_async(self: Self, message_id: str) -> Result:
+        """
+        Asynchronously get a message previously sent by the Webhook.
+
+        A thread ID set with set_thread_id is respected.
+
+        https://discord.com/developers/docs/resources/webhook#get-webhook-message
+
+        Arguments:
+            message_id (str): ID of the message to get.
+
+        Returns:
+            res (Result): Response object containing the message.
+        """
+        async with AsyncSession() as ses:
+            return await self._send_async(
+                ses,
+                "GET",
+                self._get_message_url(message_id),
+                {"params": self._get_thread_params()},
+            )
+
+    def delete_message(self: Self, message_id: str) -> Result:
+        """
+        Delete a message previously sent by the Webhook.
+
+        A thread ID set with set_thread_id is respected.
+
+        https://discord.com/developers/docs/resources/webhook#delete-webhook-message
+
+        Arguments:
+            message_id (str): ID of the message to delete.
+
+        Returns:
+            res (Result): Response object for the delete request.
+        """
+        self._sent.pop(message_id, None)
+
+        with Session() as ses:
+            return self._send(
+                ses,
+                "DELETE",
+                self._get_message_url(message_id),
+                {"params": self._get_thread_params()},
+            )
+
+    async def delete_message_async(self: Self, message_id: str) -> Result:
+        """
+        Asynchronously delete a message previously sent by the Webhook.
+
+        A thread ID set with set_thread_id is respected.
+
+        https://discord.com/developers/docs/resources/webhook#delete-webhook-message
+
+        Arguments:
+            message_id (str): ID of the message to delete.
+
+        Returns:
+            res (Result): Response object for the delete request.
+        """
+        self._sent.pop(message_id, None)
+
+        async with AsyncSession() as ses:
+            return await self._send_async(
+                ses,
+                "DELETE",
+                self._get_message_url(message_id),
+                {"params": self._get_thread_params()},
+            )
+
+    def get_profile(self: Self) -> PayloadProfile:
+        """
+        Return the encoded size of the payload of the Webhook instance, broken down.
+
+        The payload is encoded exactly as it would be when executed, with the size of
+        each top-level field, Embed, Embed Field, Component, and file Attachment
+        recorded during that single encode. No Hook Events are emitted, as no request
+        is made.
+
+        Returns:
+            profile (PayloadProfile): The size of each part of the payload.
+        """
+        profile: PayloadProfile = PayloadProfile()
+
+        self._validate()
+        self._build_request(profile=profile, hooks=False)
+
+        return profile
 
     def set_content(
-        self: Self, content: UnsetType | str, fallback: bool = False
+        self: Self,
+        content: UnsetType | str,
+        fallback: bool = False,
+        paginate: bool = False,
+        truncate: bool = False,
     ) -> "Webhook":
         """
         Set the message content of the Webhook.
@@ -434,17 +661,30 @@ class Webhook(Struct, kw_only=True):
                 is cleared.
             fallback (bool): Set the content as a file Attachment if the message
                 length limit is exceeded.
+            paginate (bool): Split the content across multiple messages if the message
+                length limit is exceeded. Embeds, Components, Polls, and Attachments
+                are sent with the final message.
+            truncate (bool): Truncate the content to the message length limit without
+                breaking Markdown formatting.
 
         Returns:
             self (Webhook): The modified Webhook instance.
         """
-        if fallback and isinstance(content, str):
+        self._paginate = False
+
+        if truncate and isinstance(content, str):
+            content = Validation.truncate(Webhook, "content", content)
+
+        if (fallback or paginate) and isinstance(content, str):
             max_len: int | None = Validation.get_max_length(Webhook, "content")
 
             if isinstance(max_len, int) and (len(content) > max_len):
-                self.add_attachment("message.txt", content.encode())
+                if paginate:
+                    self._paginate = True
+                else:
+                    self.add_attachment("message.txt", content.encode())
 
-                return self
+                    return self
 
         self.content = content
 
@@ -492,12 +732,13 @@ class Webhook(Struct, kw_only=True):
 
         return self
 
-    def add_embed(self: Self, embed: Embed | list[Embed]) -> "Webhook":
+    def add_embed(self: Self, embed: Embed | Raw | list[Embed | Raw]) -> "Webhook":
         """
         Add embedded rich content to the Webhook instance.
 
         Arguments:
-            embed (Embed | list[Embed]): An Embed or list of Embeds.
+            embed (Embed | Raw | list[Embed | Raw]): An Embed, a fragment of one, or a
+                list of them.
 
         Returns:
             self (Webhook): The modified Webhook instance.
@@ -505,14 +746,20 @@ class Webhook(Struct, kw_only=True):
         if isinstance(self.embeds, UnsetType):
             self.embeds = []
 
-        if isinstance(embed, Embed):
-            self.embeds.append(embed)
-        else:
-            self.embeds.extend(embed)
+        length: int = self._get_fragment_length()
+        entries: list[Embed | Raw] = (
+            [embed] if isinstance(embed, Embed | Raw) else list(embed)
+        )
+
+        self.embeds.extend(entries)
+
+        self._fragment_length = length + Webhook._count_fragments(entries)
 
         return self
 
-    def remove_embed(self: Self, embed: Embed | list[Embed] | int) -> "Webhook":
+    def remove_embed(
+        self: Self, embed: Embed | Raw | list[Embed | Raw] | int
+    ) -> "Webhook":
         """
         Remove embedded rich content from the Webhook instance.
 
@@ -524,19 +771,77 @@ class Webhook(Struct, kw_only=True):
             self (Webhook): The modified Webhook instance.
         """
         if isinstance(self.embeds, list):
-            if isinstance(embed, Embed):
+            length: int = self._get_fragment_length()
+            removed: list[Embed | Raw] = []
+
+            if isinstance(embed, Embed | Raw):
                 self.embeds.remove(embed)
+
+                removed = [embed]
             elif isinstance(embed, int):
-                self.embeds.pop(embed)
+                removed = [self.embeds.pop(embed)]
             else:
+                removed = [entry for entry in self.embeds if entry in embed]
                 self.embeds = [entry for entry in self.embeds if entry not in embed]
 
+            self._fragment_length = length - Webhook._count_fragments(removed)
+
             # Do not retain an empty list
             if len(self.embeds) == 0:
                 self.embeds = UNSET
 
         return self
 
+    def get_embed_length(self: Self) -> int:
+        """
+        Return the number of characters counted towards the Embed length limit.
+
+        The length of Embed fragments is counted by add_embed and remove_embed as they
+        are added and removed. Embeds may still be modified once added, so the count
+        each Embed keeps is summed instead, without recounting their text. If the
+        Embeds are replaced directly, call refresh_embed_length to recount them.
+
+        Returns:
+            length (int): Combined length of all Embeds on the Webhook instance.
+        """
+        length: int = self._get_fragment_length()
+
+        if isinstance(self.embeds, list):
+            for embed in self.embeds:
+                if isinstance(embed, Embed):
+                    length += embed.get_length()
+
+        return length
+
+    def refresh_embed_length(self: Self) -> int:
+        """
+        Recount the characters of all Embeds towards the Embed length limit.
+
+        Returns:
+            length (int): Combined length of all Embeds on the Webhook instance.
+        """
+        length: int = 0
+
+        self._fragment_length: int = 0
+
+        if isinstance(self.embeds, list):
+            self._fragment_length = Webhook._count_fragments(self.embeds)
+
+            for embed in self.embeds:
+                if isinstance(embed, Embed):
+                    length += embed.refresh_length()
+
+        return self._fragment_length + length
+
+    def get_remaining_embed_length(self: Self) -> int:
+        """
+        Return the number of Embed characters that can be added to the Webhook instance.
+
+        Returns:
+            remaining (int): Characters remaining, negative if the limit is exceeded.
+        """
+        return EMBED_TOTAL_LENGTH_MAX - self.get_embed_length()
+
     def set_allowed_mentions(
         self: Self, allowed_mentions: UnsetType | AllowedMentions
     ) -> "Webhook":
@@ -555,14 +860,15 @@ class Webhook(Struct, kw_only=True):
         return self
 
     def add_component(
-        self: Self, component: TopLevelComponent | Iterable[TopLevelComponent]
+        self: Self,
+        component: TopLevelComponent | Raw | Iterable[TopLevelComponent | Raw],
     ) -> "Webhook":
         """
         Add a Component to the Webhook instance.
 
         Arguments:
-            component (TopLevelComponent | Iterable[TopLevelComponent]): A Component or
-                an iterable of Components.
+            component (TopLevelComponent | Raw | Iterable[TopLevelComponent | Raw]): A
+                Component, a fragment of one, or an iterable of them.
 
         Returns:
             self (Webhook): The modified Webhook instance.
@@ -575,7 +881,7 @@ class Webhook(Struct, kw_only=True):
 
         self._set_with_components(True)
 
-        if isinstance(component, TopLevelComponent):
+        if isinstance(component, TopLevelComponent | Raw):
             self.components.append(component)
         elif isinstance(component, Iterable):
             self.components.extend(component)
@@ -583,20 +889,21 @@ class Webhook(Struct, kw_only=True):
         return self
 
     def remove_component(
-        self: Self, component: TopLevelComponent | list[TopLevelComponent] | int
+        self: Self,
+        component: TopLevelComponent | Raw | list[TopLevelComponent | Raw] | int,
     ) -> "Webhook":
         """
         Remove a Component from the Webhook instance.
 
         Arguments:
-            component (TopLevelComponent | list[TopLevelComponent] | int): A Component,
-                list of Components, or an index to remove.
+            component (TopLevelComponent | Raw | list[TopLevelComponent | Raw] | int): A
+                Component, fragment, list of them, or an index to remove.
 
         Returns:
             self (Webhook): The modified Webhook instance.
         """
         if isinstance(self.components, list):
-            if isinstance(component, TopLevelComponent):
+            if isinstance(component, TopLevelComponent | Raw):
                 self.components.remove(component)
             elif isinstance(component, int):
                 self.components.pop(component)
@@ -621,18 +928,15 @@ class Webhook(Struct, kw_only=True):
             filename (str): Name of the file to attach.
 
             content (bytes | Path): Binary content of the file to attach.
-                If a Path is passed, the referenced file will be read.
+                If a Path is passed, the referenced file is read in chunks as the
+                request is sent, rather than held in memory.
 
             spoiler (bool): True if the file should be a spoiler (blurred).
 
         Returns:
             self (Webhook): The modified Webhook instance.
         """
-        if isinstance(content, Path):
-            with open(content, "rb") as handle:
-                content = handle.read()
-
-        attachment: Attachment = Attachment(filename=filename, content=content)
+        attachment: Attachment = Attachment(filename=filename).set_content(content)
 
         if spoiler:
             attachment.set_spoiler(True)
@@ -809,6 +1113,9 @@ class Webhook(Struct, kw_only=True):
         """Convert applicable data types prior to Webhook serialization."""
         if isinstance(self.embeds, list):
             for embed in self.embeds:
+                if isinstance(embed, Raw):
+                    continue
+
                 if not isinstance(embed.color, UnsetType):
                     embed.color = Validation.convert_color(embed.color)
 
@@ -816,35 +1123,478 @@ class Webhook(Struct, kw_only=True):
                     embed.timestamp = Validation.convert_timestamp(embed.timestamp)
 
         if isinstance(self.components, list):
-            for component in self.components:
+            # Fragments are skipped, as their colors were converted when frozen
+            for component in Component.walk(self.components, thaw=False):
                 if isinstance(component, Container):
                     if not isinstance(component.accent_color, UnsetType):
                         component.accent_color = Validation.convert_color(
                             component.accent_color
                         )
 
-    def _build_request(self: Self) -> dict[str, Any]:
+    def _get_fragment_length(self: Self) -> int:
+        """Return the combined length of the Embed fragments, counting it if unknown."""
+        if "_fragment_length" not in self.__dict__:
+            self.refresh_embed_length()
+
+        return self._fragment_length
+
+    @staticmethod
+    def _count_fragments(embeds: list[Embed | Raw]) -> int:
+        """Return the combined length of the Embed fragments among the Embeds."""
+        length: int = 0
+
+        for embed in embeds:
+            if not isinstance(embed, Raw):
+                continue
+
+            # A fragment was measured when it was frozen, so it is only decoded if not
+            measurement: Measurement | None = Fragment.get_measurement(embed, Embed)
+
+            if measurement is None:
+                thawed: Struct | None = Fragment.thaw(embed, Embed)
+
+                if isinstance(thawed, Embed):
+                    length += thawed.get_length()
+
+                continue
+
+            length += measurement.length
+
+        return length
+
+    def _get_payload(self: Self, edit: bool = False) -> dict[str, Any]:
+        """Return the fields of the Webhook instance which are sent to Discord."""
+        payload: dict[str, Any] = {}
+
+        for name in self.__struct_fields__:
+            if name == "url" or name.startswith("_"):
+                continue
+            elif edit and (name not in EDIT_FIELDS):
+                continue
+
+            value: Any = getattr(self, name)
+
+            if value is not UNSET:
+                payload[name] = value
+
+        return payload
+
+    def _get_pages(self: Self) -> list["Webhook"]:
+        """Return the validated messages to execute for the Webhook instance."""
+        pages: list[Webhook] = [self]
+
+        if self._paginate and isinstance(self.content, str):
+            max_len: int | None = Validation.get_max_length(Webhook, "content")
+            contents: list[str] = Pagination.split_content(
+                self.content, max_len or len(self.content)
+            )
+            pages = []
+
+            for idx, content in enumerate(contents):
+                if idx == len(contents) - 1:
+                    pages.append(
+                        msgspec.structs.replace(
+                            self,
+                            content=content,
+                            _query_params=dict(self._query_params),
+                        )
+                    )
+
+                    continue
+
+                # Only the final page carries the rest of the message
+                pages.append(
+                    msgspec.structs.replace(
+                        self,
+                        content=content,
+                        embeds=UNSET,
+                        components=UNSET,
+                        poll=UNSET,
+                        _attachments=[],
+                        _query_params=dict(self._query_params),
+                    )
+                )
+
+            if isinstance(self.thread_name, str) and (len(pages) > 1):
+                # The thread ID of the first page is required for the pages after it
+                pages[0].set_wait(True)
+
+        for page in pages:
+            Preflight.validate(page)
+
+        return pages
+
+    def _continue_thread(self: Self, res: Response, pages: list["Webhook"]) -> None:
+        """Direct the remaining pages to the thread created by the Webhook instance."""
+        if (not pages) or (not isinstance(self.thread_name, str)):
+            return
+
+        thread_id: str = res.json()["channel_id"]
+
+        for page in pages:
+            page.set_thread_name(UNSET)
+            page.set_thread_id(thread_id)
+
+    def _build_request(
+        self: Self,
+        edit: bool = False,
+        payload: dict[str, Any] | None = None,
+        upload: bool = True,
+        timing: Timing | None = None,
+        profile: PayloadProfile | None = None,
+        hooks: bool = True,
+    ) -> dict[str, Any]:
         """Return a Request object for the Webhook instance."""
-        if len(self._attachments) > 0:
-            files: dict[str, Tuple[str | Literal[None], str | bytes]] = {
-                "payload_json": (None, msgspec.json.encode(self))
-            }
+        hooked: bool = hooks and Hooks.is_registered()
+        method: str = "PATCH" if edit else "POST"
+        start: float = monotonic()
+        params: dict[str, str] = self._query_params
+
+        if edit:
+            # Waiting is implied when editing a message
+            params = {key: value for key, value in params.items() if key != "wait"}
+
+        if payload is None:
+            payload = self._get_payload(edit)
+
+        built: float = monotonic()
 
+        if hooked:
+            Hooks.emit(
+                "on_build",
+                method=method,
+                url=self.url,
+                timestamp=built,
+                elapsed=built - start,
+            )
+
+        req: dict[str, Any]
+        files: dict[str, Attachment] = {}
+
+        if upload:
             for attachment in self._attachments:
                 if isinstance(attachment.filename, UnsetType):
                     continue
-                elif isinstance(attachment.content, UnsetType):
+                elif isinstance(attachment.content, UnsetType) and (
+                    attachment._path is None
+                ):
                     continue
 
-                files[attachment.filename] = (attachment.filename, attachment.content)
+                files[attachment.filename] = attachment
+
+                if profile is not None:
+                    profile.attachments[attachment.filename] = attachment.get_size()
+
+        if edit and files:
+            # Uploaded files are otherwise added alongside those of the message, rather
+            # than replacing them, so the files to keep are listed by their part index
+            payload = {
+                **payload,
+                "attachments": [
+                    {"id": idx, "filename": filename}
+                    for idx, filename in enumerate(files)
+                ],
+            }
+
+        data: bytes = (
+            msgspec.json.encode(payload)
+            if profile is None
+            else Profiler.encode(payload, profile)
+        )
+
+        if files:
+            # Files are read in chunks as the body is sent, rather than held in full
+            body: MultipartBody = MultipartBody(data, list(files.values()))
 
-            return {"files": files}
+            req = {
+                "data": body,
+                "params": params,
+                "headers": {"Content-Type": body.get_content_type()},
+            }
+        else:
+            req = {
+                "data": data,
+                "params": params,
+                "headers": {"Content-Type": "application/json"},
+            }
 
-        return {
-            "data": msgspec.json.encode(self),
-            "params": self._query_params,
-            "headers": {"Content-Type": "application/json"},
+        encoded: float = monotonic()
+
+        if timing is not None:
+            timing.build = built - start
+            timing.encode = encoded - built
+
+        if hooked:
+            Hooks.emit(
+                "on_encode",
+                method=method,
+                url=self.url,
+                timestamp=encoded,
+                elapsed=encoded - built,
+                size=Webhook._get_request_size(req),
+            )
+
+        return req
+
+    def _build_edit_request(
+        self: Self, message_id: str, delta: bool, timing: Timing | None = None
+    ) -> tuple[dict[str, Any] | None, dict[str, bytes]]:
+        """Return a Request object to edit a message, and the encoded fields it sends."""
+        sent: dict[str, bytes] = {
+            name: msgspec.json.encode(value)
+            for name, value in self._get_payload(edit=True).items()
         }
+        # Without a delta, every field is sent as if nothing was sent before
+        previous: dict[str, bytes] = self._sent.get(message_id, {}) if delta else {}
+
+        if self._attachments:
+            digest: Any = blake2b(digest_size=16)
+
+            for attachment in self._attachments:
+                digest.update(str(attachment.filename).encode())
+
+                if isinstance(attachment.content, bytes):
+                    digest.update(attachment.content)
+                elif attachment._path is not None:
+                    # A referenced file is identified without reading it
+                    stat: Any = attachment._path.stat()
+
+                    digest.update(
+                        f"{attachment._path}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+                    )
+
+            sent[ATTACHMENTS_DIGEST] = digest.digest()
+
+        # Each field is spliced in already encoded, and a removed field is cleared
+        payload: dict[str, Any] = {
+            name: Raw(value)
+            for name, value in sent.items()
+            if (name != ATTACHMENTS_DIGEST) and (previous.get(name) != value)
+        }
+
+        for name in previous:
+            if (name != ATTACHMENTS_DIGEST) and (name not in sent):
+                payload[name] = None
+
+        upload: bool = sent.get(ATTACHMENTS_DIGEST) != previous.get(ATTACHMENTS_DIGEST)
+
+        if upload:
+            # Replaced by the files uploaded, so that the Attachments previously
+            # uploaded are removed rather than kept alongside them
+            payload["attachments"] = []
+
+        if (not payload) and (not upload):
+            return None, sent
+
+        return (
+            self._build_request(
+                edit=True, payload=payload, upload=upload, timing=timing
+            ),
+            sent,
+        )
+
+    def _set_sent(self: Self, message_id: str, sent: dict[str, bytes]) -> None:
+        """Retain the encoded fields sent to a message, evicting the oldest."""
+        # Reinserted so that the most recently edited messages are evicted last
+        self._sent.pop(message_id, None)
+        self._sent[message_id] = sent
+
+        while len(self._sent) > SENT_MAX:
+            del self._sent[next(iter(self._sent))]
+
+    def _get_message_url(self: Self, message_id: str) -> str:
+        """Return the URL of a message previously sent by the Webhook instance."""
+        return f"{self.url.rstrip('/')}/messages/{message_id}"
+
+    def _get_thread_params(self: Self) -> dict[str, str]:
+        """Return the query parameters which direct a request to a thread."""
+        if thread_id := self._query_params.get("thread_id"):
+            return {"thread_id": thread_id}
+
+        return {}
+
+    def _send(
+        self: Self,
+        ses: Session,
+        method: str,
+        url: str,
+        req: dict[str, Any],
+        timing: Timing | None = None,
+    ) -> Result:
+        """Send a request, retrying while rate-limited, and raise for an error status."""
+        if timing is None:
+            timing = Timing()
+
+        hooked: bool = Hooks.is_registered()
+        size: int = Webhook._get_request_size(req) if hooked else 0
+        attempt: int = 0
+        start: float = Webhook._emit_send(method, url, size, attempt) if hooked else 0.0
+
+        res: Response = ses.request(method, url, **req)
+
+        if hooked:
+            Webhook._emit_response(method, url, res, start, size, attempt)
+
+        Log.response(res)
+
+        # HTTP 429 Too Many Requests
+        while res.status_code == 429:
+            delay: float = self._ratelimit_retry(res)
+
+            if hooked:
+                Webhook._emit_ratelimit(method, url, res, delay, attempt)
+
+            sleep(delay)
+
+            timing.sleep += delay
+            attempt += 1
+
+            if hooked:
+                Webhook._emit_retry(method, url, size, delay, attempt)
+
+                start = Webhook._emit_send(method, url, size, attempt)
+
+            res = ses.request(method, url, **req)
+
+            if hooked:
+                Webhook._emit_response(method, url, res, start, size, attempt)
+
+            Log.response(res)
+
+        timing.attempts = attempt + 1
+
+        res.raise_for_status()
+
+        return Result.wrap(res, timing)
+
+    async def _send_async(
+        self: Self,
+        ses: AsyncSession,
+        method: str,
+        url: str,
+        req: dict[str, Any],
+        timing: Timing | None = None,
+    ) -> Result:
+        """Asynchronously send a request, retrying while rate-limited."""
+        if timing is None:
+            timing = Timing()
+
+        if isinstance(req.get("data"), MultipartBody):
+            # Files are read without blocking the event loop
+            req = {**req, "data": req["data"].to_async()}
+
+        hooked: bool = Hooks.is_registered()
+        size: int = Webhook._get_request_size(req) if hooked else 0
+        attempt: int = 0
+        start: float = Webhook._emit_send(method, url, size, attempt) if hooked else 0.0
+
+        res: Response = await ses.request(method, url, **req)
+
+        if hooked:
+            Webhook._emit_response(method, url, res, start, size, attempt)
+
+        Log.response(res)
+
+        # HTTP 429 Too Many Requests
+        while res.status_code == 429:
+            delay: float = self._ratelimit_retry(res)
+
+            if hooked:
+                Webhook._emit_ratelimit(method, url, res, delay, attempt)
+
+            await async_sleep(delay)
+
+            timing.sleep += delay
+            attempt += 1
+
+            if hooked:
+                Webhook._emit_retry(method, url, size, delay, attempt)
+
+                start = Webhook._emit_send(method, url, size, attempt)
+
+            res = await ses.request(method, url, **req)
+
+            if hooked:
+                Webhook._emit_response(method, url, res, start, size, attempt)
+
+            Log.response(res)
+
+        timing.attempts = attempt + 1
+
+        res.raise_for_status()
+
+        return Result.wrap(res, timing)
+
+    @staticmethod
+    def _get_request_size(req: dict[str, Any]) -> int:
+        """Return the number of bytes in the payload of a Request object."""
+        return len(req.get("data", b""))
+
+    @staticmethod
+    def _emit_send(method: str, url: str, size: int, attempt: int) -> float:
+        """Emit the on_send hook event, and return the time the request was sent."""
+        sent: float = monotonic()
+
+        Hooks.emit(
+            "on_send",
+            method=method,
+            url=url,
+            timestamp=sent,
+            size=size,
+            attempt=attempt,
+        )
+
+        return sent
+
+    @staticmethod
+    def _emit_response(
+        method: str, url: str, res: Response, start: float, size: int, attempt: int
+    ) -> None:
+        """Emit the on_response hook event for a received Response."""
+        received: float = monotonic()
+
+        Hooks.emit(
+            "on_response",
+            method=method,
+            url=url,
+            timestamp=received,
+            elapsed=received - start,
+            size=size,
+            status=res.status_code,
+            bucket=res.headers.get("X-RateLimit-Bucket"),
+            attempt=attempt,
+        )
+
+    @staticmethod
+    def _emit_ratelimit(
+        method: str, url: str, res: Response, delay: float, attempt: int
+    ) -> None:
+        """Emit the on_ratelimit hook event for a rate-limited Response."""
+        Hooks.emit(
+            "on_ratelimit",
+            method=method,
+            url=url,
+            timestamp=monotonic(),
+            status=res.status_code,
+            bucket=res.headers.get("X-RateLimit-Bucket"),
+            delay=delay,
+            attempt=attempt,
+        )
+
+    @staticmethod
+    def _emit_retry(
+        method: str, url: str, size: int, delay: float, attempt: int
+    ) -> None:
+        """Emit the on_retry hook event before a rate-limited request is retried."""
+        Hooks.emit(
+            "on_retry",
+            method=method,
+            url=url,
+            timestamp=monotonic(),
+            size=size,
+            delay=delay,
+            attempt=attempt,
+        )
 
     def _ratelimit_retry(self: Self, res: Response) -> float:
         """Return the amount of time to wait after encountering a ratelimit."""
@@ -854,6 +1604,9 @@ class Webhook(Struct, kw_only=True):
         if isinstance(res_data, dict) and res_data.get("retry_after"):
             delay = res_data["retry_after"]
 
-        logging.warning(f"Rate-limited, sleeping for {delay:,}s...")
+        LOGGER.warning("Rate-limited, sleeping for %ss...", delay)
 
         return delay
+
+
+Preflight.index(Webhook)
@@ -3,7 +3,7 @@ from time import sleep
 import pytest
 from niquests import Response
 
-from clyde import Webhook
+from clyde import Component, ComponentTree, Webhook
 from clyde.components import (
     ActionRow,
     Container,
@@ -330,3 +330,47 @@ def test_component_unfurled_media_item() -> None:
     res: Response = webhook.execute()
 
     assert isinstance(res, Response) and res.ok
+
+
+def test_component_summarize() -> None:
+    """
+    A test-case to validate the measurement of a nested tree of Components.
+    """
+    section: Section = Section(
+        components=[TextDisplay(content=STRING_SHORT)],
+        accessory=Thumbnail(media=UnfurledMediaItem(url="attachment://icon.png")),
+    )
+    container: Container = Container(
+        components=[
+            section,
+            Seperator(),
+            MediaGallery(
+                items=[
+                    MediaGalleryItem(media=UnfurledMediaItem(url=STRING_URL_IMAGE_1)),
+                    MediaGalleryItem(
+                        media=UnfurledMediaItem(url="attachment://image.png")
+                    ),
+                ]
+            ),
+        ]
+    )
+    tree: ComponentTree = Component.summarize(
+        [container, TextDisplay(content=STRING_WORD)]
+    )
+    walked: list[type] = [
+        type(node)
+        for node in Component.walk([container])
+        if isinstance(node, Component)
+    ]
+
+    assert tree.count == 7
+    assert tree.text_length == len(STRING_SHORT) + len(STRING_WORD)
+    assert tree.attachments == ["icon.png", "image.png"]
+    assert walked == [
+        Container,
+        Section,
+        TextDisplay,
+        Thumbnail,
+        Seperator,
+        MediaGallery,
+    ]
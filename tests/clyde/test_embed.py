@@ -1,6 +1,8 @@
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from time import sleep
 
+import msgspec
 import pytest
 from niquests import Response
 
@@ -11,14 +13,17 @@ from clyde import (
     EmbedFooter,
     EmbedImage,
     EmbedThumbnail,
+    Fragment,
     Webhook,
 )
+from clyde.validation import Validation
 
 from .constants import (
     FLOAT_TEST_DELAY,
     FLOAT_TIMESTAMP,
     INT_TIMESTAMP,
     STRING_COLOR_WHITE,
+    STRING_EXTRA_LONG,
     STRING_EXTRA_SHORT,
     STRING_LONG_MARKDOWN,
     STRING_SHORT,
@@ -134,3 +139,83 @@ def test_embed_timestamp_datetime() -> None:
     res: Response = webhook.execute()
 
     assert isinstance(res, Response) and res.ok
+
+
+def test_embed_length() -> None:
+    """
+    A test-case to validate that the Embed length is tracked by the setters and
+    add/remove methods of an Embed and its Webhook.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK)
+    embed: Embed = Embed(title=STRING_WORD)
+    field: EmbedField = EmbedField(name=STRING_WORD, value=STRING_SHORT)
+
+    embed.set_description(STRING_SHORT)
+    embed.set_footer(EmbedFooter(text=STRING_EXTRA_SHORT))
+    embed.set_author(EmbedAuthor(name=STRING_WORD))
+    embed.add_field([field, EmbedField(name=STRING_WORD, value=STRING_WORD)])
+    embed.remove_field(field)
+    embed.set_title(STRING_EXTRA_SHORT)
+    webhook.add_embed([embed, Embed(description=STRING_SHORT)])
+
+    assert embed.get_length() == embed.refresh_length() == 64
+    assert webhook.get_embed_length() == 64 + len(STRING_SHORT)
+    assert webhook.get_remaining_embed_length() == 6000 - 64 - len(STRING_SHORT)
+
+
+def test_embed_length_fragments() -> None:
+    """
+    A test-case to validate that the Webhook counts Embed fragments as they are added
+    and removed, and Embeds as they are modified.
+    """
+    fragment: msgspec.Raw = Fragment.freeze(Embed(title=STRING_WORD))
+    embed: Embed = Embed(title=STRING_SHORT)
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK, embeds=[fragment])
+
+    assert webhook.get_embed_length() == len(STRING_WORD)
+
+    webhook.add_embed([embed, fragment])
+    embed.set_description(STRING_SHORT)
+
+    assert webhook.get_embed_length() == 2 * len(STRING_WORD) + 2 * len(STRING_SHORT)
+
+    webhook.remove_embed(0)
+
+    assert webhook.get_embed_length() == len(STRING_WORD) + 2 * len(STRING_SHORT)
+    assert webhook.get_embed_length() == webhook.refresh_embed_length()
+
+
+def test_embed_from_records() -> None:
+    """
+    A test-case to validate the bulk creation of Embeds from mapping and object records.
+    """
+
+    @dataclass
+    class Record:
+        name: str
+        score: int
+        footer: str | None
+
+    spec: dict[str, str] = {
+        "title": "name",
+        "fields.Score": "score",
+        "footer.text": "footer",
+        "timestamp": "time",
+    }
+    embeds: list[Embed] = Embed.from_records(
+        [
+            {"name": STRING_WORD, "score": 1, "footer": STRING_SHORT, "time": 0},
+            Record(name=STRING_SHORT, score=2, footer=None),
+        ],
+        spec,
+        inline=True,
+    )
+
+    assert embeds[0].title == STRING_WORD
+    assert embeds[0].footer == EmbedFooter(text=STRING_SHORT)
+    assert embeds[0].timestamp == Validation.convert_timestamp(0)
+    assert embeds[1].fields == [EmbedField(name="Score", value="2", inline=True)]
+    assert embeds[1].get_length() == len(STRING_SHORT) + len("Score") + 1
+
+    with pytest.raises(msgspec.ValidationError):
+        Embed.from_records([{"name": STRING_EXTRA_LONG}], spec)
@@ -0,0 +1,104 @@
+import msgspec
+from msgspec import Raw
+
+from clyde import Embed, EmbedFooter, Fragment, Measurement, Preflight, Webhook
+from clyde.components import Container, Seperator, TextDisplay
+
+from .constants import (
+    STRING_COLOR_WHITE,
+    STRING_EXTRA_LONG,
+    STRING_SHORT,
+    STRING_URL_WEBHOOK,
+    STRING_WORD,
+)
+
+
+def test_fragment() -> None:
+    """
+    A test-case to validate that a fragment encodes the same as the Struct it was frozen
+    from, and counts towards the Embed length limit.
+    """
+    footer: EmbedFooter = EmbedFooter(text=STRING_SHORT)
+    fragment: Raw = Fragment.freeze(footer)
+    frozen: Webhook = Webhook(url=STRING_URL_WEBHOOK).add_embed(
+        Embed(title=STRING_WORD, color=STRING_COLOR_WHITE).set_footer(fragment)
+    )
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK).add_embed(
+        Embed(title=STRING_WORD, color=STRING_COLOR_WHITE).set_footer(footer)
+    )
+
+    assert Fragment.thaw(fragment, EmbedFooter) == footer
+    assert Fragment.thaw(fragment, EmbedFooter) is not Fragment.thaw(
+        fragment, EmbedFooter
+    )
+    assert frozen.get_embed_length() == webhook.get_embed_length()
+    assert msgspec.json.encode(frozen._get_payload()) == msgspec.json.encode(
+        webhook._get_payload()
+    )
+
+    frozen.add_embed(Fragment.freeze(Embed(title=STRING_WORD, color=0)))
+
+    assert frozen.get_embed_length() == webhook.get_embed_length() + len(STRING_WORD)
+
+
+def test_fragment_components() -> None:
+    """
+    A test-case to validate that fragments within Components are validated as the
+    Structs they were frozen from.
+    """
+    seperator: Raw = Fragment.freeze(Seperator())
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK)
+
+    webhook.add_component(
+        [
+            Fragment.freeze(Container(components=[TextDisplay(content=STRING_WORD)])),
+            Container(components=[seperator, TextDisplay(content=STRING_WORD)]),
+            seperator,
+        ]
+    )
+
+    assert msgspec.json.decode(msgspec.json.encode(webhook._get_payload()))[
+        "components"
+    ][1]["components"][0] == msgspec.json.decode(seperator)
+    assert Preflight.get_violations(webhook) == []
+
+    webhook.add_component(
+        Fragment.freeze(Container(components=[TextDisplay(content=STRING_EXTRA_LONG)]))
+    )
+
+    assert Preflight.get_violations(webhook)[0].startswith("Text Displays")
+
+
+def test_fragment_measurement() -> None:
+    """
+    A test-case to validate that a fragment is measured once when frozen, and that a
+    fragment which was not frozen is measured once when validated.
+    """
+    footer: EmbedFooter = EmbedFooter(text=STRING_EXTRA_LONG)
+    measurement: Measurement | None = Fragment.get_measurement(
+        Fragment.freeze(footer), EmbedFooter
+    )
+    fragment: Raw = Raw(
+        msgspec.json.encode(EmbedFooter(text=STRING_SHORT, icon_url=STRING_URL_WEBHOOK))
+    )
+
+    assert measurement is not None
+    assert measurement.length == len(STRING_EXTRA_LONG)
+    assert measurement.violations == [
+        f".text has length {len(STRING_EXTRA_LONG):,} (maximum 2,048)"
+    ]
+    assert Fragment.get_measurement(Fragment.freeze(footer), Embed) is None
+    assert Fragment.get_measurement(fragment, EmbedFooter) is None
+
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK).add_embed(
+        Embed(title=STRING_WORD).set_footer(Fragment.freeze(footer))
+    )
+
+    assert Preflight.get_violations(webhook)[0].startswith(
+        "Webhook.embeds[0].footer.text has length"
+    )
+
+    webhook.add_embed(Embed(title=STRING_WORD).set_footer(fragment))
+    Preflight.get_violations(webhook)
+
+    assert Fragment.get_measurement(fragment, EmbedFooter) is not None
@@ -0,0 +1,69 @@
+from clyde import Attachment, Gallery, Webhook
+from clyde.components import Container, MediaGallery, TextDisplay
+
+from .constants import STRING_URL_IMAGE_1, STRING_URL_WEBHOOK, STRING_WORD
+
+
+def test_gallery_layout() -> None:
+    """
+    A test-case to validate that a large set of media is chunked into Media Galleries
+    and split across messages once the Component limit is reached.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK)
+    urls: list[str] = [f"{STRING_URL_IMAGE_1}?{idx}" for idx in range(250)]
+    pages: list[Webhook] = Gallery.layout(
+        webhook, urls, Container(components=[], accent_color=0)
+    )
+
+    assert [len(page.components) for page in pages] == [20, 5]
+    assert all(isinstance(page.components[0], Container) for page in pages)
+    assert pages[0].components[0].accent_color == 0
+
+    galleries: list[MediaGallery] = [
+        component.components[0] for page in pages for component in page.components
+    ]
+
+    assert [item.media.url for gallery in galleries for item in gallery.items] == urls
+
+
+def test_gallery_layout_attachments() -> None:
+    """
+    A test-case to validate that file Attachments are spread across messages by size.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK)
+    attachments: list[Attachment] = [
+        Attachment(filename=f"{idx}.png", content=bytes(1000 if idx < 2 else 1))
+        for idx in range(12)
+    ]
+    pages: list[Webhook] = Gallery.layout(webhook, attachments)
+
+    assert len(pages) == 2
+    assert all(len(page._attachments) <= 10 for page in pages)
+    assert [
+        sum(len(attachment.content) for attachment in page._attachments)
+        for page in pages
+    ] == [1005, 1005]
+    assert pages[0].components[0].components[0].items[0].media.url == (
+        "attachment://0.png"
+    )
+
+
+def test_gallery_layout_attachments_full() -> None:
+    """
+    A test-case to validate that file Attachments are not scheduled onto a message
+    which has Attachment slots but no room for Components.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK)
+
+    for _ in range(40):
+        webhook.add_component(TextDisplay(content=STRING_WORD))
+
+    attachments: list[Attachment] = [
+        Attachment(filename=f"{idx}.png", content=bytes(idx + 1)) for idx in range(15)
+    ]
+    pages: list[Webhook] = Gallery.layout(webhook, attachments)
+
+    assert len(pages[0].components) == 40
+    assert not pages[0]._attachments
+    assert sum(len(page._attachments) for page in pages) == 15
+    assert all(len(page._attachments) <= 10 for page in pages)
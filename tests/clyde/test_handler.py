@@ -0,0 +1,119 @@
+import logging
+
+from niquests import Response
+
+from clyde import Embed, Webhook, WebhookHandler
+
+from .constants import STRING_LONG, STRING_URL_WEBHOOK
+
+SENT: list["RecordingWebhook"] = []
+
+
+class RecordingWebhook(Webhook, kw_only=True):
+    """A Webhook which records each execution rather than sending it."""
+
+    def execute(self) -> Response:
+        SENT.append(self)
+
+
+def test_handler() -> None:
+    """
+    A test-case to validate that log records are batched into code blocks within the
+    message content limit.
+    """
+    SENT.clear()
+
+    logger: logging.Logger = logging.getLogger("clyde.tests.handler")
+    handler: WebhookHandler = WebhookHandler(RecordingWebhook(url=STRING_URL_WEBHOOK))
+
+    logger.addHandler(handler)
+
+    for _ in range(10):
+        logger.warning(STRING_LONG)
+
+    handler.close()
+    logger.removeHandler(handler)
+
+    assert len(SENT) == 3
+    assert all(isinstance(webhook.content, str) for webhook in SENT)
+    assert all(len(webhook.content) <= 2000 for webhook in SENT)
+    assert all(webhook.content.startswith("```\n") for webhook in SENT)
+    assert sum(webhook.content.count(STRING_LONG) for webhook in SENT) == 10
+
+
+def test_handler_embeds() -> None:
+    """
+    A test-case to validate that log records are sent as Embeds colored by level.
+    """
+    SENT.clear()
+
+    logger: logging.Logger = logging.getLogger("clyde.tests.handler_embeds")
+    handler: WebhookHandler = WebhookHandler(
+        RecordingWebhook(url=STRING_URL_WEBHOOK), embeds=True
+    )
+
+    logger.addHandler(handler)
+    logger.warning(STRING_LONG)
+    logger.error(STRING_LONG)
+    handler.flush()
+
+    embeds: list[Embed] = [embed for webhook in SENT for embed in webhook.embeds]
+
+    assert [embed.title for embed in embeds] == ["WARNING", "ERROR"]
+    assert embeds[0].color != embeds[1].color
+
+    handler.close()
+    logger.removeHandler(handler)
+
+
+def test_handler_suppress() -> None:
+    """
+    A test-case to validate that repeated log records are summarized rather than sent.
+    """
+    SENT.clear()
+
+    logger: logging.Logger = logging.getLogger("clyde.tests.handler_suppress")
+    handler: WebhookHandler = WebhookHandler(
+        RecordingWebhook(url=STRING_URL_WEBHOOK), suppress=60.0
+    )
+
+    logger.addHandler(handler)
+
+    for idx in range(1_000):
+        logger.error("Failed request %d", idx)
+
+    handler.close()
+    logger.removeHandler(handler)
+
+    content: str = "".join(webhook.content for webhook in SENT)
+
+    assert content.count("Failed request") == 2
+    assert "×999 in the last 60s" in content
+
+
+def test_handler_prepare() -> None:
+    """
+    A test-case to validate that log records are formatted as they were when logged.
+    """
+    SENT.clear()
+
+    logger: logging.Logger = logging.getLogger("clyde.tests.handler_prepare")
+    handler: WebhookHandler = WebhookHandler(RecordingWebhook(url=STRING_URL_WEBHOOK))
+    state: list[str] = ["before"]
+
+    logger.addHandler(handler)
+    logger.warning("State is %s", state)
+    state[0] = "after"
+
+    try:
+        raise ValueError(STRING_LONG)
+    except ValueError:
+        logger.exception("Failed")
+
+    handler.close()
+    logger.removeHandler(handler)
+
+    content: str = "".join(webhook.content for webhook in SENT)
+
+    assert "State is ['before']" in content
+    assert "ValueError" in content
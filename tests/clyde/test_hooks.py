@@ -0,0 +1,85 @@
+from typing import Any
+
+import pytest
+from niquests import Response
+
+from clyde import HookEvent, Hooks, Webhook
+
+from .constants import STRING_LONG, STRING_URL_WEBHOOK
+
+
+def test_hooks_build() -> None:
+    """
+    A test-case to validate that the build and encode stages of a request emit Hook
+    Events with their timing and payload size.
+    """
+    events: list[HookEvent] = []
+
+    Hooks.register("on_build", events.append)
+    Hooks.register("on_encode", events.append)
+
+    req: dict[str, Any] = Webhook(
+        url=STRING_URL_WEBHOOK, content=STRING_LONG
+    )._build_request()
+
+    Hooks.clear()
+
+    assert [event.name for event in events] == ["on_build", "on_encode"]
+    assert events[0].timestamp <= events[1].timestamp
+    assert all(event.method == "POST" for event in events)
+    assert events[1].size == len(req["data"])
+    assert not Hooks.is_registered()
+
+
+def test_hooks_profile() -> None:
+    """
+    A test-case to validate that profiling a Webhook does not emit Hook Events.
+    """
+    events: list[HookEvent] = []
+
+    Hooks.register("on_build", events.append)
+    Hooks.register("on_encode", events.append)
+
+    Webhook(url=STRING_URL_WEBHOOK, content=STRING_LONG).get_profile()
+
+    Hooks.clear()
+
+    assert events == []
+
+
+def test_hooks_unregister() -> None:
+    """
+    A test-case to validate that unregistered Hooks and unknown events are not called.
+    """
+    events: list[HookEvent] = []
+
+    Hooks.register("on_build", events.append)
+    Hooks.unregister("on_build", events.append)
+
+    Webhook(url=STRING_URL_WEBHOOK, content=STRING_LONG)._build_request()
+
+    assert events == []
+    assert not Hooks.is_registered("on_build")
+
+    with pytest.raises(ValueError):
+        Hooks.register("on_unknown", events.append)
+
+
+def test_hooks_execute() -> None:
+    """
+    A test-case to validate that executing a Webhook instance emits Hook Events for
+    sending the request and receiving its Response.
+    """
+    events: list[HookEvent] = []
+
+    Hooks.register("on_send", events.append)
+    Hooks.register("on_response", events.append)
+
+    try:
+        res: Response = Webhook(url=STRING_URL_WEBHOOK, content=STRING_LONG).execute()
+    finally:
+        Hooks.clear()
+
+    assert [event.name for event in events] == ["on_send", "on_response"]
+    assert events[1].status == res.status_code
+    assert events[1].elapsed is not None and events[1].elapsed > 0
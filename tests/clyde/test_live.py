@@ -0,0 +1,79 @@
+import pytest
+from niquests import Response
+
+from clyde import LiveMessage, Webhook
+from clyde.live import RETRIES_MAX
+
+from .constants import STRING_ID_THREAD, STRING_URL_WEBHOOK
+
+EDITS: list[str] = []
+
+
+class RecordingWebhook(Webhook, kw_only=True):
+    """A Webhook which records each edit rather than sending it."""
+
+    def edit(self, message_id: str, delta: bool = False) -> Response | None:
+        EDITS.append(str(self.content))
+
+
+def test_live_message() -> None:
+    """
+    A test-case to validate that a Live Message drops intermediate states, and always
+    sends the latest state when closed.
+    """
+    EDITS.clear()
+
+    with LiveMessage(
+        RecordingWebhook(url=STRING_URL_WEBHOOK), STRING_ID_THREAD, interval=0.2
+    ) as live:
+        for idx in range(10_000):
+            live.update(RecordingWebhook(url=STRING_URL_WEBHOOK, content=str(idx)))
+
+    assert 1 <= len(EDITS) <= 3
+    assert EDITS[-1] == "9999"
+
+
+class FailingWebhook(Webhook, kw_only=True):
+    """A Webhook which fails to edit, recording each attempt."""
+
+    def edit(self, message_id: str, delta: bool = False) -> Response | None:
+        EDITS.append(str(self.content))
+
+        raise ConnectionError(message_id)
+
+
+def test_live_message_snapshot() -> None:
+    """
+    A test-case to validate that an update is sent as it was when scheduled.
+    """
+    EDITS.clear()
+
+    webhook: RecordingWebhook = RecordingWebhook(url=STRING_URL_WEBHOOK, content="0")
+
+    with LiveMessage(webhook, STRING_ID_THREAD, interval=0.0) as live:
+        live.update()
+        webhook.set_content("1")
+        live.flush()
+
+    assert EDITS == ["0"]
+
+
+def test_live_message_retry() -> None:
+    """
+    A test-case to validate that a failed edit is retried, and its error raised when
+    the Live Message is closed.
+    """
+    EDITS.clear()
+
+    live: LiveMessage = LiveMessage(
+        FailingWebhook(url=STRING_URL_WEBHOOK, content=STRING_ID_THREAD),
+        STRING_ID_THREAD,
+        interval=0.0,
+    )
+
+    live.update()
+
+    with pytest.raises(ConnectionError):
+        live.close()
+
+    assert len(EDITS) == RETRIES_MAX + 1
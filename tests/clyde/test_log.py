@@ -0,0 +1,57 @@
+import logging
+from datetime import timedelta
+
+import pytest
+from niquests import PreparedRequest, Response
+
+from clyde import Log
+
+from .constants import STRING_URL_WEBHOOK
+
+
+class BodylessResponse(Response):
+    """A Response which fails if its body is read."""
+
+    @property
+    def text(self) -> str:
+        raise AssertionError("Response body was read")
+
+
+def get_response() -> BodylessResponse:
+    res: BodylessResponse = BodylessResponse()
+    res.status_code = 200
+    res.url = STRING_URL_WEBHOOK
+    res.elapsed = timedelta(seconds=0.25)
+    res.request = PreparedRequest()
+    res.request.method = "POST"
+
+    return res
+
+
+def test_log_response(caplog: pytest.LogCaptureFixture) -> None:
+    """
+    A test-case to validate that a Response is not inspected unless DEBUG is enabled,
+    and that sampled Responses are summarized with the Webhook token redacted.
+    """
+    caplog.set_level(logging.INFO, logger="clyde")
+
+    Log.response(get_response())
+
+    assert caplog.records == []
+
+    Log.set_sample_rate(1.0)
+
+    try:
+        Log.response(get_response())
+    finally:
+        Log.set_sample_rate(0.0)
+
+    token: str = STRING_URL_WEBHOOK.rstrip("/").rsplit("/", 1)[-1]
+
+    assert len(caplog.records) == 1
+    assert caplog.records[0].status == 200
+    assert caplog.records[0].method == "POST"
+    assert token not in caplog.records[0].getMessage()
+
+    with pytest.raises(ValueError):
+        Log.set_sample_rate(2.0)
@@ -0,0 +1,98 @@
+from clyde import Embed, EmbedField, Markdown, MarkdownBuilder
+from clyde.validation import Validation
+
+from .constants import STRING_EXTRA_LONG, STRING_LIST_MEDIUM, STRING_SHORT, STRING_WORD
+
+
+def test_markdown_lists() -> None:
+    """
+    A test-case to validate the formatting of bulleted and numbered lists.
+    """
+    assert Markdown.bulleted_list(STRING_LIST_MEDIUM[:2]) == "- Lorem\n- Ipsum"
+    assert Markdown.numbered_list(STRING_LIST_MEDIUM[:2]) == "1. Lorem\n2. Ipsum"
+    assert (
+        Markdown.subtext(f"{STRING_WORD}\n\n {STRING_WORD} ") == "-# Lorem\n\n-# Lorem"
+    )
+
+
+def test_markdown_builder() -> None:
+    """
+    A test-case to validate that a Markdown Builder matches the Markdown helpers.
+    """
+    builder: MarkdownBuilder = MarkdownBuilder()
+
+    builder.header_1(STRING_WORD)
+    builder.bold(STRING_SHORT)
+    builder.numbered_list(STRING_LIST_MEDIUM)
+
+    assert builder.build() == "\n".join(
+        [
+            Markdown.header_1(STRING_WORD),
+            Markdown.bold(STRING_SHORT),
+            Markdown.numbered_list(STRING_LIST_MEDIUM),
+        ]
+    )
+    assert builder.get_length() == len(builder.build())
+    assert not builder.is_truncated()
+
+
+def test_markdown_builder_limit() -> None:
+    """
+    A test-case to validate that a Markdown Builder stops cleanly at its limit.
+    """
+    builder: MarkdownBuilder = MarkdownBuilder(limit=20)
+
+    builder.bulleted_list(STRING_LIST_MEDIUM)
+    builder.add(STRING_WORD)
+
+    assert builder.build() == "- Lorem\n- Ipsum"
+    assert builder.get_remaining_length() == 20 - len(builder.build())
+    assert builder.is_truncated()
+
+
+def test_markdown_escape() -> None:
+    """
+    A test-case to validate that escaped content is restored by unescape.
+    """
+    content: str = Markdown.bold(Markdown.inline_code("host_name|~>\\"))
+
+    assert Markdown.escape(content) == "\\*\\*\\`host\\_name\\|\\~\\>\\\\\\`\\*\\*"
+    assert Markdown.unescape(Markdown.escape(content)) == content
+    assert Markdown.escape_all([content, STRING_WORD]) == [
+        Markdown.escape(content),
+        STRING_WORD,
+    ]
+
+
+def test_markdown_truncate() -> None:
+    """
+    A test-case to validate that truncated content closes any open Markdown spans.
+    """
+    assert Markdown.truncate(STRING_SHORT, 100) == STRING_SHORT
+    assert Markdown.truncate(Markdown.bold(STRING_SHORT), 15) == "**Lorem ipsu…**"
+    assert (
+        Markdown.truncate(Markdown.code_block(STRING_SHORT), 16) == "```\nLorem i…\n```"
+    )
+    assert Markdown.truncate(STRING_SHORT, 10, "...") == "Lorem i..."
+    assert Markdown.truncate(STRING_SHORT, 0) == ""
+    assert Markdown.truncate(STRING_SHORT, 2, "...") == ".."
+
+
+def test_markdown_truncate_field() -> None:
+    """
+    A test-case to validate that setters truncate to the limits declared on a Field.
+    """
+    embed: Embed = Embed()
+
+    embed.set_title(Markdown.italics(STRING_EXTRA_LONG), truncate=True)
+
+    assert len(embed.title) == Validation.get_max_length(Embed, "title")
+    assert embed.title.endswith("…*")
+    assert Validation.truncate(EmbedField, "value", STRING_SHORT) == STRING_SHORT
+
+    field: EmbedField = EmbedField(name=STRING_WORD, value=STRING_WORD)
+
+    field.set_value(Markdown.bold(STRING_EXTRA_LONG), truncate=True)
+
+    assert len(field.value) == Validation.get_max_length(EmbedField, "value")
+    assert field.value.endswith("…**")
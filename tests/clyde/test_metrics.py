@@ -0,0 +1,115 @@
+import logging
+from threading import Thread
+
+import niquests
+from niquests import Response
+
+from clyde import Metrics, Webhook, WebhookHandler
+from clyde.hooks import Hooks
+
+from .constants import STRING_LONG, STRING_SHORT, STRING_URL_WEBHOOK
+
+
+class RecordingWebhook(Webhook, kw_only=True):
+    """A Webhook which discards each execution rather than sending it."""
+
+    def execute(self) -> Response:
+        return Response()
+
+
+def test_metrics_render() -> None:
+    """
+    A test-case to validate that Hook Events are rendered as Prometheus metrics
+    labeled by a hash of the Webhook URL.
+    """
+    metrics: Metrics = Metrics(buckets=(0.1, 1.0)).install()
+
+    Hooks.emit("on_send", method="POST", url=STRING_URL_WEBHOOK, timestamp=0, size=64)
+    Hooks.emit(
+        "on_response",
+        method="POST",
+        url=STRING_URL_WEBHOOK,
+        timestamp=0,
+        elapsed=0.5,
+        status=429,
+    )
+    Hooks.emit(
+        "on_ratelimit", method="POST", url=STRING_URL_WEBHOOK, timestamp=0, delay=2.0
+    )
+    Hooks.emit(
+        "on_response",
+        method="POST",
+        url=STRING_URL_WEBHOOK,
+        timestamp=0,
+        elapsed=0.05,
+        status=200,
+    )
+
+    metrics.uninstall()
+
+    text: str = metrics.render()
+    url: str = Metrics._get_url_hash(STRING_URL_WEBHOOK)
+
+    assert STRING_URL_WEBHOOK not in text
+    assert f'clyde_sent_bytes_total{{url="{url}"}} 64' in text
+    assert f'clyde_requests_total{{url="{url}",status="429"}} 1' in text
+    assert f'clyde_ratelimit_delay_seconds_total{{url="{url}"}} 2' in text
+    assert f'clyde_request_duration_seconds_bucket{{url="{url}",le="0.1"}} 1' in text
+    assert f'clyde_request_duration_seconds_bucket{{url="{url}",le="+Inf"}} 2' in text
+    assert f'clyde_request_duration_seconds_count{{url="{url}"}} 2' in text
+
+
+def test_metrics_serve() -> None:
+    """
+    A test-case to validate that metrics, including the queue of a Webhook Handler,
+    are served over HTTP.
+    """
+    metrics: Metrics = Metrics().install()
+    logger: logging.Logger = logging.getLogger("clyde.tests.metrics")
+    handler: WebhookHandler = WebhookHandler(RecordingWebhook(url=STRING_URL_WEBHOOK))
+
+    logger.addHandler(handler)
+    logger.warning(STRING_SHORT)
+    logger.warning(STRING_LONG)
+
+    handler.close()
+    logger.removeHandler(handler)
+    metrics.uninstall()
+
+    server = metrics.serve(port=0)
+    res: Response = niquests.get(f"http://127.0.0.1:{server.server_port}/metrics")
+
+    server.shutdown()
+
+    assert res.ok
+    assert res.headers["Content-Type"].startswith("text/plain")
+    assert "clyde_queue_wait_seconds_count" in res.text
+    assert "clyde_queue_depth" in res.text
+
+
+def test_metrics_threads() -> None:
+    """
+    A test-case to validate that the counters of threads which have exited are kept,
+    without retaining a shard for each of them.
+    """
+    metrics: Metrics = Metrics().install()
+    threads: list[Thread] = [
+        Thread(
+            target=Hooks.emit,
+            args=("on_retry",),
+            kwargs={"method": "POST", "url": STRING_URL_WEBHOOK, "timestamp": 0},
+        )
+        for _ in range(100)
+    ]
+
+    for thread in threads:
+        thread.start()
+        thread.join()
+
+    metrics.uninstall()
+
+    text: str = metrics.render()
+    url: str = Metrics._get_url_hash(STRING_URL_WEBHOOK)
+
+    assert f'clyde_retries_total{{url="{url}"}} 100' in text
+    assert len(metrics._shards) == 0
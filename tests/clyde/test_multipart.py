@@ -0,0 +1,85 @@
+import asyncio
+from email import message_from_bytes, policy
+from email.message import EmailMessage
+from pathlib import Path
+
+import pytest
+
+from clyde import Attachment
+from clyde.multipart import CHUNK_SIZE, MultipartBody
+
+from .constants import STRING_LONG, STRING_WORD
+
+
+def test_multipart_body(tmp_path: Path) -> None:
+    """
+    A test-case to validate that a Multipart Body produces a valid body of the
+    declared length, reading files in chunks.
+    """
+    file_path: Path = tmp_path / STRING_WORD
+
+    file_path.write_bytes(STRING_LONG.encode() * (CHUNK_SIZE // len(STRING_LONG) + 1))
+
+    body: MultipartBody = MultipartBody(
+        b"{}",
+        [
+            Attachment(filename=file_path.name).set_content(file_path),
+            Attachment(filename=f'"{STRING_WORD}"', content=STRING_LONG.encode()),
+        ],
+    )
+    chunks: list[bytes] = list(body)
+    data: bytes = b"".join(chunks)
+    message: EmailMessage = message_from_bytes(
+        f"Content-Type: {body.get_content_type()}\r\n\r\n".encode() + data,
+        policy=policy.HTTP,
+    )
+    parts: list[EmailMessage] = list(message.iter_parts())
+
+    assert len(body) == len(data)
+    assert max(len(chunk) for chunk in chunks) <= CHUNK_SIZE
+    assert [part.get_filename() for part in parts] == [
+        None,
+        STRING_WORD,
+        f"%22{STRING_WORD}%22",
+    ]
+    assert parts[1].get_payload(decode=True) == file_path.read_bytes()
+    assert parts[2].get_payload(decode=True) == STRING_LONG.encode()
+
+
+def test_multipart_body_async() -> None:
+    """
+    A test-case to validate that a Multipart Body produces the same body on the
+    asynchronous path.
+    """
+    body: MultipartBody = MultipartBody(
+        b"{}", [Attachment(filename=STRING_WORD, content=STRING_LONG.encode())]
+    )
+
+    async def collect() -> bytes:
+        return b"".join([chunk async for chunk in body.to_async()])
+
+    assert asyncio.run(collect()) == b"".join(body)
+    assert len(body.to_async()) == len(body)
+
+
+def test_multipart_body_resized(tmp_path: Path) -> None:
+    """
+    A test-case to validate that a Multipart Body produces the declared length if a
+    file grows after it is initialized, and raises if the file shrinks.
+    """
+    file_path: Path = tmp_path / STRING_WORD
+
+    file_path.write_bytes(STRING_LONG.encode())
+
+    body: MultipartBody = MultipartBody(
+        b"{}", [Attachment(filename=file_path.name).set_content(file_path)]
+    )
+
+    file_path.write_bytes(STRING_LONG.encode() * 2)
+
+    assert len(b"".join(body)) == len(body)
+
+    file_path.write_bytes(STRING_WORD.encode())
+
+    with pytest.raises(ValueError):
+        b"".join(body)
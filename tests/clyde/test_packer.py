@@ -0,0 +1,64 @@
+from clyde import UNSET, Embed, EmbedField, EmbedFooter, Packer, Webhook
+
+from .constants import STRING_LONG, STRING_SHORT, STRING_URL_WEBHOOK, STRING_WORD
+
+
+def test_packer_fields() -> None:
+    """
+    A test-case to validate that Embed Fields are packed within the Field, Embed, and
+    message limits, in order.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK, content=STRING_SHORT)
+    fields: list[EmbedField] = [
+        EmbedField(name=str(idx), value=STRING_WORD) for idx in range(300)
+    ]
+    pages: list[Webhook] = Packer.pack_fields(webhook, fields)
+
+    assert len(pages) == 2
+    assert [len(page.embeds) for page in pages] == [10, 2]
+    assert [len(embed.fields) for embed in pages[1].embeds] == [25, 25]
+    assert [
+        field for page in pages for embed in page.embeds for field in embed.fields
+    ] == fields
+    assert all(page.content == STRING_SHORT for page in pages)
+
+
+def test_packer_fields_length() -> None:
+    """
+    A test-case to validate that the header and footer are repeated on each message
+    and count towards its Embed length limit.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK)
+    template: Embed = Embed(
+        title=STRING_WORD, footer=EmbedFooter(text=STRING_WORD), color=0
+    )
+    fields: list[EmbedField] = [
+        EmbedField(name=STRING_WORD, value=STRING_LONG) for _ in range(20)
+    ]
+    pages: list[Webhook] = Packer.pack_fields(webhook, fields, template)
+
+    for page in pages:
+        assert sum(embed.get_length() for embed in page.embeds) <= 6000
+        assert page.embeds[0].title == STRING_WORD
+        assert page.embeds[-1].footer == EmbedFooter(text=STRING_WORD)
+
+    single: list[Webhook] = Packer.pack_fields(webhook, fields, template, False)
+
+    assert len(single) == len(pages)
+    assert single[1].embeds[0].title is UNSET
+    assert single[0].embeds[-1].footer is UNSET
+
+
+def test_packer_embeds() -> None:
+    """
+    A test-case to validate that Embeds are packed within the message limits, with
+    the content on the first message only.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK, content=STRING_SHORT)
+    embeds: list[Embed] = [Embed(description=STRING_LONG) for _ in range(12)]
+    pages: list[Webhook] = Packer.pack_embeds(webhook, embeds, repeat=False)
+
+    assert sum(len(page.embeds) for page in pages) == 12
+    assert all(len(page.embeds) <= 10 for page in pages)
+    assert pages[0].content == STRING_SHORT
+    assert all(page.content is UNSET for page in pages[1:])
@@ -0,0 +1,85 @@
+from clyde.markdown import Markdown
+from clyde.pagination import CODE_FENCE, Pagination
+
+from .constants import STRING_EXTRA_LONG, STRING_LONG, STRING_SHORT
+
+
+def test_pagination_split_content() -> None:
+    """
+    A test-case to validate that content is split at line boundaries within the limit.
+    """
+    content: str = "\n".join([STRING_LONG] * 20)
+    pages: list[str] = Pagination.split_content(content, 2000)
+
+    assert len(pages) == 5
+    assert all(len(page) <= 2000 for page in pages)
+    assert "\n".join(pages) == content
+
+
+def test_pagination_split_content_short() -> None:
+    """
+    A test-case to validate that content within the limit is not split.
+    """
+    assert Pagination.split_content(STRING_SHORT, 2000) == [STRING_SHORT]
+
+
+def test_pagination_split_content_code_block() -> None:
+    """
+    A test-case to validate that a code block is closed and reopened across pages.
+    """
+    content: str = Markdown.code_block("\n".join([STRING_LONG] * 20), "py")
+    pages: list[str] = Pagination.split_content(content, 2000)
+
+    assert len(pages) > 1
+    assert all(len(page) <= 2000 for page in pages)
+    assert all(page.startswith("```py\n") for page in pages)
+    assert all(page.endswith("\n```") for page in pages)
+
+
+def test_pagination_split_content_long_line() -> None:
+    """
+    A test-case to validate that a line exceeding the limit is split at whitespace
+    outside of Markdown spans.
+    """
+    content: str = f"{STRING_EXTRA_LONG} {Markdown.bold(STRING_SHORT)}"
+    pages: list[str] = Pagination.split_content(content, 2000)
+
+    assert all(len(page) <= 2000 for page in pages)
+    assert " ".join(pages) == content
+    assert all(page.count("**") % 2 == 0 for page in pages)
+
+
+def test_pagination_split_content_long_fence() -> None:
+    """
+    A test-case to validate that content is split without reopening a code block when
+    its opener does not fit on a page.
+    """
+    content: str = Markdown.code_block("x" * 50, "python")
+    pages: list[str] = Pagination.split_content(content, 14)
+
+    assert all(len(page) <= 14 for page in pages)
+    assert "".join(pages) == content.replace("\n", "")
+
+    content = Markdown.code_block(STRING_LONG, "y" * 2000)
+    pages = Pagination.split_content(content, 2000)
+
+    assert all(len(page) <= 2000 for page in pages)
+
+
+def test_pagination_split_content_long_line_markers() -> None:
+    """
+    A test-case to validate that a line exceeding the limit with an unbalanced code block
+    or Markdown spans is split within the limit.
+    """
+    content: str = "\n".join(
+        [
+            STRING_SHORT,
+            f"{'x' * 1990} ``` {'y' * 1995}",
+            f"|| {STRING_EXTRA_LONG} ~~",
+            CODE_FENCE,
+        ]
+    )
+    pages: list[str] = Pagination.split_content(content, 2000)
+
+    assert len(pages) > 1
+    assert all(len(page) <= 2000 for page in pages)
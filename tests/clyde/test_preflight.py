@@ -0,0 +1,148 @@
+import pytest
+
+from clyde import (
+    Component,
+    Embed,
+    EmbedField,
+    Poll,
+    PollAnswer,
+    PollMediaAnswer,
+    PollMediaQuestion,
+    Preflight,
+    PreflightError,
+    Webhook,
+)
+from clyde.components import Container, File, TextDisplay, UnfurledMediaItem
+
+from .constants import (
+    STRING_EXTRA_LONG,
+    STRING_LONG,
+    STRING_SHORT,
+    STRING_URL_WEBHOOK,
+    STRING_WORD,
+)
+
+
+def test_preflight() -> None:
+    """
+    A test-case to validate that a Webhook within all Discord limits has no violations.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK, content=STRING_LONG)
+
+    webhook.add_embed(
+        Embed(title=STRING_SHORT).add_field(
+            EmbedField(name=STRING_WORD, value=STRING_LONG)
+        )
+    )
+
+    assert Preflight.get_violations(webhook) == []
+
+
+def test_preflight_violations() -> None:
+    """
+    A test-case to validate that every violation on a Webhook is reported in one pass.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK, content=STRING_EXTRA_LONG)
+    embed: Embed = Embed(title=STRING_EXTRA_LONG)
+
+    embed.add_field([EmbedField(name=STRING_WORD, value=STRING_WORD)] * 26)
+    webhook.add_embed(embed)
+
+    violations: list[str] = Preflight.get_violations(webhook)
+
+    assert violations[0].startswith("Webhook.content")
+    assert violations[1].startswith("Webhook.embeds[0].title")
+    assert violations[2].startswith("Webhook.embeds[0].fields")
+    assert len(violations) == 3
+
+
+def test_preflight_embed_total_length() -> None:
+    """
+    A test-case to validate that the combined length of all Embeds is enforced.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK)
+
+    for _ in range(4):
+        webhook.add_embed(Embed(description=STRING_EXTRA_LONG[:2000]))
+
+    violations: list[str] = Preflight.get_violations(webhook)
+
+    assert len(violations) == 1 and violations[0].startswith("Embeds")
+
+
+def test_preflight_text_display_total_length() -> None:
+    """
+    A test-case to validate that the combined length of all Text Displays is enforced.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK)
+
+    webhook.add_component(
+        Container(components=[TextDisplay(content=STRING_EXTRA_LONG)])
+    )
+
+    violations: list[str] = Preflight.get_violations(webhook)
+
+    assert len(violations) == 1 and violations[0].startswith("Text Displays")
+
+
+def test_preflight_poll() -> None:
+    """
+    A test-case to validate the failure of a Poll with too many answers.
+    """
+    poll: Poll = Poll(
+        question=PollMediaQuestion(text=STRING_SHORT),
+        answers=[PollAnswer(poll_media=PollMediaAnswer(text=STRING_WORD))] * 11,
+    )
+
+    with pytest.raises(PreflightError) as error:
+        Preflight.validate(poll)
+
+    assert error.value.violations == ["Poll.answers has length 11 (maximum 10)"]
+
+
+def test_preflight_webhook_execute() -> None:
+    """
+    A test-case to validate that an oversized Webhook is rejected before it is sent.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK, content=STRING_EXTRA_LONG)
+
+    with pytest.raises(PreflightError):
+        webhook.execute()
+
+
+def test_preflight_attachment_reference() -> None:
+    """
+    A test-case to validate that a Component referencing a missing Attachment is
+    reported.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK)
+
+    webhook.add_attachment("present.txt", STRING_WORD.encode())
+    webhook.add_component(
+        [
+            File(file=UnfurledMediaItem(url="attachment://present.txt")),
+            File(file=UnfurledMediaItem(url="attachment://missing.txt")),
+        ]
+    )
+
+    assert Preflight.get_violations(webhook) == [
+        "attachment://missing.txt does not reference an Attachment"
+    ]
+
+
+def test_preflight_component_total() -> None:
+    """
+    A test-case to validate that the Component limit is measured as the Component tree
+    is summarized.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK)
+
+    webhook.add_component(
+        Container(components=[TextDisplay(content=STRING_WORD) for _ in range(40)])
+    )
+
+    count: int = Component.summarize(webhook.components).count
+
+    assert Preflight.get_violations(webhook) == [
+        f"Message has {count:,} Components (maximum 40)"
+    ]
@@ -0,0 +1,68 @@
+from typing import Any
+
+import msgspec
+
+from clyde import (
+    Embed,
+    EmbedField,
+    Fragment,
+    PayloadNode,
+    PayloadProfile,
+    Profiler,
+    Webhook,
+)
+from clyde.components.container import Container
+from clyde.components.text_display import TextDisplay
+
+from .constants import (
+    STRING_LONG,
+    STRING_MEDIUM,
+    STRING_SHORT,
+    STRING_URL_WEBHOOK,
+    STRING_WORD,
+)
+
+
+def test_profiler_encode() -> None:
+    """
+    A test-case to validate that profiling a payload produces the same bytes as
+    encoding it directly.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK, content=STRING_SHORT)
+    embed: Embed = Embed(title=STRING_WORD, color=0xFFFFFF)
+
+    embed.add_field(EmbedField(name=STRING_WORD, value=STRING_LONG))
+    webhook.add_embed(embed)
+    webhook.add_embed(Fragment.freeze(Embed(description=STRING_MEDIUM)))
+    webhook.add_component(Container(components=[TextDisplay(content=STRING_LONG)]))
+
+    payload: dict[str, Any] = webhook._get_payload()
+    profile: PayloadProfile = PayloadProfile()
+
+    assert Profiler.encode(payload, profile) == msgspec.json.encode(payload)
+    assert profile.size == len(msgspec.json.encode(payload))
+    assert [node.path for node in profile.fields] == list(payload)
+
+
+def test_profiler_webhook() -> None:
+    """
+    A test-case to validate that the profile of a Webhook instance breaks down its
+    Embeds, Embed Fields, Components, and file Attachments.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK)
+    embed: Embed = Embed(title=STRING_WORD)
+
+    embed.add_field(EmbedField(name=STRING_WORD, value=STRING_LONG))
+    webhook.add_embed(embed)
+    webhook.add_component(Container(components=[TextDisplay(content=STRING_LONG)]))
+    webhook.add_attachment(STRING_WORD, STRING_LONG.encode())
+
+    profile: PayloadProfile = webhook.get_profile()
+    largest: list[PayloadNode] = profile.get_largest()
+    paths: list[str] = [node.path for node in largest]
+
+    assert "embeds[0].fields[0]" in paths
+    assert "components[0].components[0]" in paths
+    assert largest == sorted(largest, key=lambda node: node.size, reverse=True)
+    assert profile.attachments == {STRING_WORD: len(STRING_LONG)}
+    assert profile.get_total() == profile.size + len(STRING_LONG)
@@ -0,0 +1,37 @@
+from datetime import timedelta
+
+from niquests import Response
+
+from clyde import Result, Timing, Webhook
+
+from .constants import STRING_LONG, STRING_URL_WEBHOOK
+
+
+def test_result_wrap() -> None:
+    """
+    A test-case to validate that a Response is wrapped as a Result with its Timing
+    breakdown completed.
+    """
+    res: Response = Response()
+    res.status_code = 200
+    res.elapsed = timedelta(seconds=0.5)
+
+    result: Result = Result.wrap(res, Timing(build=0.1, encode=0.2, attempts=1))
+
+    assert isinstance(result, Response) and result.ok
+    assert result.timing.build == 0.1
+    assert result.timing.ttfb == 0.5
+    assert result.timing.total >= 0
+
+
+def test_result_execute() -> None:
+    """
+    A test-case to validate that executing a Webhook instance returns a Result with a
+    Timing breakdown.
+    """
+    res: Result = Webhook(url=STRING_URL_WEBHOOK, content=STRING_LONG).execute()
+
+    assert isinstance(res, Result) and res.ok
+    assert res.timing.attempts >= 1
+    assert res.timing.ttfb is not None
+    assert res.timing.total >= res.timing.sleep
@@ -0,0 +1,58 @@
+import logging
+
+from clyde import Suppressor
+
+from .constants import FLOAT_TIMESTAMP, STRING_SHORT
+
+
+def get_record(
+    msg: str, *args: object, created: float = FLOAT_TIMESTAMP
+) -> logging.LogRecord:
+    record: logging.LogRecord = logging.makeLogRecord(
+        {"name": "clyde.tests", "levelno": logging.ERROR, "msg": msg, "args": args}
+    )
+    record.created = created
+
+    return record
+
+
+def test_suppressor() -> None:
+    """
+    A test-case to validate that repeats of a log record within the window are counted
+    and summarized once the window ends.
+    """
+    suppressor: Suppressor = Suppressor(window=60.0)
+
+    assert len(suppressor.add(get_record("Failed request 0"))) == 1
+
+    for idx in range(1, 9875):
+        assert suppressor.add(get_record(f"Failed request {idx}")) == []
+
+    assert suppressor.is_pending()
+    assert suppressor.expire(FLOAT_TIMESTAMP + 30.0) == []
+
+    summaries: list[logging.LogRecord] = suppressor.expire(FLOAT_TIMESTAMP + 60.0)
+
+    assert len(summaries) == 1
+    assert summaries[0].getMessage() == "Failed request 0 ×9,874 in the last 60s"
+    assert not suppressor.is_pending()
+
+
+def test_suppressor_capacity() -> None:
+    """
+    A test-case to validate that the least recently seen log records are evicted and
+    summarized once the capacity is reached.
+    """
+    suppressor: Suppressor = Suppressor(capacity=2)
+
+    suppressor.add(get_record(STRING_SHORT))
+    suppressor.add(get_record(STRING_SHORT))
+    suppressor.add(get_record("Lorem"))
+
+    records: list[logging.LogRecord] = suppressor.add(get_record("Ipsum"))
+
+    assert [record.getMessage() for record in records] == [
+        "Ipsum",
+        f"{STRING_SHORT} ×1 in the last 60s",
+    ]
+    assert len(suppressor._repeats) == 2
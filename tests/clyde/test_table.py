@@ -0,0 +1,89 @@
+import pytest
+
+from clyde import Table
+
+from .constants import STRING_EXTRA_LONG, STRING_LIST_MEDIUM, STRING_WORD
+
+
+def test_table_render() -> None:
+    """
+    A test-case to validate the rendering of rows as an aligned table.
+    """
+    pages: list[str] = Table.render(
+        [{"Name": STRING_WORD, "Score": 1337}, {"Name": "A", "Score": 7}]
+    )
+
+    assert pages == ["```\nName  | Score\n------+------\nLorem | 1337\nA     | 7\n```"]
+
+
+def test_table_render_columnar() -> None:
+    """
+    A test-case to validate that columnar input renders the same as rows.
+    """
+    rows: list[list[object]] = [
+        [idx, entry] for idx, entry in enumerate(STRING_LIST_MEDIUM)
+    ]
+    columns: dict[str, list[object]] = {
+        "#": list(range(len(STRING_LIST_MEDIUM))),
+        "Word": list(STRING_LIST_MEDIUM),
+    }
+
+    assert Table.render(rows, ["#", "Word"]) == Table.render(columns)
+
+
+def test_table_render_paginate() -> None:
+    """
+    A test-case to validate that a long table is split into pages with a header.
+    """
+    pages: list[str] = Table.render({"Value": list(range(1000))}, highlight="py")
+
+    assert len(pages) > 1
+    assert all(len(page) <= 2000 for page in pages)
+    assert all(page.startswith("```py\nValue\n-----\n") for page in pages)
+
+
+def test_table_render_fields() -> None:
+    """
+    A test-case to validate that a table is split across Embed Fields.
+    """
+    fields = Table.render_fields(STRING_WORD, {"Value": list(range(1000))})
+
+    assert len(fields) > 1
+    assert all(len(field.value) <= 1024 for field in fields)
+
+
+def test_table_render_stream() -> None:
+    """
+    A test-case to validate that rows are consumed from an iterator in a single pass.
+    """
+    pages: list[str] = Table.render(({"Value": idx} for idx in range(1000)), limit=1024)
+
+    assert len(pages) > 1
+    assert all(len(page) <= 1024 for page in pages)
+    assert sum(page.count("\n") - 3 for page in pages) == 1000
+
+
+def test_table_render_invalid() -> None:
+    """
+    A test-case to validate that rows which would lose data are rejected.
+    """
+    with pytest.raises(ValueError):
+        Table.render([{"Value": STRING_EXTRA_LONG}])
+
+    with pytest.raises(ValueError):
+        Table.render({"#": [1, 2, 3], "Word": [STRING_WORD]})
+
+    with pytest.raises(ValueError):
+        Table.render([[1, 2, 3]], ["#", "Word"])
+
+    with pytest.raises(ValueError):
+        Table.render([[1, STRING_WORD], [2]], ["#", "Word"])
+
+
+def test_table_render_code_fence() -> None:
+    """
+    A test-case to validate that a code fence within a cell does not close the table.
+    """
+    page: str = Table.render([{"Value": f"```{STRING_WORD}```"}])[0]
+
+    assert page.count("```") == 2
@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import Self
+
+import pytest
+
+from clyde import Timestamp, TimestampStyles
+
+from .constants import FLOAT_TIMESTAMP, INT_TIMESTAMP, STRING_TIMESTAMP
+
+
+class EpochArray:
+    """A minimal array-like of epoch seconds, standing in for a NumPy array."""
+
+    def __init__(self: Self, values: list[float]) -> None:
+        self.values: list[float] = values
+
+    def astype(self: Self, dtype: str) -> "EpochArray":
+        return EpochArray([int(value) for value in self.values])
+
+    def tolist(self: Self) -> list[float]:
+        return self.values
+
+
+def test_timestamps() -> None:
+    """
+    A test-case to validate that batch formatting matches formatting each timestamp.
+    """
+    values: list[int | float | str | datetime] = [
+        INT_TIMESTAMP,
+        FLOAT_TIMESTAMP,
+        STRING_TIMESTAMP,
+        STRING_TIMESTAMP,
+        datetime.fromisoformat(STRING_TIMESTAMP),
+    ]
+
+    assert Timestamp.timestamps(values, TimestampStyles.RELATIVE_TIME) == [
+        Timestamp.relative_time(value) for value in values
+    ]
+
+
+def test_timestamps_array() -> None:
+    """
+    A test-case to validate the formatting of an array-like of epoch seconds.
+    """
+    assert Timestamp.timestamps(
+        EpochArray([INT_TIMESTAMP, FLOAT_TIMESTAMP]), TimestampStyles.SHORT_DATE
+    ) == [Timestamp.short_date(INT_TIMESTAMP), Timestamp.short_date(FLOAT_TIMESTAMP)]
+
+
+def test_timestamps_bool() -> None:
+    """
+    A test-case to validate that a bool is rejected rather than formatted.
+    """
+    with pytest.raises(TypeError):
+        Timestamp.timestamp(True, TimestampStyles.SHORT_DATE)
+
+    with pytest.raises(TypeError):
+        Timestamp.timestamps([INT_TIMESTAMP, False], TimestampStyles.SHORT_DATE)
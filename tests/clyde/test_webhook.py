@@ -1,18 +1,28 @@
+from email import message_from_bytes, policy
+from email.message import EmailMessage
 from pathlib import Path
 from time import sleep
+from typing import Any
 
+import msgspec
 import pytest
 from niquests import Response
 
 from clyde import (
+    UNSET,
     AllowedMentions,
     AllowedMentionTypes,
     Attachment,
     Markdown,
+    Poll,
+    PollAnswer,
+    PollMediaAnswer,
+    PollMediaQuestion,
     Timestamp,
     Webhook,
 )
-from clyde.webhook import MessageFlags
+from clyde.multipart import MultipartBody
+from clyde.webhook import SENT_MAX, MessageFlags
 
 from .constants import (
     FLOAT_TEST_DELAY,
@@ -32,6 +42,7 @@ from .constants import (
     STRING_URL_GITHUB,
     STRING_URL_ICON_1,
     STRING_URL_WEBHOOK,
+    STRING_WORD,
 )
 
 
@@ -133,6 +144,20 @@ def test_webhook_set_content_fallback() -> None:
     assert isinstance(res, Response) and res.ok
 
 
+def test_webhook_set_content_paginate() -> None:
+    """
+    A test-case to validate the successful use and execution of set_content with
+    the paginate argument set to True on a Webhook instance.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK)
+
+    webhook.set_content(STRING_EXTRA_LONG, paginate=True)
+
+    res: Response = webhook.execute()
+
+    assert isinstance(res, Response) and res.ok
+
+
 def test_webhook_set_username() -> None:
     """
     A test-case to validate the successful use and execution of set_username on
@@ -335,6 +360,25 @@ def test_webhook_add_attachment_path_multiple() -> None:
     assert isinstance(res, Response) and res.ok
 
 
+def test_webhook_add_attachment_path_lazy(tmp_path: Path) -> None:
+    """
+    A test-case to validate that a Path provided for an Attachment on a Webhook
+    instance is not read until the request is built.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK)
+    file_path: Path = tmp_path / STRING_WORD
+
+    file_path.write_bytes(STRING_SHORT.encode())
+    webhook.add_attachment(file_path.name, file_path)
+    file_path.write_bytes(STRING_LONG.encode())
+
+    req: dict[str, Any] = webhook._build_request()
+
+    assert webhook._attachments[0].content is UNSET
+    assert webhook._attachments[0].get_size() == len(STRING_LONG)
+    assert STRING_LONG.encode() in b"".join(req["data"])
+
+
 def test_webhook_set_wait() -> None:
     """
     A test-case to validate the successful use and execution of set_wait on a
@@ -465,3 +509,151 @@ def test_webhook_timestamp() -> None:
     res: Response = webhook.execute()
 
     assert isinstance(res, Response) and res.ok
+
+
+def test_webhook_edit_request() -> None:
+    """
+    A test-case to validate that an edit request only includes editable fields.
+    """
+    webhook: Webhook = Webhook(
+        url=STRING_URL_WEBHOOK, content=STRING_SHORT, username=STRING_SHORT
+    )
+
+    webhook.set_wait(True)
+    webhook.set_thread_id(STRING_ID_THREAD)
+    webhook.set_poll(
+        Poll(
+            question=PollMediaQuestion(text=STRING_SHORT),
+            answers=[PollAnswer(poll_media=PollMediaAnswer(text=STRING_WORD))],
+        )
+    )
+
+    req: dict[str, Any] = webhook._build_request(edit=True)
+
+    assert msgspec.json.decode(req["data"]) == {"content": STRING_SHORT}
+    assert req["params"] == {"thread_id": STRING_ID_THREAD}
+    assert webhook._get_message_url(STRING_ID_THREAD) == (
+        f"{STRING_URL_WEBHOOK}/messages/{STRING_ID_THREAD}"
+    )
+
+
+def test_webhook_edit() -> None:
+    """
+    A test-case to validate the successful edit, retrieval, and deletion of a message
+    sent by a Webhook instance.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK, content=STRING_SHORT)
+
+    webhook.set_wait(True)
+
+    message_id: str = webhook.execute().json()["id"]
+
+    webhook.set_content(STRING_LONG)
+
+    assert webhook.edit(message_id).ok
+    assert webhook.get_message(message_id).json()["content"] == STRING_LONG
+    assert webhook.delete_message(message_id).ok
+
+
+def test_webhook_edit_sent() -> None:
+    """
+    A test-case to validate that only the fields sent to the most recently edited
+    messages are retained.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK, content=STRING_SHORT)
+
+    for idx in range(SENT_MAX + 1):
+        webhook._set_sent(str(idx), {})
+
+    webhook._set_sent("1", {})
+
+    assert len(webhook._sent) == SENT_MAX
+    assert "0" not in webhook._sent
+    assert list(webhook._sent)[-1] == "1"
+
+
+def test_webhook_edit_request_delta() -> None:
+    """
+    A test-case to validate that a delta edit only includes the fields which changed.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK, content=STRING_SHORT)
+
+    webhook.add_attachment(STRING_WORD, STRING_WORD.encode())
+
+    req, sent = webhook._build_edit_request(STRING_ID_THREAD, delta=True)
+
+    assert req is not None and isinstance(req["data"], MultipartBody)
+
+    webhook._sent[STRING_ID_THREAD] = sent
+
+    assert webhook._build_edit_request(STRING_ID_THREAD, delta=True)[0] is None
+
+    webhook.set_content(STRING_LONG)
+
+    req, sent = webhook._build_edit_request(STRING_ID_THREAD, delta=True)
+
+    assert req is not None and not isinstance(req["data"], MultipartBody)
+    assert msgspec.json.decode(req["data"]) == {"content": STRING_LONG}
+
+
+def test_webhook_edit_request_attachments() -> None:
+    """
+    A test-case to validate that the files uploaded by an edit replace those of the
+    message, rather than being added alongside them.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK, content=STRING_SHORT)
+
+    webhook.add_attachment(STRING_WORD, STRING_WORD.encode())
+    webhook.add_attachment(STRING_EXTRA_SHORT, STRING_SHORT.encode())
+
+    req, _ = webhook._build_edit_request(STRING_ID_THREAD, delta=False)
+
+    assert req is not None and isinstance(req["data"], MultipartBody)
+
+    message: EmailMessage = message_from_bytes(
+        f"Content-Type: {req['headers']['Content-Type']}\r\n\r\n".encode()
+        + b"".join(req["data"]),
+        policy=policy.HTTP,
+    )
+    parts: list[EmailMessage] = list(message.iter_parts())
+
+    assert msgspec.json.decode(parts[0].get_payload(decode=True)) == {
+        "content": STRING_SHORT,
+        "attachments": [
+            {"id": 0, "filename": STRING_WORD},
+            {"id": 1, "filename": STRING_EXTRA_SHORT},
+        ],
+    }
+    assert [part.get_param("name", header="content-disposition") for part in parts] == [
+        "payload_json",
+        "files[0]",
+        "files[1]",
+    ]
+
+
+def test_webhook_edit_request_delta_attachments() -> None:
+    """
+    A test-case to validate that a delta edit which uploads files replaces those
+    previously uploaded.
+    """
+    webhook: Webhook = Webhook(url=STRING_URL_WEBHOOK, content=STRING_SHORT)
+
+    webhook.add_attachment(STRING_WORD, STRING_WORD.encode())
+
+    webhook._sent[STRING_ID_THREAD] = webhook._build_edit_request(
+        STRING_ID_THREAD, delta=True
+    )[1]
+    webhook._attachments = [Attachment(filename=STRING_WORD)]
+
+    req, _ = webhook._build_edit_request(STRING_ID_THREAD, delta=True)
+
+    assert req is not None and not isinstance(req["data"], MultipartBody)
+    assert msgspec.json.decode(req["data"]) == {"attachments": []}
+
+    webhook.remove_attachment(STRING_WORD)
+    webhook.add_attachment(STRING_WORD, STRING_SHORT.encode())
+
+    req, _ = webhook._build_edit_request(STRING_ID_THREAD, delta=True)
+
+    assert req is not None and isinstance(req["data"], MultipartBody)
+    assert b'"attachments":[{"id":0,"filename":"' in b"".join(req["data"])